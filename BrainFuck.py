@@ -1,516 +1,2929 @@
-#!/usr/bin/env python
-# -*- coding: utf-8 -*-
-## Python3
-
-import sys
-
-class OpToken(dict):
-    """Store token/opcode transration map
-    """
-    def __init__(self, optokendict={}):
-        if type(optokendict)!= dict:
-            raise TypeError('argument is not dict')
-        for k in optokendict:
-            v = optokendict[k]
-            optokendict[k] = [v] if type(v)!=list else v
-        super().__init__(optokendict)
-    def __setitem__(self, key, val):
-        dict.__setitem__(self, key, val if type(val)==list else [val])
-    def alltokens(self):
-        """output all token list
-        
-        Returns:
-            list: flat list of all tokens
-        """
-        return sum(self.values(), [])
-    def tokens(self):
-        """output 1st token of all opcodes
-        
-        Returns:
-            list: list of tokens
-        """
-        return [self[s][0] for s in self.opcodes()]
-    def opcodes(self):
-        """output opcode list
-        
-        Returns:
-            list: list of opcodes
-        """
-        return list(self.keys())
-    def opcode(self, token):
-        """output opcode by given token
-        
-        Args:
-            token (str): token
-
-        Returns:
-            str: opcode related with given token
-        """
-        for o in self.opcodes():
-            if token in self[o]:
-                return o
-        return None
-    def token(self, opcode, index=0):
-        """output token of given opcode
-        
-        Args:
-            opcode (str): opcode
-            index (int): index in token list related with given opcode. default is 0 (1st token).
-        
-        Returns:
-            str: token 
-        """
-        return self[opcode][index]
-    def token2opcode_dict(self):
-        """return dict as {token:opcode}
-        
-        Returns:
-            dict: transmap as dict as {token:opcode}, which return opcode by dict[token].
-        """
-        return dict([(t, self.opcode(t)) for t in self.alltokens()])
-    def opcode2token_dict(self): 
-        """return dict as {opcode:token}
-        
-        Returns:
-            dict: transmap as dict as {opcode:token}, which return token by dict[opcode]. (1st token only)
-        """
-        return dict(zip(self.opcodes(), self.tokens()))
-    def replace_tokens(self, tokens):
-        """replace tokens with given list
-        
-        Args:
-            tokens (list): tokens to be used for replacement
-        
-        Returns:
-            bool: True if replacement is finished successfully
-        """
-        if type(tokens)!=list:
-            raise TypeError('arg tokens is not list')
-        if len(self)!=len(tokens):
-            raise IndexError('index of given tokens is not matched')
-        return self.__init__(dict(zip(self.opcodes(), tokens)))
-
-class BrainFuck:
-    """BrainFuck class to generate BrainFuck interpreter and BrainFuck Variants
-    
-    Refer http://www.muppetlabs.com/~breadbox/bf/ for more detail of BrainFuck.
-    
-    Variables:
-        OPTOKEN_DICT (dict): default dictionary for OpToken class. 
-        ARRAY_SIZE (int): default data cell array size.
-        CELL_SIZE (int): default data cell size [bit].
-        DEM (str): default separator of src.
-        TOKENS (list): default token list to replace tokens in optoken.
-        BF_HELLO_WORLD_SRC (str): sample BrainFuck code to output "Hello World!".
-    
-    Attributes:
-        array_size (int): data cell array size.
-        cell_size (int): data cell size [bit]
-        delimiter (str): delimiter of src output.
-        optoken (OpToken): OpToken instance to translate token and opcode
-        wrap_cell (bool): True to allow wrapping in cell.
-        signed_cell (bool): True to allow signed cell data.
-        wrap_array (bool): True to allow wrapping in array.
-        infinite_array (bool): True to allow auto extend cell array to realize infinite cell array.
-        delimit_input (bool): True to use self.dem for lexical anaysys of src code
-        debug (bool): debug flag
-        ptr (int): data pointer
-        cur (int): instruction pointer
-        cell (list): data cell area
-        code (list): code area
-    """
-    OPTOKEN_DICT = dict(
-        nxt = '>',
-        prv = '<',
-        inc = '+',
-        dec = '-',
-        put = '.',
-        get = ',',
-        opn = '[',
-        cls = ']'
-    )
-    ARRAY_SIZE = 30000
-    CELL_SIZE = 8
-    DEM = ['']
-    TOKENS = None
-    BF_HELLO_WORLD_SRC = '>+++++++++[<++++++++>-]<.>+++++++[<++++>-]<+.+++++++..+++.[-]>++++++++[<++++>-]<.>+++++++++++[<+++++>-]<.>++++++++[<+++>-]<.+++.------.--------.[-]>++++++++[<++++>-]<+.[-]++++++++++.'
-
-    def __init__(self, optoken_dict=None, array_size=None, cell_size=None, delimiter=None, tokens=None, wrap_cell=False, signed_cell=False, wrap_array=False, infinite_array=False, delimit_input=False, debug=False):
-        """
-        Args: 
-            optoken_dict (dict): dict to generate optoken (OpToken).
-            array_size (int): data cell array size
-            cell_size (int): data cell size [bit]
-            delimiter (str): separator for src output
-            tokens (list): token list to replace tokens in optoken
-            wrap_cell (bool): True to allow wrapping in cell. (ex. if cell size = 8bit, and cell byte is set as 256, cell byte = 0)
-            signed_cell (bool): True to allow signed cell data.
-            wrap_array (bool): True to allow wrapping in array. self.cell[-1] => self.cell[len(self.cell)].
-            infinite_array (bool): True to allow auto extend cell array to realize infinite cell array (ex. for Turing Machine).
-            delimit_input (bool): True to use self.delimiter for lexical analysis of src code
-            debug (bool): True to output debug information
-        """
-        if optoken_dict:
-            self.optoken = OpToken(optoken_dict)
-        else:
-            self.optoken = OpToken(self.OPTOKEN_DICT)
-        self.array_size = array_size or self.ARRAY_SIZE
-        self.cell_size = cell_size or self.CELL_SIZE
-        if delimiter:
-            if type(delimiter)!=list and type(delimiter)==str:
-                self.delimiter = [delimiter]
-            else:
-                self.delimiter = delimiter
-        else:
-            self.delimiter = self.DEM
-        if tokens:
-            self.optoken.replace_tokens(tokens)
-        elif self.TOKENS:
-            self.optoken.replace_tokens(self.TOKENS)
-        self.wrap_cell = wrap_cell
-        self.signed_cell = signed_cell
-        self.wrap_array = wrap_array
-        self.infinite_array = infinite_array
-        self.delimit_input = delimit_input
-        self.debug = debug
-        if self.debug:
-            self.printparams()
-        if self.signed_cell:
-            self.cell_min = -1*2**self.cell_size/2
-            self.cell_max = 2**self.cell_size/2 - 1
-        else:
-            self.cell_min = 0
-            self.cell_max = 2**self.cell_size-1
-        self.initializer()
-
-    def outparams(self, oneline=False):
-        """output specification for debugging
-        """
-        indent = '' if oneline else ' '*4
-        sep = ', ' if oneline else '\n'
-        eq = '=' if oneline else ' = '
-        titleend = ' ' if oneline else '\n'
-        output = ''
-        # header
-        if oneline:
-            header = self.__class__.__name__+':'+titleend
-        else:
-            header = '***** Spec of "'+self.__class__.__name__+'" *****'+titleend
-        output += header
-        output += 'Array:'+titleend
-        output += indent+'size'+eq+str(self.array_size)+sep
-        output += indent+'Wrapping'+eq+('on' if self.wrap_array else 'off')+sep
-        output += indent+'Infinite'+eq+('on' if self.infinite_array else 'off')+sep
-        output += 'Cell:'+titleend
-        output += indent+'size'+eq+str(self.cell_size)+'bit'+sep
-        output += indent+'Wrapping'+eq+('on' if self.wrap_cell else 'off')+sep
-        output += indent+'Signed'+eq+('on' if self.signed_cell else 'off')+sep
-        output += 'Token/Opcode map:'+titleend
-        for t in self.optoken.alltokens():
-            output += indent+'\''+t+'\''+eq+self.optoken.opcode(t)+sep
-        if oneline:
-            output += ''
-        else:
-            output += '*' * (len(header))
-        return output
-
-    def printparams(self):
-        """print specification for debugging
-        """
-        print(self.outparams())
-        return True
-
-    def __str__(self):
-        return self.__repr__()
-
-    def __repr__(self):
-        return self.outparams(oneline=True)
-
-    def print_cell(self, start=None, end=None, num_column=30):
-        index_min = start or 0
-        index_max = end or self.array_size
-        num_column = (end>=num_column and num_column) or end
-        header = ' '*7 + ' '.join(['+{:02d}'.format(n) for n in range(num_column)])
-        print(header)
-        for i in range(index_max - index_min):
-            index = index_min + i
-            if i%num_column==0:
-                col = 1
-                print('{:6d}{:4d}'.format(index, self.cell[index]), end='')
-            elif i%num_column==num_column-1:
-                print('{:4d}'.format(self.cell[index]))
-            else:
-                col += 1
-                print('{:4d}'.format(self.cell[index]), end='')
-
-    def lexer(self, src):
-        """lexical analysis of src code and return tokens list
-        
-        Args:
-            src (str): source code
-            
-        Returns:
-            list: token list
-        """
-        ## delimit src by multiple delimiter
-        def _delimit(src, dem):
-            if type(src)==str: src = [src]
-            if len(dem)==1 and dem[0]=='': return src
-            if len(dem)==0: return src
-            d=dem.pop()
-            return _delimit([ss for s in src for ss in s.split(d)], dem)
-        ## core of lexer
-        def _lexer(src, tokenlist):
-            READ_AHEAD_BYTE = 32 # read ahead byte for debugging output
-            tokens = [] # output tokens list
-            cur = 0 # current position in src
-            ctoken = None # token candidate
-            while cur <= len(src)-1:
-                cstr = src[cur:]
-                start = len(cstr)
-                for token in tokenlist:
-                    index = cstr.find(token)
-                    if index>=0 and (index<start or (index==start and start+len(ctoken)<index+len(token))):
-                        ctoken = token
-                        start = index
-                if self.debug:
-                    print('LEXER: token = "{}", current pos = {}, # of tokens = {}, ahead src = "{}"'.format(ctoken, cur, len(tokens), cstr[start:READ_AHEAD_BYTE]))
-                if ctoken!=None:
-                    tokens.append(ctoken)
-                    cur += cstr.find(ctoken)+len(ctoken)
-                    ctoken = None
-                else:
-                    break
-            return tokens
-        ## main of lexer function
-        tokens = []
-        dsrc = [src]
-        if self.delimit_input:
-            dsrc = _delimit(src, self.delimiter)
-        for src in dsrc:
-            tokens += _lexer(src, self.optoken.alltokens())
-        return tokens
-
-    def translator(self, orig, reverse=False):
-        """translate each items in original list by self.optoken
-        To be used to translate from token to opcode by default. reverse option allow to translate opcode to token.
-        
-        Args:
-            orig (list): list of token or opcode.
-            reverse (bool): translate token to opcode if False, else translate opcode to token
-            
-        Returns:
-            list: translated result
-        """
-        if reverse:
-            trans_dict = self.optoken.opcode2token_dict()
-        else:
-            trans_dict = self.optoken.token2opcode_dict()
-        if self.debug:
-            for s in orig:
-                print('TRANSLATOR: {:8} => {}'.format('"'+s+'"', trans_dict[s]))
-        return [trans_dict[s] for s in orig]
-
-    def executer(self, opcodes=None):
-        """execute opcodes
-        
-        Call op_"opcode" function at each step. 
-        Call preproc function before execution, and call postproc function after to execute all steps. 
-        At each step, call stepproc function.
-        
-        Args:
-            opcodes (list): user specified opcode list. if user give opcode list, self.code will be replaced.
-        
-        Returns:
-            bool: Always return True
-        """
-        if opcodes!=None:
-            if type(opcodes)==list:
-                self.code = opcodes
-            else:
-                raise TypeError('given opcode is not list')
-        self.preproc()
-        while self.cur < len(self.code):
-            c = self.code[self.cur]
-            try:
-                eval('self.op_'+c+'()')
-            except NameError:
-                print('function for '+c+' ('+self.optoken[c]+') is not defined yet')
-                sys.exit()
-            if self.debug:
-                print('EXECUTER: opcode = {}, order = {}/{}, pointer = {}, memory = {}'.format(c, self.cur, len(self.code), self.ptr, self.cell[self.ptr]))
-            self.cur += 1
-            self.stepproc()
-        self.postproc()
-        return True
-
-    def initializer(self):
-        """initialize data pointer, instruction pointer, and data cell before running
-        """
-        self.ptr = 0 # data pointer
-        self.cur = 0 # instruction pointer
-        self.cell = [0 for i in range(self.array_size)] # data cell initialized 0
-        self.code = None # program area 
-        if self.debug:
-            print('INITIALIZER: instruction pointer = {}, data pointer = {}, 1st memory cell = {}, 2nd memory cell = {}'.format(self.cur, self,ptr, self.cell[self.ptr], self.cell[self.ptr+1]))
-        return True
-
-    def preproc(self):
-        """pre-processing"""
-        return True
-
-    def stepproc(self):
-        """process at each step"""
-        return True
-
-    def postproc(self):
-        """post-processing"""
-        return True
-
-    def op_nxt(self):
-        """increment pointer (++ptr)"""
-        self.ptr += 1
-        if self.ptr>=self.array_size-1:
-            if self.infinite_array:
-                self.cell.append(0)
-            elif self.wrap_array: 
-                self.ptr = 0
-            else:
-                raise IndexError('cell pointer is indicated as '+str(self.ptr)+' over array size ('+str(self.ARRAY_SIZE)+')')
-        return True
-
-    def op_prv(self):
-        """decrement pointer (--ptr)"""
-        self.ptr -= 1
-        if self.ptr<0:
-            if self.infinite_array:
-                self.cell.append(0)
-            elif self.wrap_array: 
-                pass
-            else:
-                raise IndexError('cell pointer is indicated as '+str(self.ptr)+' under 0')
-        return True
-
-    def op_inc(self):
-        """increment the byte at pointer (++*ptr)"""
-        self.cell[self.ptr] += 1
-        if self.cell[self.ptr]>self.cell_max:
-            if self.wrap_cell:
-                self.cell[self.ptr] = self.cell_min
-            else:
-                raise ValueError('Byte at cell pointer is set as '+str(self.cell[self.ptr])+' over maximum value='+str(self.cell_max))
-        return True
-
-    def op_dec(self):
-        """decrement the byte at pointer (--*ptr)"""
-        self.cell[self.ptr] -= 1
-        if self.cell[self.ptr]<self.cell_min:
-            if self.wrap_cell:
-                self.cell[self.ptr] = self.cell_max
-            else:
-                raise ValueError('Byte at cell pointer is set as '+str(self.cell[self.ptr])+' under minimum value='+str(self.cell_min))
-        return True
-
-    def op_put(self):
-        """output the byte at the pointer (putchar(*ptr))
-        if the byte is not valid to output as str, output byte instead of.
-        """
-        import math
-        try:
-            sys.stdout.write(chr(self.cell[self.ptr]))
-        except UnicodeEncodeError:
-            b = math.ceil(self.cell[self.ptr].bit_length()/8)
-            sys.stdout.write(str(self.cell[self.ptr].to_bytes(b,'big'))+' ')
-        return True
-
-    def op_get(self):
-        """input a byte and store it in the byte at the pointer (*ptr = getchar())"""
-        self.cell[self.ptr] = ord(input("Enter>")[0])
-        return True
-
-    def op_opn(self):
-        """jump forward past the matching ] if the byte at the pointer is zero (which (*ptr) {)"""
-        if self.cell[self.ptr] != 0:
-            return False
-        level = 1
-        while self.code[self.cur]!='cls' or level!=0:
-            if self.cur <= len(self.code): self.cur += 1
-            if self.code[self.cur]=='opn': level += 1
-            if self.code[self.cur]=='cls': level -= 1
-        return True
-
-    def op_cls(self):
-        """jump backward to the matching [ unless the byte at the pointer is zero (})"""
-        if self.cell[self.ptr] == 0:
-            return False
-        level = 1
-        while self.code[self.cur]!='opn' or level!=0:
-            if self.cur >= 0: self.cur -= 1
-            if self.code[self.cur]=='opn': level -= 1
-            if self.code[self.cur]=='cls': level += 1
-        return True
-
-    def run(self, src): 
-        """run src code
-        
-        Args:
-            src (str): source code
-            
-        Returns:
-            bool: return code of executor()
-        """
-        self.initializer()
-        tokens = self.lexer(src)
-        opcodes = self.translator(tokens)
-        return self.executer(opcodes)
-
-    def opcodes(self, src):
-        """output opcodes list from src
-        
-        Args:
-            src (str): source code
-
-        Returns:
-            list: opcode list
-        """
-        return self.translator(self.lexer(src))
-
-    def src(self, opcodes):
-        """output src from opcodes list
-        
-        Args:
-            list: opcode list
-
-        Returns:
-            src (str): source code
-        """
-        return self.delimiter[0].join(self.translator(opcodes, reverse=True))
-
-    def test(self, src):
-        """output token list, opcode list and reuslt
-        """
-        print('Test '+self.__class__.__name__+' class:')
-        print('  * src: ', str(src))
-        tokens = self.lexer(src)
-        print('  * token: ', tokens)
-        opcodes = self.translator(tokens)
-        print('  * opcode: ', opcodes)
-        print('  * output: ')
-        self.executer(opcodes)
-        return True
-
-if __name__ == '__main__':
-    ## test 
-    b=BrainFuck()
-    print(b)
-    b.printparams()
-    print(b.opcodes('>>>sample<<<'))
-    b.test(b.BF_HELLO_WORLD_SRC)
-    b.print_cell(end=10)
-    print('')
-
-    ## simple instance creation sample 
-    ## Kapibara-san language instance
-    print('Kapibara-san variant:')
-    k=BrainFuck(tokens=['のすのす','もでーん','キュルッ！','もふっ！', 'むぎゅっと','グッ！！','ぬっくし','うっとり'], delimiter=' ')
-    k.test(k.src(b.opcodes(b.BF_HELLO_WORLD_SRC)))
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+## Python3
+
+import io
+import os
+import re
+import sys
+import copy
+import time
+import atexit
+import array
+import mmap
+import bisect
+import pickle
+import tempfile
+import queue
+import threading
+import collections
+import functools
+import concurrent.futures
+
+class OpToken(dict):
+    """Store token/opcode transration map
+
+    Lookup tables (flat token list, inverse maps and lexer pattern) are built on first use and kept until the map is modified.
+    Frozen map (see freeze()) is shared by all instances of a dialect, so that it can't be modified. Use copy() to customize it.
+    """
+    __slots__ = ('frozen', '_tables')
+    def __init__(self, optokendict={}):
+        if not isinstance(optokendict, dict):
+            raise TypeError('argument is not dict')
+        self.frozen = False
+        self._tables = None
+        super().__init__((k, list(v) if type(v)==list else [v]) for k, v in optokendict.items())
+    def __reduce__(self):
+        return (OpToken._rebuild, (dict(self), self.frozen))
+    @staticmethod
+    def _rebuild(optokendict, frozen):
+        optoken = OpToken(optokendict)
+        return optoken.freeze() if frozen else optoken
+    def _modify(self):
+        """check if the map can be modified and discard lookup tables"""
+        if getattr(self, 'frozen', False):
+            raise TypeError('OpToken is frozen (use copy() to modify it)')
+        self._tables = None
+    def __setitem__(self, key, val):
+        self._modify()
+        dict.__setitem__(self, key, list(val) if type(val)==list else [val])
+    def __delitem__(self, key):
+        self._modify()
+        dict.__delitem__(self, key)
+    def update(self, *args, **kwargs):
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+    def copy(self):
+        """return modifiable copy
+
+        Returns:
+            OpToken: copy of the map which is not frozen
+        """
+        return OpToken(self)
+    def freeze(self):
+        """build lookup tables and forbid modification
+
+        Returns:
+            OpToken: this map
+        """
+        self.tables()
+        self.frozen = True
+        return self
+    def tables(self):
+        """return lookup tables built from the map
+
+        Returns:
+            dict: 'alltokens' (tuple of all tokens), 'token2opcode' (dict), 'opcode2token' (dict),
+                'opcode2number' (dict of opcode number in order of opcodes()),
+                'pattern' (compiled regular expression which matches the earliest and the longest token) and
+                'translation' (lookup table of bytes.translate(), see translation())
+        """
+        if self._tables is None:
+            alltokens = tuple(t for v in self.values() for t in v)
+            token2opcode = {}
+            for o in self.keys():
+                for t in self[o]:
+                    token2opcode.setdefault(t, o)
+            ## alternatives are tried from the longest one at the earliest position
+            tokens = sorted(set(t for t in alltokens if t), key=len, reverse=True)
+            self._tables = dict(
+                alltokens = alltokens,
+                token2opcode = token2opcode,
+                opcode2token = dict((o, self[o][0]) for o in self.keys()),
+                opcode2number = dict((o, i) for i, o in enumerate(self.keys())),
+                pattern = re.compile('|'.join(re.escape(t) for t in tokens)) if tokens else None,
+                translation = None,
+            )
+            if tokens and len(self)<=256 and all(len(t)==1 and ord(t)<128 for t in tokens):
+                numbers = self._tables['opcode2number']
+                table = bytearray(256)
+                for t in tokens:
+                    table[ord(t)] = numbers[token2opcode[t]]
+                delete = bytes(b for b in range(256) if chr(b) not in token2opcode)
+                self._tables['translation'] = (bytes(table), delete)
+        return self._tables
+    def alltokens(self):
+        """output all token list
+        
+        Returns:
+            list: flat list of all tokens
+        """
+        return list(self.tables()['alltokens'])
+    def tokens(self):
+        """output 1st token of all opcodes
+        
+        Returns:
+            list: list of tokens
+        """
+        return list(self.tables()['opcode2token'].values())
+    def opcodes(self):
+        """output opcode list
+        
+        Returns:
+            list: list of opcodes
+        """
+        return list(self.keys())
+    def numbers(self):
+        """return dict as {opcode:number}
+        opcode is numbered by its index in opcodes(), which is used in Bytecode.
+
+        Returns:
+            dict: opcode number by opcode
+        """
+        return self.tables()['opcode2number']
+    def opcode(self, token):
+        """output opcode by given token
+        
+        Args:
+            token (str): token
+
+        Returns:
+            str: opcode related with given token
+        """
+        return self.tables()['token2opcode'].get(token)
+    def token(self, opcode, index=0):
+        """output token of given opcode
+        
+        Args:
+            opcode (str): opcode
+            index (int): index in token list related with given opcode. default is 0 (1st token).
+        
+        Returns:
+            str: token 
+        """
+        return self[opcode][index]
+    def token2opcode_dict(self):
+        """return dict as {token:opcode}
+        
+        Returns:
+            dict: transmap as dict as {token:opcode}, which return opcode by dict[token].
+        """
+        return dict(self.tables()['token2opcode'])
+    def opcode2token_dict(self): 
+        """return dict as {opcode:token}
+        
+        Returns:
+            dict: transmap as dict as {opcode:token}, which return token by dict[opcode]. (1st token only)
+        """
+        return dict(self.tables()['opcode2token'])
+    def translation(self):
+        """return lookup table to translate src code encoded in UTF-8 into opcode numbers by bytes.translate()
+        Bytes of non-token characters are dropped, and each token byte is mapped to its opcode number (see numbers()).
+        Available only if all tokens are single ASCII characters, which never appear in encoded non-ASCII character.
+
+        Returns:
+            tuple: (256 bytes table, bytes to delete) to be given to bytes.translate(). None if a token is not single ASCII character.
+        """
+        return self.tables()['translation']
+    def pattern(self):
+        """return compiled regular expression to find tokens
+
+        Returns:
+            re.Pattern: pattern which matches the earliest token (the longest one if tokens start at same position). None if no token.
+        """
+        return self.tables()['pattern']
+    def replace_tokens(self, tokens):
+        """replace tokens with given list
+        
+        Args:
+            tokens (list): tokens to be used for replacement
+        
+        Returns:
+            bool: True if replacement is finished successfully
+        """
+        if type(tokens)!=list:
+            raise TypeError('arg tokens is not list')
+        if len(self)!=len(tokens):
+            raise IndexError('index of given tokens is not matched')
+        self._modify()
+        replaced = dict(zip(self.opcodes(), tokens))
+        dict.clear(self)
+        for k, v in replaced.items():
+            dict.__setitem__(self, k, list(v) if type(v)==list else [v])
+        return True
+
+class Program:
+    """Store compiled program for BrainFuck.compiled_executer()
+
+    Compiled instructions are stored at the same index as the opcode they start from,
+    so that instruction pointer (cur) keeps pointing to position in code.
+
+    Instructions:
+        ('blk', size, seq, lo, hi, ranges, shift, adds): straight-line block of opcodes in BrainFuck.MICRO_OPS,
+            addressed relative to the pointer at the entry of the block.
+            seq is list of (offset, n) to add n to each cell if adds is True,
+            otherwise list of micro-ops (kind, offset, operand) in order (see BrainFuck.MICRO_OPS),
+            lo/hi are minimum/maximum pointer offset reached in the block,
+            ranges is list of (offset, min, max) of accumulated delta of each cell from its value at the entry,
+            shift is net pointer move of the block.
+        ('opn', index): jump to index of matching cls if the byte at pointer is zero
+        ('scn', stride, index): scan loop to move pointer by stride until the byte at pointer is zero, then jump to index of matching cls
+        ('cls', index): jump to index of matching opn unless the byte at pointer is zero
+        ('mem', index, lo, hi): opn of loop whose body is only blocks and such loops with no net pointer move, so that its effect
+            is a function of cells from offset lo to hi (see BrainFuck.LOOP_MEMO_SIZE). index is index of matching cls.
+        ('op', opcode): call op_"opcode" function
+        ('trap', program, index, breakpoint, reach): run one instruction of program (same program without trap) with
+            breakpoint and watchpoints (see BrainFuck.set_breakpoint() and BrainFuck.set_watchpoint()).
+            index is index of the opcode in original code, breakpoint is callback of breakpoint called before the instruction (or None),
+            and reach is (lo, hi) pointer offset of cells which the instruction may write, True for any cell, or None for no cell.
+
+    Attributes:
+        code (list): opcode list
+        ops (list): compiled instruction at each index of code
+        blocks (int): number of compiled blocks
+        residual (Residual): result of partial evaluation of input independent prefix
+        origin (list): index in original opcode list of each opcode in code. None if code is not simplified.
+        removed (int): number of opcodes removed by BrainFuck.simplifier()
+        config (tuple): configuration of the interpreter which compiled the program (see BrainFuck.config_key())
+        memo (OrderedDict): LRU cache of effect of mem loops as {(index, cells in window): (cells in window, steps, lwm, hwm)}
+        memo_stats (dict): [hits, misses] of memo for each mem loop by index
+        memo_config (tuple): configuration of the interpreter which filled memo (see BrainFuck.config_key())
+        tables (dict): tables built by dialect for the code at compile, reused by each run (ex. blob_at of Tettette)
+    """
+    def __init__(self, code, ops, blocks=0):
+        self.code = code
+        self.ops = ops
+        self.blocks = blocks
+        self.residual = None
+        self.origin = None
+        self.removed = 0
+        self.config = None
+        self.memo = collections.OrderedDict()
+        self.memo_stats = {}
+        self.memo_config = None
+        self.tables = {}
+    def __len__(self):
+        return len(self.code)
+
+class Bytecode:
+    """Store opcode list as compact integer bytecode
+
+    Each opcode is stored as its number in the dialect (see OpToken.numbers()) in one byte (two bytes if dialect has
+    more than 256 opcodes), and index of matching cls/opn of each opn/cls is stored as operand,
+    so that executer() dispatches integers and jumps without searching the matching bracket.
+    compiler() accepts bytecode too, but decodes it into opcode list, since Program is compiled from opcode list.
+
+    Attributes:
+        names (tuple): opcode of each number. opcodes not in the dialect are numbered after the ones of the dialect.
+        code (array): opcode number at each index
+        jumps (array): index of matching cls of opn and matching opn of cls. -1 for other opcodes and unmatched opn/cls.
+    """
+    def __init__(self, opcodes, names, numbers=None):
+        names = list(names)
+        numbers = dict(numbers) if numbers else dict((o, i) for i, o in enumerate(names))
+        for c in opcodes:
+            if c not in numbers:
+                numbers[c] = len(names)
+                names.append(c)
+        self.names = tuple(names)
+        self.code = array.array('B' if len(names)<=256 else 'H', [numbers[c] for c in opcodes])
+        self.jumps = array.array('i', [-1])*len(opcodes)
+        if 'opn' in numbers and 'cls' in numbers:
+            opn = numbers['opn']
+            cls = numbers['cls']
+            stack = []
+            for i, n in enumerate(self.code):
+                if n==opn:
+                    stack.append(i)
+                elif n==cls and stack:
+                    j = stack.pop()
+                    self.jumps[i] = j
+                    self.jumps[j] = i
+    def __len__(self):
+        return len(self.code)
+    @staticmethod
+    def from_numbers(code, names):
+        """build bytecode from opcode numbers without opcode list
+        Matching brackets are searched over opn/cls only, so that no Python object is made for other opcodes.
+
+        Args:
+            code (bytes): opcode number at each index
+            names (list): opcode of each number (256 opcodes at most)
+
+        Returns:
+            Bytecode: bytecode
+        """
+        self = Bytecode.__new__(Bytecode)
+        self.names = tuple(names)
+        self.code = array.array('B', code)
+        self.jumps = array.array('i', [-1])*len(code)
+        if 'opn' in self.names and 'cls' in self.names:
+            opn = self.names.index('opn')
+            stack = []
+            for m in re.finditer(b'[' + re.escape(bytes([opn, self.names.index('cls')])) + b']', code):
+                i = m.start()
+                if code[i]==opn:
+                    stack.append(i)
+                elif stack:
+                    j = stack.pop()
+                    self.jumps[i] = j
+                    self.jumps[j] = i
+        return self
+    def decode(self):
+        """return opcode list
+
+        Returns:
+            list: opcode list
+        """
+        names = self.names
+        return [names[n] for n in self.code]
+
+class Residual:
+    """Store result of BrainFuck.partial_evaluator()
+
+    Attributes:
+        program (Program): program to be run after evaluated prefix (code may be rewritten by preproc)
+        output (str): constant output of evaluated prefix
+        cell (list): data cell after evaluated prefix (trailing zeros not written by preproc are removed)
+        size (int): length of data cell after evaluated prefix
+        ptr (int): data pointer after evaluated prefix
+        cur (int): instruction pointer after evaluated prefix
+        steps (int): number of evaluated instructions
+    """
+    def __init__(self, program, output, cell, size, ptr, cur, steps):
+        self.program = program
+        self.output = output
+        self.cell = cell
+        self.size = size
+        self.ptr = ptr
+        self.cur = cur
+        self.steps = steps
+
+def lex_pieces(lexer, pieces):
+    """run lexer.lex_chunk() for each (chunk, final) in pieces (worker of BrainFuck.lexer())
+
+    Args:
+        lexer (BrainFuck): instance to analyze src code
+        pieces (list): list of (chunk, final)
+
+    Returns:
+        list: list of results of lex_chunk()
+    """
+    return [lexer.lex_chunk(src, final) for src, final in pieces]
+
+def shutdown_lex_pools():
+    """shut down process pools of BrainFuck.lexer()
+    Called at exit, and before os.fork() not to fork the process with threads of the pools.
+
+    Returns:
+        bool: True if any pool is shut down
+    """
+    pools = list(BrainFuck.LEX_POOLS.values())
+    BrainFuck.LEX_POOLS.clear()
+    for pool in pools:
+        pool.shutdown()
+    return bool(pools)
+
+atexit.register(shutdown_lex_pools)
+
+class Metrics:
+    """Registry of runtime metrics of BrainFuck interpreters
+
+    Counters and histograms are stored by metric name and labels, and updated once per run (not per instruction).
+    Metrics can be exported in Prometheus text exposition format by export(), or as dict by as_dict().
+
+    Variables:
+        PREFIX (str): prefix of metric names on export
+        BUCKETS (tuple): default upper bounds of histogram buckets [sec]
+        HELP (dict): description of each metric name
+
+    Attributes:
+        prefix (str): prefix of metric names on export
+        buckets (tuple): upper bounds of histogram buckets
+        counters (dict): value by (name, labels)
+        histograms (dict): [bucket counts, sum, count] by (name, labels)
+    """
+    PREFIX = 'brainfuck_'
+    BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+    HELP = dict(
+        runs_total = 'Number of programs run.',
+        steps_total = 'Number of executed instructions.',
+        output_bytes_total = 'Number of output bytes.',
+        cache_hits_total = 'Number of compiled programs found in program cache.',
+        cache_misses_total = 'Number of programs compiled on program cache miss.',
+        uncached_compiles_total = 'Number of programs compiled without program cache.',
+        limit_violations_total = 'Number of runs stopped by array or cell limit.',
+        removed_opcodes_total = 'Number of opcodes removed by simplifier.',
+        lex_seconds = 'Time of lexical analysis and translation.',
+        compile_seconds = 'Time of compilation.',
+        exec_seconds = 'Time of execution.'
+    )
+
+    def __init__(self, prefix=None, buckets=None):
+        """
+        Args:
+            prefix (str): prefix of metric names on export. default is PREFIX.
+            buckets (list): upper bounds of histogram buckets. default is BUCKETS.
+        """
+        self.prefix = self.PREFIX if prefix is None else prefix
+        self.buckets = tuple(sorted(buckets or self.BUCKETS))
+        self.reset()
+
+    def reset(self):
+        """clear all metrics"""
+        self.counters = {}
+        self.histograms = {}
+        return True
+
+    def inc(self, name, value=1, **labels):
+        """add value to counter
+
+        Args:
+            name (str): metric name
+            value (int or float): value to be added
+            labels: label names and values
+        """
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + value
+        return True
+
+    def observe(self, name, value, **labels):
+        """add observed value to histogram
+
+        Args:
+            name (str): metric name
+            value (int or float): observed value
+            labels: label names and values
+        """
+        key = (name, tuple(sorted(labels.items())))
+        if key not in self.histograms:
+            self.histograms[key] = [[0]*len(self.buckets), 0, 0]
+        h = self.histograms[key]
+        for i, bound in enumerate(self.buckets):
+            if value<=bound:
+                h[0][i] += 1
+        h[1] += value
+        h[2] += 1
+        return True
+
+    def as_dict(self):
+        """output metrics as dict
+
+        Returns:
+            dict: list of {'labels': dict, 'value': value} by metric name.
+                value of histogram is dict of 'buckets' (count by upper bound), 'sum' and 'count'.
+        """
+        out = {}
+        for (name, labels), value in sorted(self.counters.items()):
+            out.setdefault(name, []).append({'labels': dict(labels), 'value': value})
+        for (name, labels), (counts, total, count) in sorted(self.histograms.items()):
+            buckets = dict(zip(self.buckets, counts))
+            out.setdefault(name, []).append({'labels': dict(labels), 'value': {'buckets': buckets, 'sum': total, 'count': count}})
+        return out
+
+    def export(self):
+        """output metrics in Prometheus text exposition format
+
+        Returns:
+            str: metrics text
+        """
+        def _labels(labels, extra=()):
+            items = list(labels)+list(extra)
+            if not items:
+                return ''
+            return '{'+','.join('{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')) for k, v in items)+'}'
+        lines = []
+        for kind, table in (('counter', self.counters), ('histogram', self.histograms)):
+            names = sorted(set(name for name, labels in table))
+            for name in names:
+                metric = self.prefix+name
+                if name in self.HELP:
+                    lines.append('# HELP {} {}'.format(metric, self.HELP[name]))
+                lines.append('# TYPE {} {}'.format(metric, kind))
+                for (n, labels), value in sorted(table.items()):
+                    if n!=name:
+                        continue
+                    if kind=='counter':
+                        lines.append('{}{} {}'.format(metric, _labels(labels), value))
+                        continue
+                    counts, total, count = value
+                    for bound, c in zip(self.buckets, counts):
+                        lines.append('{}_bucket{} {}'.format(metric, _labels(labels, [('le', repr(float(bound)))]), c))
+                    lines.append('{}_bucket{} {}'.format(metric, _labels(labels, [('le', '+Inf')]), count))
+                    lines.append('{}_sum{} {}'.format(metric, _labels(labels), total))
+                    lines.append('{}_count{} {}'.format(metric, _labels(labels), count))
+        return '\n'.join(lines)+'\n' if lines else ''
+
+class OutputCounter:
+    """Wrap output stream to count output bytes (encoded in UTF-8)
+    ASCII output is counted by its length without encoding.
+
+    Attributes:
+        stream (file): wrapped stream
+        bytes (int): number of written bytes
+    """
+    def __init__(self, stream):
+        self.stream = stream
+        self.bytes = 0
+    def write(self, s):
+        if type(s)!=str:
+            self.bytes += len(s)
+        elif s.isascii():
+            self.bytes += len(s)
+        else:
+            self.bytes += len(s.encode('utf-8', 'replace'))
+        return self.stream.write(s)
+    def flush(self):
+        return self.stream.flush()
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+class OutputChannel:
+    """Output stream to hand output chunks to consumer of BrainFuck.iter_output() one by one
+
+    Writer waits until consumer requests the next chunk, so that run doesn't go ahead of consumer,
+    and stops by OutputChannel.Closed when consumer doesn't request any more.
+
+    Attributes:
+        chunk_size (int): min length of chunk. output is handed at each write if 1.
+        chunks (Queue): ('data', chunk), ('error', exception) or ('end', None) to consumer
+        requests (Queue): True to request the next chunk, False to stop
+        buffer (list): output not handed yet
+        buffered (int): length of output in buffer
+    """
+    class Closed(BaseException):
+        """raised in writer when consumer stops"""
+        pass
+
+    def __init__(self, chunk_size=1):
+        self.chunk_size = max(chunk_size, 1)
+        self.chunks = queue.Queue()
+        self.requests = queue.Queue()
+        self.buffer = []
+        self.buffered = 0
+    def write(self, s):
+        self.buffer.append(s)
+        self.buffered += len(s)
+        if self.buffered>=self.chunk_size:
+            self.flush()
+        return len(s)
+    def flush(self):
+        if self.buffer:
+            chunk = ''.join(self.buffer)
+            self.buffer = []
+            self.buffered = 0
+            self.chunks.put(('data', chunk))
+            if not self.requests.get():
+                raise OutputChannel.Closed()
+        return True
+
+class TapePool:
+    """Bounded pool of data cell buffers reused across runs
+
+    Buffers are kept for each array size. Only dirty range of returned buffer (cells which the run may have written,
+    see BrainFuck.hwm and BrainFuck.lwm) is zeroed in place, so that runs don't pay for allocation and zeroing of whole data cell.
+    Pool can be shared by threads.
+
+    Attributes:
+        size (int): max number of buffers kept for each array size. 0 to disable pooling.
+        buffers (dict): list of zeroed buffers by array size
+        lock (Lock): lock of buffers
+    """
+    def __init__(self, size):
+        """
+        Args:
+            size (int): max number of buffers kept for each array size
+        """
+        self.size = size
+        self.buffers = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def zeros(size, typecode=None):
+        """return zeroed buffer
+
+        Args:
+            size (int): number of cells
+            typecode (str): typecode of array.array. None for list.
+
+        Returns:
+            list or array.array: zeroed buffer
+        """
+        if typecode==None:
+            return [0]*size
+        return array.array(typecode, bytes(size*array.array(typecode).itemsize))
+
+    def acquire(self, array_size, typecode=None):
+        """take zeroed buffer from the pool
+
+        Args:
+            array_size (int): number of cells
+            typecode (str): typecode of array.array. None for list.
+
+        Returns:
+            list or array.array: zeroed buffer. newly allocated if the pool is empty.
+        """
+        with self.lock:
+            pool = self.buffers.get((array_size, typecode))
+            if pool:
+                return pool.pop()
+        return self.zeros(array_size, typecode)
+
+    def release(self, cell, array_size, dirty=None):
+        """zero dirty range of buffer and return it to the pool
+
+        Args:
+            cell (list or array.array): buffer to be returned
+            array_size (int): number of cells of the buffer (cells extended over array_size are removed)
+            dirty (tuple): (min, max) index of cells which may be nonzero (negative index counts from the end of buffer).
+                None to zero whole of buffer.
+
+        Returns:
+            bool: True if buffer is returned to the pool, False if the pool is full or buffer can't be reused
+        """
+        typecode = getattr(cell, 'typecode', None)
+        if type(cell) not in (list, array.array) or len(cell)<array_size:
+            return False
+        with self.lock:
+            if len(self.buffers.get((array_size, typecode), ()))>=self.size:
+                return False
+        try:
+            del cell[array_size:]
+        except BufferError: # array is exported by memoryview
+            return False
+        lo, hi = (0, array_size-1) if dirty is None else dirty
+        if lo<0: # pointer wrapped to the end of data cell
+            cell[lo:] = self.zeros(min(-lo, array_size), typecode)
+            lo = 0
+        hi = min(hi, array_size-1)
+        if lo<=hi:
+            cell[lo:hi+1] = self.zeros(hi+1-lo, typecode)
+        with self.lock:
+            pool = self.buffers.setdefault((array_size, typecode), [])
+            if len(pool)>=self.size:
+                return False
+            pool.append(cell)
+        return True
+
+class ForkInput:
+    """Input data of BrainFuck.run_forked() to fork the process at the first read of input
+
+    At the first getchar(), the process is forked for each input. Children share pages of the parent copy-on-write,
+    so that the state of the run (data cell, pointers, variant state such as stack, and output until the point)
+    is not copied unless it is modified. Each child continues the run with its input and sends the result through pipe.
+    The parent waits for all children, and stops its own run by ForkInput.Joined.
+
+    Attributes:
+        inputs (list): input data of each child
+        workers (int): max number of children running at once
+        results (list): (output, error) of each input, filled in the parent
+        child (int): index of input in child process. None in the parent.
+        pipe (int): file descriptor to send the result in child process
+    """
+    class Joined(BaseException):
+        """raised in the parent when all children are finished"""
+        pass
+
+    def __init__(self, inputs, workers):
+        """
+        Args:
+            inputs (list): input data (bytes or str) of each child
+            workers (int): max number of children running at once
+        """
+        self.inputs = inputs
+        self.workers = max(workers, 1)
+        self.results = [None]*len(inputs)
+        self.child = None
+        self.pipe = None
+
+    def branch(self):
+        """fork the process for each input
+
+        Returns:
+            bytes or str: input data of the child (only in child process)
+
+        Raises:
+            ForkInput.Joined: all children are finished (in the parent)
+        """
+        running = collections.OrderedDict() # (index of input, read end of pipe) by pid
+        for i, data in enumerate(self.inputs):
+            while len(running)>=self.workers:
+                self._join(running)
+            shutdown_lex_pools()
+            r, w = os.pipe()
+            pid = os.fork()
+            if pid==0:
+                os.close(r)
+                for _, fd in running.values():
+                    os.close(fd)
+                self.child = i
+                self.pipe = w
+                return data
+            os.close(w)
+            running[pid] = (i, r)
+        while running:
+            self._join(running)
+        raise ForkInput.Joined()
+
+    def _join(self, running):
+        """receive the result of the oldest child"""
+        pid, (i, r) = running.popitem(last=False)
+        with os.fdopen(r, 'rb') as f:
+            data = f.read()
+        _, status = os.waitpid(pid, 0)
+        if data:
+            self.results[i] = pickle.loads(data)
+        else:
+            self.results[i] = ('', ChildProcessError('child process exited without result (status '+str(status)+')'))
+        return True
+
+    def send(self, output, error):
+        """send the result to the parent and exit child process"""
+        try:
+            try:
+                data = pickle.dumps((output, error))
+            except Exception: # exception which can't be pickled
+                data = pickle.dumps((output, RuntimeError(repr(error))))
+            with os.fdopen(self.pipe, 'wb') as f:
+                f.write(data)
+        finally:
+            os._exit(0)
+
+class ArrayLimitError(IndexError):
+    """raised when data pointer goes out of data cell array which neither wraps nor extends"""
+    pass
+
+class CellLimitError(ValueError):
+    """raised when the byte at pointer goes out of cell range which doesn't wrap"""
+    pass
+
+class InputBuffer(list):
+    """Input data which arrives while program is running (ex. programs run by BrainFuckScheduler)
+
+    Read by getchar() as same as input data given by set_input(), but getchar() raises BlockingIOError instead of EOFError
+    when all data arrived is read until close() is called, so that the run can be resumed from the instruction after data arrives.
+
+    Attributes:
+        closed (bool): True if no more data arrives
+    """
+    def __init__(self, data=b''):
+        """
+        Args:
+            data (bytes or str): data arrived at first. str is read as code point of each character.
+        """
+        super().__init__()
+        self.closed = False
+        self.feed(data)
+
+    def feed(self, data):
+        """append arrived data
+
+        Args:
+            data (bytes or str): arrived data. str is read as code point of each character.
+
+        Returns:
+            bool: Always return True
+        """
+        if self.closed:
+            raise ValueError('input is already closed')
+        self.extend(ord(c) for c in data) if type(data)==str else self.extend(data)
+        return True
+
+    def close(self):
+        """notify that no more data arrives"""
+        self.closed = True
+        return True
+
+class BrainFuck:
+    """BrainFuck class to generate BrainFuck interpreter and BrainFuck Variants
+    
+    Refer http://www.muppetlabs.com/~breadbox/bf/ for more detail of BrainFuck.
+    Instances have __slots__, so that attributes other than listed below can't be added to them
+    (subclass can declare its own attributes by __slots__).
+    
+    Variables:
+        OPTOKEN_DICT (dict): default dictionary for OpToken class. 
+        ARRAY_SIZE (int): default data cell array size.
+        CELL_SIZE (int): default data cell size [bit].
+        DEM (str): default separator of src.
+        TOKENS (list): default token list to replace tokens in optoken.
+        BF_HELLO_WORLD_SRC (str): sample BrainFuck code to output "Hello World!".
+        INIT_TAPE (str, bytes or list): default image of data cell loaded at the start of run.
+        INIT_PTR (int): default data pointer at the start of run.
+        PURE_OPCODES (list): opcodes which don't need input, to be evaluated by partial_evaluator().
+        PE_BUDGET (int): default max number of instructions evaluated by partial_evaluator().
+        PROGRAM_CACHE_SIZE (int): max number of compiled programs cached by run().
+        TIER_THRESHOLD (int): default number of back-edges of a loop to compile the loop in executer().
+        LOOP_MEMO_SIZE (int): default max number of effects of loops cached by compiled engine for each program (see _engine()).
+        LOOP_MEMO_PATIENCE (int): number of misses of a loop to give up memoizing it if hits are less than quarter of misses.
+        SPECIALIZE (bool): default flag to use interpreter loop specialized for the configuration in executer().
+        INTERPRETERS (dict): cache of interpreter loops specialized for each configuration.
+        METRICS (Metrics): default registry of metrics shared by all dialects. Metrics are labeled by class name. None to disable.
+        TAPE_POOL_SIZE (int): max number of data cell buffers kept for each array size by pool made to be TAPES (ex. TapePool(TAPE_POOL_SIZE)).
+        TAPES (TapePool): default pool of data cell buffers shared by all dialects. None (default) to allocate data cell for each run.
+            Pool zeroes only cells from lwm to hwm (and init_tape) of the last run, so that every writer of data cell must keep
+            hwm/lwm covering cells it writes (writes to self.cell out of opcodes must be zeroed by the writer).
+        TYPED_TAPE (bool): default flag to store data cell in array.array instead of list.
+        TAPE_FILE (str): default path of file to back data cell (see map_tape()). None to store data cell in memory.
+        NOP_OPCODES (list): opcodes which do nothing, removed by simplifier().
+        SIMPLIFY (bool): default flag to remove opcodes without effect in compiler().
+        PARALLEL_LEX_SIZE (int): min length of src code to be split into chunks by lexer().
+        LEX_CHUNK_SIZE (int): length of chunk of src code split by lexer().
+        LEX_WORKERS (int): default number of worker processes of lexer(). 1 (default) to analyze in this process.
+        LEX_POOLS (dict): process pool for lexer() by number of workers. shut down by shutdown_lex_pools() at exit.
+        MICRO_OPS (dict): opcodes compiled into block by compiler() as {opcode: (micro-ops, pointer move)}.
+            Micro-op is (kind, offset, operand) addressed relative to the pointer, and kind is one of 'add' (cell[offset] += operand),
+            'set' (cell[offset] = operand), 'or', 'and', 'xor' (cell[offset] = cell[operand] op cell[offset]), and 'not' (cell[offset] = ~cell[offset]).
+            inc/dec must check cell boundary as same as op_inc/op_dec, and op_"opcode" must not check array boundary except by nxt/prv.
+        OPTOKEN (OpToken): frozen optoken of the class shared by all instances (built by build_tables()).
+        INIT_TAPE_IMAGE (tuple): INIT_TAPE converted to cell values (built by build_tables()).
+        BLOCK_OPS (dict): MICRO_OPS of opcodes whose op_"opcode" function is the one MICRO_OPS is declared for (built by build_tables()).
+    
+    Attributes:
+        array_size (int): data cell array size.
+        cell_size (int): data cell size [bit]
+        delimiter (str): delimiter of src output.
+        optoken (OpToken): frozen OpToken instance to translate token and opcode. OPTOKEN unless optoken_dict or tokens is given.
+            It can't be modified in place (shared by instances). Give optoken_dict or tokens to the constructor,
+            or assign modified copy (ex. optoken = b.optoken.copy(); optoken['inc'] = ['plus']; b.optoken = optoken).
+        wrap_cell (bool): True to allow wrapping in cell.
+        signed_cell (bool): True to allow signed cell data.
+        wrap_array (bool): True to allow wrapping in array.
+        infinite_array (bool): True to allow auto extend cell array to realize infinite cell array.
+        delimit_input (bool): True to use self.dem for lexical anaysys of src code
+        debug (bool): debug flag
+        optimize (bool): True to run src code by compiled_executer() in run()
+        pe_budget (int): max number of instructions evaluated by partial_evaluator(). 0 to disable partial evaluation.
+        programs (OrderedDict): cache of compiled programs by src code and configuration (see config_key())
+        init_tape (tuple): image of data cell loaded at the start of run
+        init_ptr (int): data pointer at the start of run
+        tier_threshold (int): number of back-edges of a loop to compile the loop in executer(). 0 to disable.
+        tiered_loops (list): list of (index of opn, index of cls) of loops compiled in the last executer()
+        loop_memo (int): max number of effects of loops cached by compiled engine for each program. 0 to disable. default is LOOP_MEMO_SIZE.
+        specialize (bool): True to run opcodes by interpreter loop specialized for the configuration in executer(). default is SPECIALIZE.
+        metrics (Metrics): registry to record metrics of run(). None to disable. default is METRICS.
+        output (file): stream to write output of the program. None to write to sys.stdout.
+        tape_pool (TapePool): pool of data cell buffers. None to disable. default is TAPES.
+        lex_workers (int): number of worker processes of lexer(). 1 to analyze in this process. default is LEX_WORKERS.
+        simplify (bool): True to remove opcodes without effect in compiler(). default is SIMPLIFY.
+        typed_tape (bool): True to store data cell in array.array to access it by memory() without copy. memory() copies data cell if False.
+        tape_file (str): path of file to back data cell by map_tape(). None to store data cell in memory.
+        steps (int): number of instructions executed since initializer() (same for every engine,
+            except that opcodes removed by simplifier() are not counted)
+        input_data (bytes or list): input data read by op_get(). None to read from console.
+        input_pos (int): position in input_data
+        breakpoints (dict): callback of breakpoint by index in opcode list (see set_breakpoint())
+        watchpoints (list): list of (start, end, callback) of watchpoints (see set_watchpoint())
+        hwm (int): max index of cell written since initializer() (max data pointer, and cells written at offset from it)
+        lwm (int): min index of cell written since initializer() (negative if data pointer wraps to the end of data cell)
+        ptr (int): data pointer
+        cur (int): instruction pointer
+        cell (list): data cell area (None until the first run after construction unless tape_file is set, see tape())
+        code (list): code area
+    """
+    OPTOKEN_DICT = dict(
+        nxt = '>',
+        prv = '<',
+        inc = '+',
+        dec = '-',
+        put = '.',
+        get = ',',
+        opn = '[',
+        cls = ']'
+    )
+    ARRAY_SIZE = 30000
+    CELL_SIZE = 8
+    DEM = ['']
+    TOKENS = None
+    BF_HELLO_WORLD_SRC = '>+++++++++[<++++++++>-]<.>+++++++[<++++>-]<+.+++++++..+++.[-]>++++++++[<++++>-]<.>+++++++++++[<+++++>-]<.>++++++++[<+++>-]<.+++.------.--------.[-]>++++++++[<++++>-]<+.[-]++++++++++.'
+    INIT_TAPE = b''
+    INIT_PTR = 0
+    PURE_OPCODES = ['nxt', 'prv', 'inc', 'dec', 'put', 'opn', 'cls']
+    PE_BUDGET = 100000
+    PROGRAM_CACHE_SIZE = 32
+    TIER_THRESHOLD = 1000
+    LOOP_MEMO_SIZE = 1024
+    LOOP_MEMO_PATIENCE = 64
+    SPECIALIZE = True
+    INTERPRETERS = {}
+    METRICS = None
+    TAPE_POOL_SIZE = 8
+    TAPES = None
+    TYPED_TAPE = False
+    TAPE_FILE = None
+    NOP_OPCODES = []
+    SIMPLIFY = True
+    PARALLEL_LEX_SIZE = 65536
+    LEX_CHUNK_SIZE = 8192
+    LEX_WORKERS = 1
+    LEX_POOLS = {}
+    MICRO_OPS = dict(
+        nxt = ((), 1),
+        prv = ((), -1),
+        inc = ((('add', 0, 1),), 0),
+        dec = ((('add', 0, -1),), 0)
+    )
+    __slots__ = ('array_size', 'cell_size', 'delimiter', 'optoken', 'wrap_cell', 'signed_cell', 'wrap_array', 'infinite_array',
+        'delimit_input', 'debug', 'optimize', 'pe_budget', 'programs', 'tier_threshold', 'tiered_loops', 'loop_memo', 'specialize',
+        'metrics', 'output', 'tape_pool', 'lex_workers', 'simplify', 'typed_tape', 'tape_file', 'init_tape', 'init_ptr', 'input_data', 'input_pos',
+        'breakpoints', 'watchpoints', 'cell_min', 'cell_max', 'steps', 'hwm', 'lwm', 'ptr', 'cur', 'cell', 'code', '_tier_program', '_tape_id', '__weakref__')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.build_tables()
+
+    @classmethod
+    def build_tables(cls):
+        """build tables of the class shared by all instances
+        Called once at class creation (for subclass, by __init_subclass__), so that instances are constructed cheaply.
+        Call it again after OPTOKEN_DICT, TOKENS or INIT_TAPE of the class is modified.
+
+        OPTOKEN (OpToken): frozen optoken made from OPTOKEN_DICT and TOKENS, with its lookup tables and lexer pattern.
+        INIT_TAPE_IMAGE (tuple): INIT_TAPE converted to cell values.
+        BLOCK_OPS (dict): MICRO_OPS of opcodes whose op_"opcode" function is not overridden after MICRO_OPS is declared.
+        """
+        optoken = OpToken(cls.OPTOKEN_DICT)
+        if cls.TOKENS:
+            optoken.replace_tokens(cls.TOKENS)
+        cls.OPTOKEN = optoken.freeze()
+        cls.INIT_TAPE_IMAGE = cls._tape_image(cls.INIT_TAPE)
+        cls.BLOCK_OPS = {}
+        for c, spec in cls.MICRO_OPS.items():
+            owner = next(k for k in cls.__mro__ if c in k.__dict__.get('MICRO_OPS', {}))
+            if getattr(cls, 'op_'+c, None) is getattr(owner, 'op_'+c, None):
+                cls.BLOCK_OPS[c] = spec
+        return True
+
+    def __init__(self, optoken_dict=None, array_size=None, cell_size=None, delimiter=None, tokens=None, wrap_cell=False, signed_cell=False, wrap_array=False, infinite_array=False, delimit_input=False, debug=False, optimize=False, pe_budget=None, init_tape=None, init_ptr=None, tier_threshold=None, typed_tape=None, tape_file=None):
+        """
+        Args: 
+            optoken_dict (dict): dict to generate optoken (OpToken) of the instance, ex. dict(BrainFuck.OPTOKEN_DICT, inc=['plus']).
+                Tokens of the instance are customized by optoken_dict or tokens, since optoken is frozen after construction.
+            array_size (int): data cell array size
+            cell_size (int): data cell size [bit]
+            delimiter (str): separator for src output
+            tokens (list): token list to replace tokens in optoken
+            wrap_cell (bool): True to allow wrapping in cell. (ex. if cell size = 8bit, and cell byte is set as 256, cell byte = 0)
+            signed_cell (bool): True to allow signed cell data.
+            wrap_array (bool): True to allow wrapping in array. self.cell[-1] => self.cell[len(self.cell)].
+            infinite_array (bool): True to allow auto extend cell array to realize infinite cell array (ex. for Turing Machine).
+            delimit_input (bool): True to use self.delimiter for lexical analysis of src code
+            debug (bool): True to output debug information
+            optimize (bool): True to compile opcodes and run them by compiled_executer() in run()
+            pe_budget (int): max number of instructions evaluated by partial_evaluator() at compile. default is PE_BUDGET.
+            init_tape (bytes, str, list or file): image of data cell loaded at the start of run. default is INIT_TAPE. See load_tape().
+            init_ptr (int): data pointer at the start of run. default is INIT_PTR.
+            tier_threshold (int): number of back-edges of a loop to compile the loop in executer(). default is TIER_THRESHOLD.
+            typed_tape (bool): True to store data cell in array.array of tape_typecode() (values must fit in it, and input over the cell range is wrapped by cast_cell()). default is TYPED_TAPE.
+            tape_file (str): path of file to back data cell (see map_tape()). data cell is typed as typed_tape. default is TAPE_FILE.
+                It can't be given with infinite_array (raises ValueError), since the file can't be extended.
+        """
+        if optoken_dict or tokens:
+            self.optoken = OpToken(optoken_dict or self.OPTOKEN_DICT)
+            if tokens:
+                self.optoken.replace_tokens(tokens)
+            elif self.TOKENS:
+                self.optoken.replace_tokens(self.TOKENS)
+            self.optoken.freeze()
+        else:
+            self.optoken = self.OPTOKEN # shared by all instances of the class
+        self.array_size = array_size or self.ARRAY_SIZE
+        self.cell_size = cell_size or self.CELL_SIZE
+        if delimiter:
+            if type(delimiter)!=list and type(delimiter)==str:
+                self.delimiter = [delimiter]
+            else:
+                self.delimiter = delimiter
+        else:
+            self.delimiter = self.DEM
+        self.wrap_cell = wrap_cell
+        self.signed_cell = signed_cell
+        self.wrap_array = wrap_array
+        self.infinite_array = infinite_array
+        self.delimit_input = delimit_input
+        self.debug = debug
+        self.optimize = optimize
+        self.pe_budget = self.PE_BUDGET if pe_budget is None else pe_budget
+        self.programs = collections.OrderedDict()
+        self.tier_threshold = self.TIER_THRESHOLD if tier_threshold is None else tier_threshold
+        self.tiered_loops = []
+        self.loop_memo = self.LOOP_MEMO_SIZE
+        self.specialize = self.SPECIALIZE
+        self.metrics = self.METRICS
+        self.output = None
+        self.tape_pool = self.TAPES
+        self.lex_workers = self.LEX_WORKERS
+        self.simplify = self.SIMPLIFY
+        self.typed_tape = self.TYPED_TAPE if typed_tape is None else typed_tape
+        self.tape_file = self.TAPE_FILE if tape_file is None else tape_file
+        self._tape_id = None # (device, inode) of tape file created by map_tape()
+        if self.tape_file:
+            if self.infinite_array:
+                raise ValueError('tape file can not be extended (give array_size large enough instead of infinite_array)')
+            self.typed_tape = True # cells are stored in file as tape_typecode()
+        self.init_ptr = self.INIT_PTR
+        self.input_data = None
+        self.breakpoints = {}
+        self.watchpoints = []
+        self.load_tape(self.INIT_TAPE_IMAGE if init_tape is None else init_tape, init_ptr)
+        if self.debug:
+            self.printparams()
+        if self.signed_cell and self.typed_tape: # array.array can't store float
+            self.cell_min = -2**(self.cell_size-1)
+            self.cell_max = 2**(self.cell_size-1) - 1
+        elif self.signed_cell:
+            self.cell_min = -1*2**self.cell_size/2
+            self.cell_max = 2**self.cell_size/2 - 1
+        else:
+            self.cell_min = 0
+            self.cell_max = 2**self.cell_size-1
+        self.initializer()
+
+    def outparams(self, oneline=False):
+        """output specification for debugging
+        """
+        indent = '' if oneline else ' '*4
+        sep = ', ' if oneline else '\n'
+        eq = '=' if oneline else ' = '
+        titleend = ' ' if oneline else '\n'
+        output = ''
+        # header
+        if oneline:
+            header = self.__class__.__name__+':'+titleend
+        else:
+            header = '***** Spec of "'+self.__class__.__name__+'" *****'+titleend
+        output += header
+        output += 'Array:'+titleend
+        output += indent+'size'+eq+str(self.array_size)+sep
+        output += indent+'Wrapping'+eq+('on' if self.wrap_array else 'off')+sep
+        output += indent+'Infinite'+eq+('on' if self.infinite_array else 'off')+sep
+        output += 'Cell:'+titleend
+        output += indent+'size'+eq+str(self.cell_size)+'bit'+sep
+        output += indent+'Wrapping'+eq+('on' if self.wrap_cell else 'off')+sep
+        output += indent+'Signed'+eq+('on' if self.signed_cell else 'off')+sep
+        output += 'Token/Opcode map:'+titleend
+        for t in self.optoken.alltokens():
+            output += indent+'\''+t+'\''+eq+self.optoken.opcode(t)+sep
+        if oneline:
+            output += ''
+        else:
+            output += '*' * (len(header))
+        return output
+
+    def printparams(self):
+        """print specification for debugging
+        """
+        print(self.outparams())
+        return True
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        return self.outparams(oneline=True)
+
+    def print_cell(self, start=None, end=None, num_column=30):
+        """print data cell in decimal
+
+        Args:
+            start (int): index of the first cell. default is 0.
+            end (int): index next to the last cell. default is the end of data cell.
+            num_column (int): number of cells in a row
+        """
+        return self.dump(start, end, num_column, base=10)
+
+    def memory(self, start=None, end=None):
+        """return memoryview of data cell
+
+        Data cell is not copied if self.typed_tape is True (or data cell is backed by tape file), so that the view reflects the current data cell.
+        Otherwise, the view is made from a copy of data cell. Note that typed_tape is False by default (TYPED_TAPE),
+        so that memory() copies whole of data cell on each call unless typed_tape=True is given.
+        Release the view (ex. use with statement) before running again, since array.array exported by memoryview can't be resized.
+
+        Args:
+            start (int): index of the first cell. default is 0.
+            end (int): index next to the last cell. default is the end of data cell.
+
+        Returns:
+            memoryview: view of data cell in format of tape_typecode()
+        """
+        cell = self.tape()
+        if type(cell)==memoryview: # tape file
+            return cell[start:end]
+        if type(cell)!=array.array:
+            cell = array.array(self.tape_typecode(), cell)
+        return memoryview(cell)[start:end]
+
+    def dump(self, start=None, end=None, num_column=16, base=16, stream=None):
+        """dump data cell in hexadecimal or decimal
+
+        Each row is formatted at once, and whole dump is written to stream by one write().
+        Index of the first cell in each row is also written in the base.
+
+        Args:
+            start (int): index of the first cell. default is 0.
+            end (int): index next to the last cell. default is the end of data cell.
+            num_column (int): number of cells in a row
+            base (int): 16 for hexadecimal, 10 for decimal
+            stream (file): stream to write. default is sys.stdout.
+        """
+        start = start or 0
+        cell = self.tape()
+        end = len(cell) if end==None else end
+        values = cell[start:end]
+        values = values.tolist() if type(values)==array.array else [int(v) for v in values]
+        num_column = max(min(num_column, len(values)), 1)
+        if base==16:
+            width = max(-(-self.cell_size//4)+1, 4) + (1 if self.signed_cell else 0)
+            label, spec = '+{:02x}', 'x'
+        else:
+            width = max(len(str(int(self.cell_min))), len(str(int(self.cell_max))))+1
+            width = max(width, 4)
+            label, spec = '+{:02d}', 'd'
+        cellfmt = '{:'+str(width)+spec+'}'
+        header = ' '*6 + ''.join('{:>{}}'.format(label.format(n), width) for n in range(num_column))
+        indexfmt = '{:6'+spec+'}'
+        rowfmt = indexfmt + cellfmt*num_column
+        lines = [header]
+        full = len(values)-len(values)%num_column
+        for i in range(0, full, num_column):
+            lines.append(rowfmt.format(start+i, *values[i:i+num_column]))
+        if full<len(values):
+            lines.append((indexfmt + cellfmt*(len(values)-full)).format(start+full, *values[full:]))
+        (stream or sys.stdout).write('\n'.join(lines)+'\n')
+        return True
+
+    def lexer(self, src, buffered=True):
+        """lexical analysis of src code and return tokens list
+
+        src code is delimited by self.delimiter if self.delimit_input is True, and each piece is analyzed by lex_chunk().
+        Piece of PARALLEL_LEX_SIZE or more is split into chunks at safe boundaries by split_src(),
+        and chunks are analyzed in self.lex_workers worker processes (in this process if self.lex_workers<=1).
+        Result is concatenated in order of src code, so that it is same as the result of sequential analysis.
+        
+        Args:
+            src (str): source code
+            buffered (bool): False to only scan src code without storing strings by buffer() (ex. for source_index())
+            
+        Returns:
+            list: token list
+        """
+        dsrc = [src]
+        if self.delimit_input:
+            dsrc = self._delimit(src, list(self.delimiter))
+        pieces = []
+        for s in dsrc:
+            if len(s)<self.PARALLEL_LEX_SIZE:
+                pieces.append((s, True))
+            else:
+                pieces += self.split_src(s)
+        tokens = []
+        carry = None # rest of previous chunk which ends in unterminated region
+        for (s, final), result in zip(pieces, self._lex_pieces(pieces)):
+            if carry!=None:
+                s = carry+s
+                result = self.lex_chunk(s, final)
+            chunk_tokens, buffers, rest = result
+            tokens += chunk_tokens
+            if buffered:
+                self.buffer(buffers)
+            carry = None if rest==None else s[rest:]
+        return tokens
+
+    @staticmethod
+    def _delimit(src, dem):
+        """delimit src by multiple delimiter (dem is consumed)"""
+        if type(src)==str: src = [src]
+        if len(dem)==1 and dem[0]=='': return src
+        if len(dem)==0: return src
+        d=dem.pop()
+        return BrainFuck._delimit([ss for s in src for ss in s.split(d)], dem)
+
+    def lex_chunk(self, src, final=True):
+        """lexical analysis of a chunk of src code
+        Tokens are found by the pattern of self.optoken (the earliest token, and the longest one at the same position).
+        If self.debug is True, tokens are searched one by one with debugging output.
+
+        Args:
+            src (str): chunk of source code
+            final (bool): False if src code continues after the chunk
+
+        Returns:
+            tuple: (token list, list of strings to be buffered by buffer(),
+                index of src where unterminated region starts if final is False, otherwise None)
+        """
+        READ_AHEAD_BYTE = 32 # read ahead byte for debugging output
+        pattern = self.optoken.pattern()
+        if pattern is None:
+            return [], [], None
+        if not self.debug:
+            return pattern.findall(src), [], None
+        tokenlist = self.optoken.alltokens()
+        tokens = [] # output tokens list
+        cur = 0 # current position in src
+        ctoken = None # token candidate
+        while cur <= len(src)-1:
+            cstr = src[cur:]
+            start = len(cstr)
+            for token in tokenlist:
+                index = cstr.find(token)
+                if index>=0 and (index<start or (index==start and start+len(ctoken)<index+len(token))):
+                    ctoken = token
+                    start = index
+            if self.debug:
+                print('LEXER: token = "{}", current pos = {}, # of tokens = {}, ahead src = "{}"'.format(ctoken, cur, len(tokens), cstr[start:READ_AHEAD_BYTE]))
+            if ctoken!=None:
+                tokens.append(ctoken)
+                cur += cstr.find(ctoken)+len(ctoken)
+                ctoken = None
+            else:
+                break
+        return tokens, [], None
+
+    def buffer(self, strings):
+        """store strings buffered by lex_chunk()
+
+        Args:
+            strings (list): strings in order of src code
+        """
+        return True
+
+    def split_src(self, src):
+        """split src code into chunks of about LEX_CHUNK_SIZE at positions where no token straddles
+
+        Since lexer chooses the earliest (and the longest) token, chunks split at such positions are analyzed
+        independently into the same tokens.
+
+        Args:
+            src (str): source code
+
+        Returns:
+            list: list of (chunk, final). final is True only for the last chunk.
+        """
+        tokens = [t for t in self.optoken.alltokens() if len(t)>1]
+        span = max([len(t) for t in tokens]+[1])
+        chunks = []
+        start = 0
+        while len(src)-start>self.LEX_CHUNK_SIZE:
+            pos = start+self.LEX_CHUNK_SIZE
+            while pos<len(src) and self._straddled(src, pos, tokens, span):
+                pos += 1
+            if pos>=len(src):
+                break
+            chunks.append((src[start:pos], False))
+            start = pos
+        chunks.append((src[start:], True))
+        return chunks
+
+    @staticmethod
+    def _straddled(src, pos, tokens, span):
+        """return True if any token in src is across pos"""
+        base = max(pos-span+1, 0)
+        window = src[base:pos+span-1]
+        for token in tokens:
+            index = window.find(token)
+            while index>=0:
+                if base+index<pos<base+index+len(token):
+                    return True
+                index = window.find(token, index+1)
+        return False
+
+    def _lex_pieces(self, pieces):
+        """run lex_chunk() for each (chunk, final) in pieces, in worker processes if possible"""
+        workers = min(self.lex_workers, len(pieces))
+        if workers<=1:
+            return [self.lex_chunk(s, final) for s, final in pieces]
+        lexer = copy.copy(self) # lightweight copy to be sent to workers
+        lexer.cell = lexer.code = lexer.init_tape = None
+        lexer.programs = collections.OrderedDict()
+        lexer.metrics = lexer.tape_pool = lexer.output = None
+        try:
+            pickle.dumps(lexer)
+        except (pickle.PicklingError, AttributeError): # class which can't be sent to worker (ex. defined locally)
+            return [self.lex_chunk(s, final) for s, final in pieces]
+        size = -(-len(pieces)//workers)
+        groups = [pieces[i:i+size] for i in range(0, len(pieces), size)]
+        if workers not in BrainFuck.LEX_POOLS:
+            try:
+                BrainFuck.LEX_POOLS[workers] = concurrent.futures.ProcessPoolExecutor(workers)
+            except (ImportError, NotImplementedError, OSError): # process pool is not available on the platform
+                return [self.lex_chunk(s, final) for s, final in pieces]
+        try:
+            futures = [BrainFuck.LEX_POOLS[workers].submit(lex_pieces, lexer, group) for group in groups]
+            return [result for future in futures for result in future.result()]
+        except concurrent.futures.process.BrokenProcessPool: # worker is killed
+            BrainFuck.LEX_POOLS.pop(workers, None)
+            return [self.lex_chunk(s, final) for s, final in pieces]
+
+    def translator(self, orig, reverse=False):
+        """translate each items in original list by self.optoken
+        To be used to translate from token to opcode by default. reverse option allow to translate opcode to token.
+        
+        Args:
+            orig (list): list of token or opcode.
+            reverse (bool): translate token to opcode if False, else translate opcode to token
+            
+        Returns:
+            list: translated result
+        """
+        if reverse:
+            trans_dict = self.optoken.opcode2token_dict()
+        else:
+            trans_dict = self.optoken.token2opcode_dict()
+        if self.debug:
+            for s in orig:
+                print('TRANSLATOR: {:8} => {}'.format('"'+s+'"', trans_dict[s]))
+        return [trans_dict[s] for s in orig]
+
+    def executer(self, opcodes=None):
+        """execute opcodes
+        
+        Call op_"opcode" function at each step. 
+        Call preproc function before execution, and call postproc function after to execute all steps. 
+        At each step, call stepproc function.
+        If self.specialize is True, opcodes are run by interpreter loop generated for the configuration (see _interpreter()).
+        If any breakpoint or watchpoint is set, opcodes are run step by step to check them at each step.
+        If self.tier_threshold is not 0 and opcodes are compilable, back-edges of each loop are counted at cls,
+        and the loop which jumps back more than self.tier_threshold times is compiled and run by compiled engine
+        from the next time. Compiled loops are listed in self.tiered_loops.
+        Number of executed instructions is added to self.steps.
+        
+        Args:
+            opcodes (list or Bytecode): user specified opcode list. if user give opcode list, self.code will be replaced.
+                Bytecode is decoded to self.code (op_"opcode" functions see opcode list), and run as is by specialized interpreter loop.
+        
+        Returns:
+            bool: Always return True
+        """
+        bytecode = None
+        if opcodes!=None:
+            if type(opcodes)==list:
+                self.code = opcodes
+            elif type(opcodes)==Bytecode:
+                self.code = opcodes.decode()
+                bytecode = opcodes
+            else:
+                raise TypeError('given opcode is not list')
+        self.tape()
+        self.preproc()
+        self.tiered_loops = []
+        self._tier_program = None
+        traps = self.breakpoints or self.watchpoints
+        if self.specialize and not self.debug and not traps:
+            tier = self.tier_threshold if self.compilable() else 0
+            if self.overridden('stepproc'): # code can be modified at each step
+                self._interpreter()(self, self.dispatcher(), self.cell_min, self.cell_max, self.array_size-1, tier, None)
+            else:
+                if bytecode==None or self.overridden('preproc'): # code may be modified by preproc
+                    bytecode = self.encode(self.code)
+                ops = self.dispatcher()
+                ops = [ops.get(c) for c in bytecode.names]
+                self._interpreter()(self, ops, self.cell_min, self.cell_max, self.array_size-1, tier, bytecode)
+            self.postproc()
+            return True
+        tier = self.tier_threshold if self.compilable() and not traps else 0
+        backedges = {} # number of back-edges of each loop by index of opn
+        hot = {} # compiled loop by index of opn
+        steps = 0 # executed instructions not added to self.steps yet
+        try:
+            while self.cur < len(self.code):
+                c = self.code[self.cur]
+                if tier and c=='opn' and self.cur in hot:
+                    steps += hot[self.cur]() # run compiled loop until matching cls
+                    continue
+                if traps:
+                    self.steps += steps # live number of steps for callback
+                    steps = 0
+                    index = self.cur
+                    if index in self.breakpoints:
+                        self._hit(self.breakpoints[index], dict(kind='breakpoint', index=index, cur=index))
+                        c = self.code[self.cur]
+                    watched = self._watched()
+                steps += 1
+                try:
+                    jump = eval('self.op_'+c+'()')
+                except NameError:
+                    print('function for '+c+' ('+self.optoken[c]+') is not defined yet')
+                    sys.exit()
+                if traps:
+                    self._check_watchpoints(watched, index, index)
+                if self.debug:
+                    print('EXECUTER: opcode = {}, order = {}/{}, pointer = {}, memory = {}'.format(c, self.cur, len(self.code), self.ptr, self.cell[self.ptr]))
+                if tier and c=='cls' and jump==True:
+                    backedges[self.cur] = backedges.get(self.cur, 0) + 1
+                    if backedges[self.cur]==tier:
+                        self._tier_up(self.cur, hot)
+                self.cur += 1
+                self.stepproc()
+                self.hwm = max(self.hwm, self.ptr)
+                self.lwm = min(self.lwm, self.ptr)
+        finally:
+            self.steps += steps
+            self.hwm = max(self.hwm, self.ptr)
+            self.lwm = min(self.lwm, self.ptr)
+        self.postproc()
+        return True
+
+    def _tier_up(self, index, hot):
+        """compile loop starting from index and register it to hot for tiered execution in executer()"""
+        if self._tier_program==None:
+            self._tier_program = self._compile(self.code)
+        op = self._tier_program.ops[index]
+        if op[0] in ('opn', 'mem', 'scn'):
+            end = op[2] if op[0]=='scn' else op[1]
+            hot[index] = functools.partial(self._engine, self._tier_program, None, end+1)
+            self.tiered_loops.append((index, end))
+        return True
+
+    def dispatcher(self):
+        """return dispatch table of op_"opcode" functions
+
+        Returns:
+            dict: function by opcode
+        """
+        ops = {}
+        for c in self.optoken.opcodes():
+            if hasattr(self, 'op_'+c):
+                ops[c] = getattr(self, 'op_'+c)
+        return ops
+
+    def _interpreter(self):
+        """return interpreter loop specialized for the configuration
+
+        Interpreter loop is generated for each combination of infinite_array, wrap_array, wrap_cell,
+        overridden op_"opcode" functions and stepproc, and cached in BrainFuck.INTERPRETERS.
+        nxt/prv/inc/dec/opn/cls which are not overridden are inlined with data pointer and data cell on local variables,
+        so that the configuration flags are not checked at each step.
+        Range of data pointer is tracked in self.hwm and self.lwm.
+        Unless code can be modified by stepproc, the loop runs Bytecode, of which opcode numbers are compared as integers
+        and matching opn/cls is looked up in jumps of Bytecode.
+        Otherwise, it runs self.code, and jump destination of opn/cls is searched as same as op_opn/op_cls.
+        Destination of unmatched opn/cls is searched as same as op_opn/op_cls in both cases.
+
+        Returns:
+            function: interpreter loop as func(self, ops, cell_min, cell_max, last, tier, bytecode). ops is dispatch table
+                by opcode (see dispatcher()), or list by opcode number if bytecode is run. number of executed instructions is added to self.steps.
+        """
+        inline = tuple(c for c in ('nxt', 'prv', 'inc', 'dec', 'opn', 'cls') if not self.overridden('op_'+c))
+        stepproc = self.overridden('stepproc')
+        key = (self.infinite_array, self.wrap_array, self.wrap_cell, inline, stepproc)
+        if key in BrainFuck.INTERPRETERS:
+            return BrainFuck.INTERPRETERS[key]
+        I = ' '*16 # indent of opcode body
+        seek = 'code' if stepproc else 'text' # opcode list to search matching opn/cls
+        def search(target, step):
+            ## jump to matching opn/cls by jumps of bytecode, or search it as same as op_opn/op_cls
+            J = I+'    ' if stepproc else I+'        '
+            src = [] if stepproc else [I+'    if jumps[cur]>=0:', I+'        cur = jumps[cur]', I+'    else:']
+            return src + [J+'level = 1',
+                          J+"while {}[cur]!='{}' or level!=0:".format(seek, target),
+                          J+('    if cur <= len({}): cur += 1' if step=='+=' else '    if cur >= 0: cur -= 1').format(seek),
+                          J+"    if {}[cur]=='opn': level {} 1".format(seek, step),
+                          J+"    if {}[cur]=='cls': level {} 1".format(seek, '-=' if step=='+=' else '+=')]
+        def case(c):
+            return '            elif c=={}:'.format(repr(c) if stepproc else c.upper())
+        src = ['def interpreter(self, ops, cell_min, cell_max, last, tier, bytecode):']
+        if stepproc:
+            src += ['    code = self.code']
+        else:
+            src += ['    text = self.code',
+                    '    code = bytecode.code',
+                    '    size = len(code)',
+                    '    names = bytecode.names',
+                    '    jumps = bytecode.jumps',
+                    '    numbers = dict((o, i) for i, o in enumerate(names))']
+            src += ['    {} = numbers.get({!r}, -1)'.format(c.upper(), c) for c in ('nxt', 'prv', 'inc', 'dec', 'opn', 'cls')]
+        src += [
+            '    cell = self.cell',
+            '    ptr = self.ptr',
+            '    cur = self.cur',
+            '    hwm = self.hwm',
+            '    lwm = self.lwm',
+            '    backedges = {}',
+            '    hot = {}',
+            '    steps = 0',
+            '    try:',
+            '        while cur < {}:'.format('len(code)' if stepproc else 'size'),
+            '            c = code[cur]',
+            '            steps += 1',
+            '            if False:',
+            '                pass',
+        ]
+        if 'inc' in inline:
+            src += [case('inc')]
+            if self.wrap_cell:
+                src += [I+'v = cell[ptr]+1', I+'cell[ptr] = v if v<=cell_max else cell_min']
+            else:
+                src += [I+'cell[ptr] += 1', I+'if cell[ptr]>cell_max:',
+                        I+"    raise CellLimitError('Byte at cell pointer is set as '+str(cell[ptr])+' over maximum value='+str(cell_max))"]
+        if 'dec' in inline:
+            src += [case('dec')]
+            if self.wrap_cell:
+                src += [I+'v = cell[ptr]-1', I+'cell[ptr] = v if v>=cell_min else cell_max']
+            else:
+                src += [I+'cell[ptr] -= 1', I+'if cell[ptr]<cell_min:',
+                        I+"    raise CellLimitError('Byte at cell pointer is set as '+str(cell[ptr])+' under minimum value='+str(cell_min))"]
+        if 'nxt' in inline:
+            src += [case('nxt'), I+'ptr += 1', I+'if ptr>hwm:', I+'    hwm = ptr', I+'if ptr>=last:']
+            if self.infinite_array:
+                src += [I+'    cell.append(0)']
+            elif self.wrap_array:
+                src += [I+'    ptr = 0']
+            else:
+                src += [I+"    raise ArrayLimitError('cell pointer is indicated as '+str(ptr)+' over array size ('+str(self.ARRAY_SIZE)+')')"]
+        if 'prv' in inline:
+            src += [case('prv'), I+'ptr -= 1']
+            if self.infinite_array:
+                src += [I+'if ptr<0:', I+'    cell.append(0)', I+'    lwm = min(lwm, ptr)']
+            elif self.wrap_array:
+                src += [I+'if ptr<lwm:', I+'    lwm = ptr']
+            else:
+                src += [I+'if ptr<0:', I+"    raise ArrayLimitError('cell pointer is indicated as '+str(ptr)+' under 0')"]
+        if 'opn' in inline:
+            src += [case('opn'),
+                    I+'if hot and cur in hot:',
+                    I+'    self.ptr = ptr',
+                    I+'    self.cur = cur',
+                    I+'    self.hwm = hwm',
+                    I+'    self.lwm = lwm',
+                    I+'    try:',
+                    I+'        steps += hot[cur]() - 1 # run compiled loop until matching cls',
+                    I+'    finally:',
+                    I+'        ptr = self.ptr',
+                    I+'        cur = self.cur',
+                    I+'        hwm = self.hwm',
+                    I+'        lwm = self.lwm',
+                    I+'    cell = self.cell',
+                    I+'    continue',
+                    I+'if cell[ptr]==0:']
+            src += search('cls', '+=')
+        if 'cls' in inline:
+            src += [case('cls'),
+                    I+'if cell[ptr]!=0:']
+            src += search('opn', '-=')
+            src += [I+'    if tier:',
+                    I+'        backedges[cur] = backedges.get(cur, 0) + 1',
+                    I+'        if backedges[cur]==tier:',
+                    I+'            self._tier_up(cur, hot)']
+        src += ['            else:',
+                I+'self.ptr = ptr',
+                I+'self.cur = cur',
+                I+'try:',
+                I+("    ops[c]() if c in ops else getattr(self, 'op_'+c)()" if stepproc else "    (ops[c] or getattr(self, 'op_'+names[c]))()"),
+                I+'finally:',
+                I+'    ptr = self.ptr',
+                I+'    cur = self.cur',
+                I+'    hwm = max(hwm, ptr, self.hwm)',
+                I+'    lwm = min(lwm, ptr, self.lwm)',
+                I+'cell = self.cell',
+                '            cur += 1']
+        if stepproc:
+            src += ['            self.ptr = ptr',
+                    '            self.cur = cur',
+                    '            try:',
+                    '                self.stepproc()',
+                    '            finally:',
+                    '                ptr = self.ptr',
+                    '                cur = self.cur',
+                    '                hwm = max(hwm, ptr, self.hwm)',
+                    '                lwm = min(lwm, ptr, self.lwm)',
+                    '            cell = self.cell',
+                    '            code = self.code']
+        src += ['    finally:',
+                '        self.ptr = ptr',
+                '        self.cur = cur',
+                '        self.hwm = hwm',
+                '        self.lwm = lwm',
+                '        self.steps += steps',
+                '    return True']
+        namespace = dict(ArrayLimitError=ArrayLimitError, CellLimitError=CellLimitError)
+        exec('\n'.join(src), namespace)
+        BrainFuck.INTERPRETERS[key] = namespace['interpreter']
+        return namespace['interpreter']
+
+    def overridden(self, name):
+        """check if method is overridden by subclass
+
+        Args:
+            name (str): method name
+
+        Returns:
+            bool: True if the method of this instance is not the one of BrainFuck class
+        """
+        return getattr(type(self), name, None) is not getattr(BrainFuck, name, None)
+
+    def compilable(self):
+        """check if opcodes can be run by compiled_executer()
+        stepproc must be called at every step when it is overridden (ex. self modifying code), so such instance is not compilable.
+
+        Returns:
+            bool: True if compiled_executer() can be used
+        """
+        return not self.debug and not self.overridden('stepproc')
+
+    def config_key(self):
+        """return configuration which compiled program depends on
+        Compiled program, its partial evaluation and memoized loops are valid only for the same configuration.
+
+        Returns:
+            tuple: array/cell settings, initial tape and pointer, compiler settings and tokens
+        """
+        return (self.array_size, self.cell_size, self.cell_min, self.cell_max, self.wrap_cell, self.signed_cell, self.wrap_array,
+            self.infinite_array, self.typed_tape, self.tape_file, self.init_tape, self.init_ptr, self.simplify, self.pe_budget,
+            self.loop_memo!=0, tuple((o, tuple(t)) for o, t in self.optoken.items()))
+
+    def compiler(self, opcodes):
+        """compile opcodes to Program for compiled_executer()
+
+        Run of opcodes in MICRO_OPS (nxt/prv/inc/dec, and ones added by dialect) is compiled as block of micro-ops addressed
+        relative to the pointer at the entry, followed by one pointer move. Cells set to constant in the block are folded.
+        Its pointer range and accumulated delta of each cell are analyzed to check array and cell boundary once per block instead of each step.
+        Matching opn/cls are resolved as jump table.
+        Loop without I/O whose body returns pointer to the entry is compiled as mem loop, of which effect on cells around
+        the pointer is memoized by compiled engine (see _engine()).
+        Opcodes of which op_"opcode" function is overridden by subclass are called as is.
+        If self.simplify is True, opcodes without effect are removed by simplifier() before compilation.
+        If self.pe_budget is not 0, input independent prefix of the program is evaluated by partial_evaluator()
+        and stored as Program.residual (unless data cell is backed by tape file, which is too large to be evaluated in memory).
+
+        Args:
+            opcodes (list or Bytecode): opcode list, or bytecode given by bytecode() (decoded into opcode list)
+
+        Returns:
+            Program: compiled program
+        """
+        if isinstance(opcodes, Bytecode):
+            opcodes = opcodes.decode()
+        if self.simplify and self.compilable():
+            code, origin = self.simplifier(opcodes)
+            program = self._compile(code)
+            program.origin = origin
+            program.removed = len(opcodes)-len(code)
+        else:
+            program = self._compile(opcodes)
+        program.config = self.config_key()
+        if self.pe_budget and self.compilable() and not self.tape_file:
+            program.residual = self.partial_evaluator(program, self.pe_budget)
+        return program
+
+    def simplifier(self, opcodes):
+        """remove opcodes which have no effect
+
+        Following opcodes are removed only where the result is exactly same (including errors):
+            * opcodes in NOP_OPCODES
+            * pair of inc and dec if unsigned cell wraps (inc/dec never raise ValueError), and every cell is in its range
+              (input is cast by cast_cell(), and initial tape image has no value over the range)
+            * prv followed by nxt if array wraps (pointer always returns to the same position)
+            * loop at the start of code on zero cell, and loop right after cls (the byte at pointer is always zero there)
+        Opcodes are not removed if preproc or stepproc is overridden, since they may see the code and each step.
+
+        Args:
+            opcodes (list): opcode list
+
+        Returns:
+            tuple: (simplified opcode list, list of index in opcodes of each simplified opcode)
+        """
+        if not self.compilable() or self.overridden('preproc'):
+            return list(opcodes), list(range(len(opcodes)))
+        cancel = {} # opcode to cancel previous opcode
+        if self.wrap_cell and not self.signed_cell and not self.overridden('op_inc') and not self.overridden('op_dec') \
+                and not self.overridden('op_get') and all(self.cell_min<=v<=self.cell_max for v in self.init_tape): # signed cell turns into float on wrap
+            cancel.update(inc='dec', dec='inc')
+        base = set(BrainFuck.OPTOKEN_DICT.keys())
+        if self.wrap_array and not self.infinite_array and not self.overridden('op_nxt') and not self.overridden('op_prv') \
+                and 0<=self.init_ptr<self.array_size-1 and set(opcodes)<=base: # no opcode to jump pointer
+            cancel.update(nxt='prv')
+        jumps = not self.overridden('op_opn') and not self.overridden('op_cls')
+        match = {}
+        stack = []
+        for i, c in enumerate(opcodes):
+            if c=='opn':
+                stack.append(i)
+            elif c=='cls' and stack:
+                match[stack.pop()] = i
+                match[i] = None
+        tape = self.init_tape
+        zero = jumps and 0<=self.init_ptr and (tape[self.init_ptr] if self.init_ptr<len(tape) else 0)==0
+        code = []
+        origin = []
+        i = 0
+        while i < len(opcodes):
+            c = opcodes[i]
+            if c in self.NOP_OPCODES:
+                i += 1
+                continue
+            if zero and c=='opn' and i in match: # dead loop
+                i = match[i]+1
+                continue
+            zero = jumps and c=='cls' and i in match
+            if code and cancel.get(c)==code[-1]:
+                code.pop()
+                origin.pop()
+            else:
+                code.append(c)
+                origin.append(i)
+            i += 1
+        return code, origin
+
+    def _compile(self, opcodes, barriers=()):
+        """core of compiler() without partial evaluation
+
+        Blocks and scan loops don't run over index in barriers (ex. breakpoints), so that the opcode there starts new instruction.
+        """
+        BLOCK_OPS = self.BLOCK_OPS
+        ops = [('op', c) for c in opcodes]
+        ## resolve jump table of opn and cls
+        if not self.overridden('op_opn') and not self.overridden('op_cls'):
+            stack = []
+            for i, c in enumerate(opcodes):
+                if c=='opn':
+                    stack.append(i)
+                elif c=='cls' and stack:
+                    j = stack.pop()
+                    ops[j] = ('opn', i)
+                    ops[i] = ('cls', j)
+        ## compile run of opcodes in MICRO_OPS as blocks
+        blocks = 0
+        i = 0
+        while i < len(opcodes):
+            if opcodes[i] not in BLOCK_OPS:
+                i += 1
+                continue
+            j = i
+            while j < len(opcodes) and opcodes[j] in BLOCK_OPS and (j==i or j not in barriers):
+                j += 1
+            ## ops in the middle of block are left as is to allow to jump into there
+            while i < j:
+                ops[i], size = self._compile_block(opcodes[i:j])
+                blocks += 1
+                i += size
+        ## compile scan loop ([>], [<], [>>>], ...) to search zero in data cell
+        for i, op in enumerate(ops):
+            if op[0]=='opn' and op[1]-i>1:
+                body = opcodes[i+1:op[1]]
+                if body[0] in ('nxt', 'prv') and ops[i+1][0]=='blk' and body.count(body[0])==len(body) \
+                        and not any(i<b<=op[1] for b in barriers):
+                    ops[i] = ('scn', len(body) if body[0]=='nxt' else -len(body), op[1])
+        ## compile loop whose effect is function of cells around the pointer as mem loop
+        if self.loop_memo:
+            for i, op in enumerate(ops):
+                if op[0]=='opn' and not any(i<b<=op[1] for b in barriers):
+                    window = self._memo_window(ops, i, op[1])
+                    if window!=None:
+                        ops[i] = ('mem', op[1]) + window
+        return Program(opcodes, ops, blocks)
+
+    @staticmethod
+    def _memo_window(ops, start, end):
+        """return (lo, hi) offsets of cells accessed by loop from start to end, if the loop consists of blocks and nested loops
+        which don't move the pointer in total. otherwise None."""
+        pos = lo = hi = 0
+        stack = []
+        i = start+1
+        while i < end:
+            op = ops[i]
+            if op[0]=='blk':
+                lo = min(lo, pos+op[3])
+                hi = max(hi, pos+op[4])
+                pos += op[6]
+                i += op[1]
+                continue
+            if op[0] in ('opn', 'mem'):
+                stack.append(pos)
+            elif op[0]!='cls' or stack.pop()!=pos:
+                return None
+            i += 1
+        return (lo, hi) if pos==0 else None
+
+    def _compile_block(self, opcodes):
+        """compile run of opcodes in MICRO_OPS as block instruction
+
+        Micro-ops are addressed relative to the pointer at the entry. Consecutive adds are merged for each cell,
+        and cells set to constant are folded until they are read. Block ends before add to cell of unknown value
+        (written by bitwise op), or add to constant over cell boundary, since such add can't be checked at the entry.
+
+        Returns:
+            tuple: (block instruction, number of opcodes compiled into it)
+        """
+        seq = [] # micro-ops in order
+        pending = {} # delta of add not emitted yet by offset
+        delta = {} # accumulated delta of each cell from the entry
+        ranges = {} # min/max of accumulated delta of each cell
+        const = {} # value of cell set to constant in the block
+        unset = set() # offset of constant not emitted yet
+        unknown = set() # offset of cell written by bitwise op
+        pos = lo = hi = 0
+        def emit(o):
+            ## emit pending change of cell at offset o before it is read or overwritten
+            if o in unset:
+                seq.append(('set', o, const[o]))
+                unset.discard(o)
+            elif pending.get(o):
+                seq.append(('add', o, pending.pop(o)))
+        for size, c in enumerate(opcodes):
+            micro_ops, move = self.BLOCK_OPS[c]
+            for kind, o, n in micro_ops:
+                if kind=='add' and (pos+o in unknown or
+                        (pos+o in const and not (self.cell_min<=const[pos+o]+n<=self.cell_max))):
+                    break
+            else:
+                for kind, o, n in micro_ops:
+                    o += pos
+                    hi = max(hi, o)
+                    lo = min(lo, o)
+                    if kind=='add':
+                        if o in const:
+                            const[o] += n
+                            unset.add(o)
+                        else:
+                            delta[o] = delta.get(o, 0) + n
+                            rmin, rmax = ranges.get(o, (0, 0))
+                            ranges[o] = (min(rmin, delta[o]), max(rmax, delta[o]))
+                            pending[o] = pending.get(o, 0) + n
+                    elif kind=='set':
+                        pending.pop(o, None) # overwritten, but boundary of the adds is still checked by ranges
+                        unknown.discard(o)
+                        const[o] = n
+                        unset.add(o)
+                    elif kind=='not' and o in const:
+                        const[o] = ~const[o]
+                        unset.add(o)
+                    elif kind!='not' and o in const and n+pos in const:
+                        src = const[n+pos]
+                        const[o] = src|const[o] if kind=='or' else src&const[o] if kind=='and' else src^const[o]
+                        unset.add(o)
+                    else:
+                        emit(o)
+                        if kind!='not':
+                            n += pos
+                            hi = max(hi, n)
+                            lo = min(lo, n)
+                            emit(n)
+                        seq.append((kind, o, n))
+                        const.pop(o, None)
+                        unknown.add(o)
+                pos += move
+                hi = max(hi, pos)
+                lo = min(lo, pos)
+                continue
+            break
+        else:
+            size = len(opcodes)
+        for o in list(pending)+list(unset):
+            emit(o)
+        adds = all(m[0]=='add' for m in seq)
+        if adds:
+            seq = [(o, n) for _, o, n in seq]
+        return ('blk', size, seq, lo, hi, [(o, r[0], r[1]) for o, r in ranges.items()], pos, adds), size
+
+    def partial_evaluator(self, program, budget):
+        """evaluate input independent prefix of program
+
+        Run program from the beginning on new data cell until the 1st opcode which is not in PURE_OPCODES (ex. get),
+        the end of program, or budget of steps is exhausted.
+        Output, data cell, pointers at that point are returned as Residual, so that compiled_executer() can
+        start from there. State of this instance is not changed.
+
+        Args:
+            program (Program): compiled program
+            budget (int): max number of instructions to be evaluated
+
+        Returns:
+            Residual: result of evaluation. None if nothing is evaluated or evaluation raises error.
+        """
+        saved = (self.cell, self.ptr, self.cur, self.code, self.hwm, self.lwm, self.output)
+        self.cell = self.new_tape()
+        self.ptr = self.init_ptr
+        self.hwm = self.lwm = self.init_ptr
+        self.cur = 0
+        self.code = program.code
+        output = io.StringIO()
+        self.output = output
+        try:
+            self.preproc()
+            dirty = self._last_nonzero(self.cell) # data cell written by preproc must be overwritten at replay
+            prefix = program if self.code is program.code else self._compile(self.code)
+            ops = [('halt',) if op[0]=='op' and op[1] not in self.PURE_OPCODES else op for op in prefix.ops]
+            steps = self._engine(Program(prefix.code, ops), budget)
+            if steps==0:
+                return None
+            cell = self.cell
+            size = max(dirty, self._last_nonzero(cell))
+            return Residual(prefix, output.getvalue(), list(cell[:size]), len(cell), self.ptr, self.cur, steps)
+        except Exception:
+            return None
+        finally:
+            self.cell, self.ptr, self.cur, self.code, self.hwm, self.lwm, self.output = saved
+
+    @staticmethod
+    def _zero_index(cells):
+        """return index of the first zero in cells, or raise ValueError if not found
+        memoryview of tape file (which has no index()) is searched by chunks not to copy whole of it."""
+        if type(cells)!=memoryview:
+            return cells.index(0)
+        for start in range(0, len(cells), 4096):
+            chunk = cells[start:start+4096].tolist()
+            if 0 in chunk:
+                return start+chunk.index(0)
+        raise ValueError('0 is not in cells')
+
+    @staticmethod
+    def _last_nonzero(cell):
+        """return index next to the last non-zero cell"""
+        size = len(cell)
+        while size>0 and cell[size-1]==0:
+            size -= 1
+        return size
+
+    def compiled_executer(self, program):
+        """execute compiled program
+
+        Same as executer(), but run Program generated by compiler().
+        Array and cell boundary are checked once per block, and each op_"opcode" function is called only if
+        the block may exceed the boundary, so that IndexError/ValueError are raised as same as executer().
+        Effect of mem loop is memoized by values of cells in its window (see _engine()).
+
+        Args:
+            program (Program): compiled program
+
+        Returns:
+            bool: Always return True
+        """
+        if not isinstance(program, Program):
+            raise TypeError('given program is not Program')
+        if not self.compilable():
+            return self.executer(list(program.code))
+        self.code = program.code
+        origin = program.origin
+        self.tape()
+        self.preproc()
+        traps = self.breakpoints or self.watchpoints
+        residual = program.residual
+        if residual and self.cur==0 and not traps and program.config==self.config_key():
+            ## start from the result of partial evaluation
+            program = residual.program
+            self.code = program.code
+            self.write(residual.output)
+            self.cell[:len(residual.cell)] = residual.cell if type(self.cell)==list else array.array(self.tape_typecode(), residual.cell)
+            if len(self.cell)<residual.size:
+                self.cell.extend([0]*(residual.size-len(self.cell)))
+            self.ptr = residual.ptr
+            self.cur = residual.cur
+            self.steps += residual.steps
+            self.hwm = max(self.hwm, len(residual.cell)-1, residual.ptr)
+            self.lwm = min(self.lwm, residual.ptr)
+        elif self.code is not program.code: # code is rewritten by preproc
+            program = self._compile(self.code)
+            origin = None
+        if traps:
+            program = self._trap_program(program, origin)
+        try:
+            self.steps += self._engine(program)
+        except Exception as e:
+            if origin and self.cur<len(origin) and hasattr(e, 'add_note'):
+                e.add_note('at opcode {} of original code'.format(origin[self.cur]))
+            raise
+        self.postproc()
+        return True
+
+    def _engine(self, program, budget=None, stop=None):
+        """core of compiled_executer()
+
+        Result of mem loop (cells in its window, steps and pointer range) is cached in program.memo by its index and
+        values of cells in the window, and the loop entered with the same values is replaced by the cached result.
+        Loop is memoized only when budget is not given, the window is inside data cell in memory (not shared with
+        others by memoryview), and the loop ends without exception. Memoizing a loop is given up if it rarely hits.
+        Memo is cleared when the program is run by the interpreter in other configuration than the one which filled it.
+
+        Args:
+            program (Program): compiled program
+            budget (int): max number of instructions to be executed. None for unlimited.
+                block is run as a whole, so that the budget may be exceeded by the rest of the last block.
+            stop (int): index of code to stop execution. None for the end of code.
+
+        Returns:
+            int: number of executed instructions (opcodes in blocks and iterations of scan loops are counted
+                as same as executer())
+        """
+        ops = program.ops
+        code = program.code
+        methods = {}
+        cell = self.cell
+        ptr = self.ptr
+        cur = self.cur
+        hwm = self.hwm
+        lwm = self.lwm
+        cell_min = self.cell_min
+        cell_max = self.cell_max
+        top = self.array_size-2 # max pointer not to be checked by op_nxt
+        intptr = not self.signed_cell or self.typed_tape # pointer can be float if it is moved by float cell (ex. njm of CommDis)
+        steps = 0
+        limit = sys.maxsize if budget is None else budget
+        stop = len(ops) if stop is None else stop
+        memo = program.memo if self.loop_memo and budget is None and type(cell)!=memoryview else None
+        if memo is not None and program.memo_config!=self.config_key():
+            memo.clear()
+            program.memo_stats.clear()
+            program.memo_config = self.config_key()
+        try:
+            while cur < stop:
+                if steps>=limit:
+                    break
+                steps += 1
+                op = ops[cur]
+                kind = op[0]
+                if kind=='blk':
+                    _, size, seq, lo, hi, ranges, shift, adds = op
+                    if ptr+hi>hwm:
+                        hwm = ptr+hi
+                    if ptr+lo<lwm:
+                        lwm = ptr+lo
+                    fast = ptr+lo>=0 and ptr+hi<=top and (intptr or type(ptr)==int)
+                    if fast:
+                        for o, rmin, rmax in ranges:
+                            v = cell[ptr+o]
+                            if v+rmin<cell_min or v+rmax>cell_max:
+                                fast = False
+                                break
+                    if fast:
+                        if adds:
+                            for o, n in seq:
+                                cell[ptr+o] += n
+                        else:
+                            for k, o, n in seq:
+                                if k=='add':
+                                    cell[ptr+o] += n
+                                elif k=='set':
+                                    cell[ptr+o] = n
+                                elif k=='or':
+                                    cell[ptr+o] = cell[ptr+n] | cell[ptr+o]
+                                elif k=='and':
+                                    cell[ptr+o] = cell[ptr+n] & cell[ptr+o]
+                                elif k=='xor':
+                                    cell[ptr+o] = cell[ptr+n] ^ cell[ptr+o]
+                                else:
+                                    cell[ptr+o] = ~cell[ptr+o]
+                        ptr += shift
+                        cur += size
+                        steps += size-1
+                    else: # may exceed boundary, so call op function at each step
+                        self.ptr = ptr
+                        try:
+                            for c in code[cur:cur+size]:
+                                getattr(self, 'op_'+c)()
+                                cur += 1
+                        finally:
+                            ptr = self.ptr
+                            hwm = max(hwm, ptr)
+                            lwm = min(lwm, ptr)
+                        cell = self.cell
+                        steps += size-1
+                elif kind=='opn':
+                    if cell[ptr]==0:
+                        cur = op[1]
+                    cur += 1
+                elif kind=='cls':
+                    if cell[ptr]!=0:
+                        cur = op[1]
+                    cur += 1
+                elif kind=='mem':
+                    _, end, lo, hi = op
+                    if cell[ptr]==0:
+                        cur = end+1
+                        continue
+                    stats = memo is not None and ptr+lo>=0 and ptr+hi<=top and type(ptr)==int and program.memo_stats.setdefault(cur, [0, 0])
+                    if not stats or (stats[1]>=self.LOOP_MEMO_PATIENCE and stats[0]*4<stats[1]):
+                        cur += 1
+                        continue
+                    key = (cur, tuple(cell[ptr+lo:ptr+hi+1]))
+                    hit = memo.get(key)
+                    if hit!=None:
+                        memo.move_to_end(key)
+                        stats[0] += 1
+                        values, n, low, high = hit
+                        cell[ptr+lo:ptr+hi+1] = values
+                        steps += n
+                        hwm = max(hwm, ptr+high)
+                        lwm = min(lwm, ptr+low)
+                        cur = end+1
+                        continue
+                    stats[1] += 1
+                    self.ptr = ptr
+                    self.cur = cur+1
+                    self.hwm = self.lwm = ptr
+                    entry = ptr
+                    try:
+                        n = self._engine(program, None, end+1)
+                    finally:
+                        ptr = self.ptr
+                        cur = self.cur
+                        low = self.lwm-entry
+                        high = self.hwm-entry
+                        hwm = max(hwm, self.hwm)
+                        lwm = min(lwm, self.lwm)
+                        cell = self.cell
+                    steps += n
+                    memo[key] = (cell[entry+lo:entry+hi+1], n, low, high)
+                    if len(memo)>self.loop_memo:
+                        memo.popitem(last=False)
+                elif kind=='scn':
+                    if cell[ptr]!=0:
+                        stride = op[1]
+                        start = ptr
+                        try:
+                            if stride>0:
+                                if ptr<0 or ptr>top:
+                                    raise ValueError
+                                if stride==1 and type(cell)!=memoryview:
+                                    ptr = cell.index(0, ptr, top+1)
+                                else:
+                                    ptr += self._zero_index(cell[ptr:top+1:stride])*stride
+                            else:
+                                if ptr<0:
+                                    raise ValueError
+                                ptr += self._zero_index(cell[ptr::stride])*stride
+                        except ValueError:
+                            ## no zero until the end of data cell. move to the last position before the boundary,
+                            ## and run loop body to follow wrap_array/infinite_array.
+                            if 0<=ptr<=top:
+                                ptr += ((top-ptr)//stride)*stride if stride>0 else (ptr//-stride)*stride
+                            cur += 1
+                            continue
+                        finally:
+                            if ptr>hwm:
+                                hwm = ptr
+                            steps += (ptr-start)//stride*(abs(stride)+1) # body and cls of each iteration
+                    cur = op[2]+1
+                elif kind=='halt':
+                    steps -= 1
+                    break
+                elif kind=='trap':
+                    self.ptr = ptr
+                    self.cur = cur
+                    self.hwm = hwm
+                    self.lwm = lwm
+                    base = steps
+                    self.steps += base # live number of steps for callback
+                    try:
+                        steps += self._trap_step(op) - 1
+                    finally:
+                        self.steps -= base
+                        ptr = self.ptr
+                        cur = self.cur
+                        hwm = self.hwm
+                        lwm = self.lwm
+                    cell = self.cell
+                else:
+                    c = op[1]
+                    if c not in methods:
+                        methods[c] = getattr(self, 'op_'+c)
+                    self.ptr = ptr
+                    self.cur = cur
+                    try:
+                        methods[c]()
+                    finally:
+                        ptr = self.ptr
+                        cur = self.cur
+                        hwm = max(hwm, ptr, self.hwm)
+                        lwm = min(lwm, ptr, self.lwm)
+                    cur += 1
+                    cell = self.cell
+        finally:
+            self.ptr = ptr
+            self.cur = cur
+            self.hwm = hwm
+            self.lwm = lwm
+        return steps
+
+    def set_breakpoint(self, index, callback=None):
+        """set breakpoint to call callback before the opcode at index is executed
+
+        Breakpoint is compiled into program as trap instruction by compiled_executer(), and checked at each step
+        by executer(), so that run without breakpoint and watchpoint is not slowed down.
+
+        Args:
+            index (int): index in opcode list (see source_index() for position in src code)
+            callback (function): callback(machine, event) called with this instance and dict of event
+                (kind='breakpoint', index=index in opcode list, cur=instruction pointer).
+                State of machine (ptr, cell, cur, ...) can be modified, and run is resumed when callback returns.
+                Exception raised by callback stops the run. default is self.trap.
+
+        Returns:
+            bool: Always return True
+        """
+        self.breakpoints[index] = callback or type(self).trap
+        return True
+
+    def set_watchpoint(self, start, end=None, callback=None):
+        """set watchpoint to call callback when cells in range are changed
+
+        Instructions which may write data cell are guarded by trap instruction only while watchpoint is set,
+        and cells are compared only if the instruction reaches the range (whole block is run before callback).
+
+        Args:
+            start (int): index of the first cell
+            end (int): index next to the last cell. default is start+1.
+            callback (function): callback(machine, event) called with this instance and dict of event
+                (kind='watchpoint', index=index in opcode list, cur=instruction pointer, start, end, old and new values of cells).
+                default is self.trap.
+
+        Returns:
+            bool: Always return True
+        """
+        self.watchpoints.append((start, start+1 if end==None else end, callback or type(self).trap))
+        return True
+
+    def clear_traps(self):
+        """remove all breakpoints and watchpoints"""
+        self.breakpoints = {}
+        self.watchpoints = []
+        return True
+
+    def source_index(self, src, pos):
+        """return index in opcode list of the first token starting at pos or later in src code
+        src code is scanned without side effect of lexer() (strings of buf are not stored by buffer()).
+
+        Args:
+            src (str): source code
+            pos (int): position in src code
+
+        Returns:
+            int: index in opcode list
+        """
+        return len(self.lexer(src[:pos], buffered=False))
+
+    def trap(self, event):
+        """default callback of breakpoint and watchpoint to print state of machine"""
+        print('TRAP: {}, opcode index = {}, pointer = {}, memory = {}, steps = {}'.format(
+            ', '.join('{} = {}'.format(k, v) for k, v in event.items() if k not in ('index', 'cur')), event['index'], self.ptr,
+            self.cell[self.ptr] if 0<=self.ptr<len(self.cell) else None, self.steps))
+        return True
+
+    def _hit(self, callback, event):
+        """call callback of trap"""
+        return callback(self, event)
+
+    def _watched(self):
+        """return values of cells in each watchpoint"""
+        return [list(self.cell[start:end]) for start, end, _ in self.watchpoints]
+
+    def _check_watchpoints(self, watched, index, cur):
+        """call callback of watchpoints whose cells are changed from watched"""
+        for (start, end, callback), old in zip(self.watchpoints, watched):
+            new = list(self.cell[start:end])
+            if new!=old:
+                self._hit(callback, dict(kind='watchpoint', index=index, cur=cur, start=start, end=end, old=old, new=new))
+        return True
+
+    def _trap_program(self, program, origin=None):
+        """return program with trap instructions for breakpoints and watchpoints
+
+        Args:
+            program (Program): compiled program
+            origin (list): index in original opcode list of each opcode. None if opcodes are not simplified.
+
+        Returns:
+            Program: program to be run by _engine()
+        """
+        n = len(program.code)
+        breaks = {} # callback by index in code
+        for b, callback in sorted(self.breakpoints.items(), reverse=True):
+            t = b if origin==None else bisect.bisect_left(origin, b)
+            if 0<=t<n:
+                breaks[t] = callback
+        plain = self._compile(program.code, breaks)
+        ops = list(plain.ops)
+        for i, op in enumerate(plain.ops):
+            if op[0]=='mem': # memoized loop would skip traps in its body
+                ops[i] = op = ('opn', op[1])
+            reach = None
+            if op[0]=='blk' and op[2]:
+                reach = (op[3], op[4])
+            elif op[0]=='op':
+                reach = True
+            if i in breaks or (self.watchpoints and reach!=None):
+                ops[i] = ('trap', plain, i if origin==None or i>=len(origin) else origin[i], breaks.get(i), reach)
+        trapped = Program(plain.code, ops, plain.blocks)
+        trapped.origin = origin
+        return trapped
+
+    def _trap_step(self, op):
+        """run trap instruction op at self.cur"""
+        _, plain, index, breakpoint, reach = op
+        cur = self.cur
+        if breakpoint!=None:
+            self._hit(breakpoint, dict(kind='breakpoint', index=index, cur=cur))
+        watched = None
+        if reach!=None and self.watchpoints:
+            if reach==True:
+                watched = self._watched()
+            else:
+                low, high = self.ptr+reach[0], self.ptr+reach[1]
+                ## pointer out of data cell may wrap around (wrap_array or negative index), so that any cell can be written
+                if low<0 or high>=len(self.cell) or any(start<=high and low<end for start, end, _ in self.watchpoints):
+                    watched = self._watched()
+        steps = self._engine(plain, 1)
+        if watched!=None:
+            self._check_watchpoints(watched, index, cur)
+        return steps
+
+    def initializer(self):
+        """initialize data pointer, instruction pointer, and data cell before running
+        data cell of the last run is returned to tape pool by release_tape().
+        At construction, data cell is not allocated until the first run (see tape()) unless self.tape_file is set,
+        so that existing file at the path is rejected by the constructor.
+        """
+        constructed = hasattr(self, 'cell') # False in __init__
+        self.release_tape()
+        self.ptr = self.init_ptr # data pointer
+        self.cur = 0 # instruction pointer
+        self.steps = 0 # number of executed instructions
+        self.hwm = self.lwm = self.ptr # max/min data pointer since initialized
+        self.input_pos = 0 # position in input data
+        self.cell = self.new_tape() if constructed or self.tape_file else None # data cell initialized by init_tape
+        self.code = None # program area 
+        if self.debug:
+            cell = self.tape()
+            print('INITIALIZER: instruction pointer = {}, data pointer = {}, 1st memory cell = {}, 2nd memory cell = {}'.format(self.cur, self.ptr, cell[self.ptr], cell[self.ptr+1]))
+        return True
+
+    def new_tape(self):
+        """generate initial data cell
+        init_tape is copied to the beginning of data cell, and the rest is initialized 0.
+        Zeroed buffer is taken from self.tape_pool if available.
+
+        Returns:
+            list, array.array or memoryview: data cell at the start of run (array.array if self.typed_tape is True,
+                memoryview if self.tape_file is set)
+        """
+        typecode = self.tape_typecode() if self.typed_tape else None
+        if self.tape_file:
+            cell = self.map_tape()
+        elif self.tape_pool is None:
+            cell = TapePool.zeros(self.array_size, typecode)
+        else:
+            cell = self.tape_pool.acquire(self.array_size, typecode)
+        cell[0:len(self.init_tape)] = self.init_tape if typecode==None else array.array(typecode, self.init_tape)
+        return cell
+
+    def tape(self):
+        """return data cell, which is generated by new_tape() if it is not allocated yet (ex. before the first run)
+
+        Returns:
+            list, array.array or memoryview: data cell
+        """
+        if self.cell is None:
+            self.cell = self.new_tape()
+        return self.cell
+
+    def map_tape(self, private=False):
+        """create self.tape_file of array_size cells and map it as data cell
+        Cells are stored in native byte order of tape_typecode(). The file is sparse, so that its pages are allocated
+        by OS when they are written, and it is left after run to inspect the last data cell (ex. by memoryview of mmap).
+        New file is created as temporary file in the same directory and renamed to the path, so that mapping of previous run
+        (ex. view given by memory()) keeps the old file. Existing file which is not created by this instance is never replaced.
+        The mapping is closed by release_tape() at the next run.
+
+        Args:
+            private (bool): True to map existing tape file copy-on-write without creating new one
+                (ex. in child process of run_forked(), not to write the file of the parent)
+
+        Returns:
+            memoryview: data cell in format of tape_typecode() (zeroed unless private is True)
+
+        Raises:
+            FileExistsError: file which is not created by this instance exists at the path
+        """
+        typecode = self.tape_typecode()
+        size = self.array_size*array.array(typecode).itemsize
+        path = os.fspath(self.tape_file)
+        if private:
+            with open(path, 'rb') as f:
+                tape = mmap.mmap(f.fileno(), size, flags=mmap.MAP_PRIVATE, prot=mmap.PROT_READ|mmap.PROT_WRITE)
+            return memoryview(tape).cast(typecode)
+        try:
+            stat = os.lstat(path)
+            if (stat.st_dev, stat.st_ino)!=self._tape_id:
+                raise FileExistsError('tape file '+path+' exists and is not created by this instance')
+        except FileNotFoundError:
+            pass
+        fd, temp = tempfile.mkstemp(prefix=os.path.basename(path)+'.', dir=os.path.dirname(path) or None)
+        try:
+            with os.fdopen(fd, 'w+b') as f:
+                f.truncate(size)
+                tape = mmap.mmap(f.fileno(), size)
+                stat = os.fstat(f.fileno())
+            os.replace(temp, path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+        self._tape_id = (stat.st_dev, stat.st_ino)
+        return memoryview(tape).cast(typecode)
+
+    def tape_typecode(self):
+        """return typecode of array.array for data cell
+        Signed type wide enough to hold values over cell_max and under cell_min by 1 is chosen,
+        so that op_inc/op_dec can raise ValueError as same as list.
+
+        Returns:
+            str: typecode
+        """
+        for typecode in ('b', 'h', 'i', 'q'):
+            if array.array(typecode).itemsize*8-2>=self.cell_size:
+                return typecode
+        raise ValueError('cell size ('+str(self.cell_size)+') is too large for typed tape')
+
+    def release_tape(self):
+        """return data cell of the last run to self.tape_pool
+        Cells from lwm to hwm and init_tape are zeroed by the pool. Data cell must not be used after released.
+
+        Returns:
+            bool: True if data cell is returned to the pool
+        """
+        cell = getattr(self, 'cell', None)
+        if type(cell)==memoryview: # tape file is flushed and left as is
+            self.cell = None
+            tape = cell.obj
+            try:
+                cell.release()
+                tape.flush()
+                tape.close()
+            except BufferError: # view given by memory() is alive. closed when it is released.
+                pass
+            return False
+        if self.tape_pool is None or cell is None:
+            return False
+        self.cell = None
+        lwm = min(self.lwm, 0) if self.init_tape else self.lwm
+        return self.tape_pool.release(cell, self.array_size, (lwm, max(self.hwm, len(self.init_tape)-1)))
+
+    def load_tape(self, data, ptr=None):
+        """set initial data cell image to be loaded at the start of each run
+
+        Args:
+            data (bytes, str, list or file): initial data cell image. str is stored as code point of each character.
+                file object or file path (given by open() or pathlib) is read as bytes.
+            ptr (int): initial data pointer. default is not changed.
+
+        Returns:
+            bool: True if image is loaded successfully
+        """
+        tape = self._tape_image(data)
+        if len(tape)>self.array_size:
+            raise IndexError('size of tape image ('+str(len(tape))+') is over array size ('+str(self.array_size)+')')
+        if getattr(self, 'cell', None) is not None:
+            self.hwm = max(self.hwm, len(self.init_tape)-1) # previous image remains in data cell
+        self.init_tape = tape
+        if ptr!=None:
+            self.init_ptr = ptr
+        return True
+
+    @staticmethod
+    def _tape_image(data):
+        """convert data given to load_tape() to tuple of cell values"""
+        if hasattr(data, 'read'):
+            data = data.read()
+        elif hasattr(data, '__fspath__'):
+            with open(data, 'rb') as f:
+                data = f.read()
+        if type(data)==str:
+            return tuple(ord(s) for s in data)
+        return tuple(data)
+
+    def preproc(self):
+        """pre-processing"""
+        return True
+
+    def stepproc(self):
+        """process at each step"""
+        return True
+
+    def postproc(self):
+        """post-processing"""
+        return True
+
+    def op_nxt(self):
+        """increment pointer (++ptr)"""
+        self.ptr += 1
+        if self.ptr>=self.array_size-1:
+            if self.infinite_array:
+                self.cell.append(0)
+            elif self.wrap_array: 
+                self.ptr = 0
+            else:
+                raise ArrayLimitError('cell pointer is indicated as '+str(self.ptr)+' over array size ('+str(self.ARRAY_SIZE)+')')
+        return True
+
+    def op_prv(self):
+        """decrement pointer (--ptr)"""
+        self.ptr -= 1
+        if self.ptr<0:
+            if self.infinite_array:
+                self.cell.append(0)
+            elif self.wrap_array: 
+                pass
+            else:
+                raise ArrayLimitError('cell pointer is indicated as '+str(self.ptr)+' under 0')
+        return True
+
+    def op_inc(self):
+        """increment the byte at pointer (++*ptr)"""
+        self.cell[self.ptr] += 1
+        if self.cell[self.ptr]>self.cell_max:
+            if self.wrap_cell:
+                self.cell[self.ptr] = self.cell_min
+            else:
+                raise CellLimitError('Byte at cell pointer is set as '+str(self.cell[self.ptr])+' over maximum value='+str(self.cell_max))
+        return True
+
+    def op_dec(self):
+        """decrement the byte at pointer (--*ptr)"""
+        self.cell[self.ptr] -= 1
+        if self.cell[self.ptr]<self.cell_min:
+            if self.wrap_cell:
+                self.cell[self.ptr] = self.cell_max
+            else:
+                raise CellLimitError('Byte at cell pointer is set as '+str(self.cell[self.ptr])+' under minimum value='+str(self.cell_min))
+        return True
+
+    def op_put(self):
+        """output the byte at the pointer (putchar(*ptr))
+        if the byte is not valid to output as str, output byte instead of.
+        """
+        import math
+        try:
+            self.write(chr(self.cell[self.ptr]))
+        except UnicodeEncodeError:
+            b = math.ceil(self.cell[self.ptr].bit_length()/8)
+            self.write(str(self.cell[self.ptr].to_bytes(b,'big'))+' ')
+        return True
+
+    def write(self, s):
+        """write output of the program to self.output (sys.stdout at the time of writing if self.output is None)
+
+        Args:
+            s (str): output
+        """
+        (sys.stdout if self.output is None else self.output).write(s)
+        return True
+
+    def op_get(self):
+        """input a byte and store it in the byte at the pointer (*ptr = getchar())"""
+        self.cell[self.ptr] = self.cast_cell(self.getchar())
+        return True
+
+    def cast_cell(self, value):
+        """cast input value into the range of data cell
+        Value over the range wraps around if cell wraps (as same as repeated inc/dec), or if data cell is typed
+        (array.array of tape_typecode() can't hold the value). Otherwise, it is kept as is.
+
+        Args:
+            value (int): input value
+
+        Returns:
+            int: value to be stored in data cell
+        """
+        if (self.wrap_cell or self.typed_tape) and not self.cell_min<=value<=self.cell_max:
+            low = int(self.cell_min)
+            return low + (value-low) % (int(self.cell_max)-low+1)
+        return value
+
+    def getchar(self):
+        """read a character from input data given by set_input(), or from console if input data is not given
+
+        Returns:
+            int: code of the character
+
+        Raises:
+            EOFError: input data is exhausted
+            BlockingIOError: input data is InputBuffer, and data is not arrived yet
+        """
+        if self.input_data==None:
+            return ord(input("Enter>")[0])
+        if type(self.input_data)==ForkInput:
+            self.set_input(self.input_data.branch()) # returns only in child process
+            if type(self.cell)==memoryview: # child must not write tape file of the parent
+                self.cell = self.map_tape(private=True)
+        if self.input_pos>=len(self.input_data):
+            if type(self.input_data)==InputBuffer and not self.input_data.closed:
+                raise BlockingIOError('input data is not arrived yet')
+            raise EOFError('input data is exhausted')
+        self.input_pos += 1
+        return self.input_data[self.input_pos-1]
+
+    def set_input(self, data):
+        """set input data read by op_get() in the next runs instead of console
+
+        Args:
+            data (bytes, str or InputBuffer): input data. str is read as code point of each character. None to read from console.
+
+        Returns:
+            bool: Always return True
+        """
+        self.input_data = [ord(c) for c in data] if type(data)==str else data
+        self.input_pos = 0
+        return True
+
+    def op_opn(self):
+        """jump forward past the matching ] if the byte at the pointer is zero (which (*ptr) {)"""
+        if self.cell[self.ptr] != 0:
+            return False
+        level = 1
+        while self.code[self.cur]!='cls' or level!=0:
+            if self.cur <= len(self.code): self.cur += 1
+            if self.code[self.cur]=='opn': level += 1
+            if self.code[self.cur]=='cls': level -= 1
+        return True
+
+    def op_cls(self):
+        """jump backward to the matching [ unless the byte at the pointer is zero (})"""
+        if self.cell[self.ptr] == 0:
+            return False
+        level = 1
+        while self.code[self.cur]!='opn' or level!=0:
+            if self.cur >= 0: self.cur -= 1
+            if self.code[self.cur]=='opn': level -= 1
+            if self.code[self.cur]=='cls': level += 1
+        return True
+
+    def run(self, src): 
+        """run src code
+        
+        Number of runs, executed instructions, lex/compile/execution time, output bytes, program cache hits and
+        limit violations (ArrayLimitError of data pointer, CellLimitError of data cell) are recorded to self.metrics once per run.
+        Output bytes are counted by wrapping self.output during the run.
+
+        Args:
+            src (str): source code
+            
+        Returns:
+            bool: return code of executor()
+        """
+        self.initializer()
+        if self.metrics is None:
+            if self.optimize and self.compilable():
+                return self.compiled_executer(self.compiled(src))
+            return self.executer(self.bytecode(src) if self.lut_lexable() else self.opcodes(src))
+        dialect = self.__class__.__name__
+        stream = self.output
+        output = OutputCounter(sys.stdout if stream is None else stream)
+        self.output = output
+        start = time.perf_counter()
+        try:
+            if self.optimize and self.compilable():
+                program = self.compiled(src)
+                start = time.perf_counter()
+                return self.compiled_executer(program)
+            opcodes = self.bytecode(src) if self.lut_lexable() else self.opcodes(src)
+            self.metrics.observe('lex_seconds', time.perf_counter()-start, dialect=dialect)
+            start = time.perf_counter()
+            return self.executer(opcodes)
+        except ArrayLimitError:
+            self.metrics.inc('limit_violations_total', dialect=dialect, limit='array')
+            raise
+        except CellLimitError:
+            self.metrics.inc('limit_violations_total', dialect=dialect, limit='cell')
+            raise
+        finally:
+            self.output = stream
+            self.metrics.observe('exec_seconds', time.perf_counter()-start, dialect=dialect)
+            self.metrics.inc('runs_total', dialect=dialect)
+            self.metrics.inc('steps_total', self.steps, dialect=dialect)
+            self.metrics.inc('output_bytes_total', output.bytes, dialect=dialect)
+
+    def iter_output(self, src, input=None, chunk_size=1):
+        """run src code as generator of output chunks
+
+        src code is run by run() in another thread, of which output (including output of postproc) is written to self.output
+        replaced by OutputChannel during the run, and handed as chunks.
+        Run is suspended until the next chunk is requested, so that consumer can stop early (ex. close() the generator
+        or break the loop) without running further instructions. Exception of run is raised from the generator.
+        This instance must not be used until the generator is finished.
+
+        Args:
+            src (str): source code
+            input (bytes or str): input data for op_get() (see set_input()). default is input data already set.
+            chunk_size (int): min length of chunk. each output is handed as a chunk if 1.
+
+        Yields:
+            str: output chunk
+        """
+        channel = OutputChannel(chunk_size)
+        def target():
+            saved = (self.input_data, self.output)
+            self.output = channel
+            try:
+                if input is not None:
+                    self.set_input(input)
+                self.run(src)
+                channel.flush()
+            except OutputChannel.Closed:
+                return
+            except BaseException as e:
+                channel.chunks.put(('error', e))
+                return
+            finally:
+                self.input_data, self.output = saved
+            channel.chunks.put(('end', None))
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        try:
+            while True:
+                kind, value = channel.chunks.get()
+                if kind=='error':
+                    raise value
+                if kind=='end':
+                    return
+                yield value
+                channel.requests.put(True)
+        finally:
+            if thread.is_alive():
+                channel.requests.put(False)
+            thread.join()
+
+    def run_forked(self, src, inputs, workers=None):
+        """run src code for each input, sharing the run until the first read of input
+
+        src code is run once until the first getchar(), and then the process is forked for each input there
+        (see ForkInput), so that the work before reading input is not repeated and data cell is shared copy-on-write.
+        Each input is run from the start if os.fork() is not available.
+
+        Args:
+            src (str): source code
+            inputs (list): input data (bytes or str) of each run
+            workers (int): max number of child processes running at once. default is os.cpu_count().
+
+        Returns:
+            list: (output, error) of each input. error is exception raised by the run, or None.
+        """
+        inputs = list(inputs)
+        saved = (self.input_data, self.output)
+        if not hasattr(os, 'fork'):
+            results = []
+            for data in inputs:
+                self.set_input(data)
+                output = io.StringIO()
+                self.output = output
+                try:
+                    self.run(src)
+                    results.append((output.getvalue(), None))
+                except Exception as e:
+                    results.append((output.getvalue(), e))
+            self.input_data, self.output = saved
+            return results
+        fork = ForkInput(inputs, workers or os.cpu_count() or 1)
+        self.input_data = fork
+        output = io.StringIO()
+        self.output = output
+        error = None
+        try:
+            self.run(src)
+        except ForkInput.Joined:
+            return fork.results
+        except BaseException as e:
+            if fork.child is None and not isinstance(e, Exception):
+                raise
+            error = e
+        finally:
+            if fork.child is None:
+                self.input_data, self.output = saved
+        if fork.child is not None:
+            fork.send(output.getvalue(), error) # never returns
+        ## input is not read, so that every input has the same result
+        return [(output.getvalue(), error)]*len(inputs)
+
+    def compiled(self, src):
+        """output compiled program from src
+        compiled program is cached by src and configuration (see config_key()) unless lexer or buffer is overridden
+        (they may have side effect), so that the program compiled before the configuration is changed is not reused.
+
+        Args:
+            src (str): source code
+
+        Returns:
+            Program: compiled program
+        """
+        cache = not (self.overridden('lexer') or self.overridden('buffer'))
+        dialect = self.__class__.__name__
+        key = (src, self.config_key())
+        if cache and key in self.programs:
+            self.programs.move_to_end(key)
+            if self.metrics is not None:
+                self.metrics.inc('cache_hits_total', dialect=dialect)
+            return self.programs[key]
+        if self.metrics is None:
+            program = self.compiler(self.opcodes(src))
+        else:
+            start = time.perf_counter()
+            opcodes = self.opcodes(src)
+            lexed = time.perf_counter()
+            program = self.compiler(opcodes)
+            self.metrics.observe('lex_seconds', lexed-start, dialect=dialect)
+            self.metrics.observe('compile_seconds', time.perf_counter()-lexed, dialect=dialect)
+            self.metrics.inc('cache_misses_total' if cache else 'uncached_compiles_total', dialect=dialect)
+            self.metrics.inc('removed_opcodes_total', program.removed, dialect=dialect)
+        if cache:
+            self.programs[key] = program
+            while len(self.programs)>self.PROGRAM_CACHE_SIZE:
+                self.programs.popitem(last=False)
+        return program
+
+    def opcodes(self, src):
+        """output opcodes list from src
+        src code is translated by lookup table if lut_lexable() is True (see bytecode()).
+        
+        Args:
+            src (str): source code
+
+        Returns:
+            list: opcode list
+        """
+        if self.lut_lexable():
+            return self.bytecode(src).decode()
+        return self.translator(self.lexer(src))
+
+    def lut_lexable(self):
+        """check if src code can be translated by lookup table in bytecode()
+        All tokens must be single ASCII characters, and lexical analysis must not be customized
+        (lexer, lex_chunk, buffer and translator are not overridden, and input is not delimited or debugged).
+
+        Returns:
+            bool: True if src code can be translated by lookup table
+        """
+        return self.optoken.translation()!=None and not self.debug and not self.delimit_input \
+            and not any(self.overridden(name) for name in ('lexer', 'lex_chunk', 'buffer', 'translator'))
+
+    def bytecode(self, src):
+        """output bytecode from src
+        If lut_lexable() is True, src code is encoded once and each byte is mapped to opcode number by lookup table
+        (see OpToken.translation()) with bytes of non-token characters dropped, so that no Python object is made
+        for each character even for large src code. Otherwise same as encode(opcodes(src)).
+
+        Args:
+            src (str): source code
+
+        Returns:
+            Bytecode: bytecode
+        """
+        if not self.lut_lexable():
+            return self.encode(self.translator(self.lexer(src)))
+        table, delete = self.optoken.translation()
+        code = src.encode('utf-8', 'surrogatepass').translate(table, delete)
+        return Bytecode.from_numbers(code, self.optoken.opcodes())
+
+    def encode(self, opcodes):
+        """output bytecode from opcodes list
+        opcodes are numbered in the dialect (see OpToken.numbers()).
+
+        Args:
+            opcodes (list): opcode list
+
+        Returns:
+            Bytecode: bytecode
+        """
+        return Bytecode(opcodes, self.optoken.opcodes(), self.optoken.numbers())
+
+    def decode(self, bytecode):
+        """output opcodes list from bytecode
+
+        Args:
+            bytecode (Bytecode): bytecode
+
+        Returns:
+            list: opcode list
+        """
+        return bytecode.decode()
+
+    def src(self, opcodes):
+        """output src from opcodes list
+        
+        Args:
+            list or Bytecode: opcode list
+
+        Returns:
+            src (str): source code
+        """
+        if type(opcodes)==Bytecode:
+            opcodes = opcodes.decode()
+        return self.delimiter[0].join(self.translator(opcodes, reverse=True))
+
+    def test(self, src):
+        """output token list, opcode list and reuslt
+        """
+        print('Test '+self.__class__.__name__+' class:')
+        print('  * src: ', str(src))
+        tokens = self.lexer(src)
+        print('  * token: ', tokens)
+        opcodes = self.translator(tokens)
+        print('  * opcode: ', opcodes)
+        print('  * output: ')
+        self.executer(opcodes)
+        return True
+
+BrainFuck.build_tables()
+
+if __name__ == '__main__':
+    ## test 
+    b=BrainFuck()
+    print(b)
+    b.printparams()
+    print(b.opcodes('>>>sample<<<'))
+    b.test(b.BF_HELLO_WORLD_SRC)
+    b.print_cell(end=10)
+    print('')
+
+    ## simple instance creation sample 
+    ## Kapibara-san language instance
+    print('Kapibara-san variant:')
+    k=BrainFuck(tokens=['のすのす','もでーん','キュルッ！','もふっ！', 'むぎゅっと','グッ！！','ぬっくし','うっとり'], delimiter=' ')
+    k.test(k.src(b.opcodes(b.BF_HELLO_WORLD_SRC)))
@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+## Python3
+
+import io
+import os
+import sys
+import time
+import tempfile
+import contextlib
+import BrainFuck
+import BrainFuckVariant
+
+## BrainFuck code to be used for benchmark (nested loops whose cells fit even 3bit cell)
+BENCH_SRC = '+++++++[>+++++++[>+++++++[>+++++++[>+++++++[-]<-]<-]<-]<-]'
+
+def timeit(func, repeat=3):
+    """measure best time of func() with suppressing output
+
+    Args:
+        func (function): function to be measured
+        repeat (int): number of measurement
+
+    Returns:
+        float: best time [sec]
+    """
+    best = None
+    for i in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            t = time.perf_counter() - start
+        best = t if best==None else min(best, t)
+    return best
+
+def bench_specialize():
+    """compare executer() with and without interpreter loop specialized for configuration
+    """
+    print('** executer() with specialized interpreter loop:')
+    opcodes = BrainFuck.BrainFuck().opcodes(BENCH_SRC)
+    u = BrainFuckVariant.Ut_U()
+    utu_opcodes = u.opcodes('あうー うっうー かもー イエイ ハイ、ターッチ おとく うっうー かなーって')
+    cases = [
+        ('3bit wrapping cell (Ut_U config)', lambda: BrainFuck.BrainFuck(cell_size=3, wrap_cell=True), opcodes),
+        ('Ut_U', BrainFuckVariant.Ut_U, utu_opcodes),
+        ('32bit cell (KQ)', lambda: BrainFuckVariant.KQ(cell_size=32), opcodes),
+        ('65536 cells (Tettette)', BrainFuckVariant.Tettette, opcodes),
+    ]
+    for name, factory, code in cases:
+        times = []
+        for specialize in (False, True):
+            b = factory()
+            b.tier_threshold = 0
+            b.specialize = specialize
+            def run():
+                b.initializer()
+                b.executer(list(code))
+            times.append(timeit(run))
+        print('  {:34}: generic {:8.4f}s, specialized {:8.4f}s, speedup x{:.2f}'.format(name, times[0], times[1], times[0]/times[1]))
+    print('')
+
+def bench_tape_pool(n=1000):
+    """compare run() of short program with and without tape pool
+
+    Args:
+        n (int): number of runs
+    """
+    print('** run() with tape pool ({} runs):'.format(n))
+    src = '++++++++[>++++++++<-]>+.'
+    for name, factory in (('30000 cells (BrainFuck)', BrainFuck.BrainFuck), ('65536 cells (Tettette)', BrainFuckVariant.Tettette)):
+        times = []
+        for pool in (None, BrainFuck.TapePool(BrainFuck.BrainFuck.TAPE_POOL_SIZE)):
+            b = factory()
+            b.tape_pool = pool
+            def run():
+                for i in range(n):
+                    b.run(src)
+            times.append(timeit(run))
+        print('  {:34}: allocate {:8.4f}s, pooled {:8.4f}s, speedup x{:.2f}'.format(name, times[0], times[1], times[0]/times[1]))
+    print('')
+
+def bench_parallel_lex(size=200000):
+    """compare lexer() of large src code in one process and in worker processes
+    Skipped on single CPU, where workers can't run in parallel.
+
+    Args:
+        size (int): approximate length of src code
+    """
+    print('** lexer() of {} chars src code:'.format(size))
+    if (os.cpu_count() or 1)<=1:
+        print('  skipped: worker processes can not run in parallel on single CPU')
+        print('')
+        return
+    k = BrainFuckVariant.KQ()
+    src = ' '.join(k.optoken.alltokens())+'\n'
+    src = src*(size//len(src)+1)
+    times = []
+    for workers in (1, max(BrainFuck.BrainFuck.LEX_WORKERS, 2)):
+        k.lex_workers = workers
+        times.append(timeit(lambda: k.lexer(src), repeat=1))
+    print('  {:34}: 1 process {:8.4f}s, {} workers {:8.4f}s, speedup x{:.2f}'.format('KQ', times[0], workers, times[1], times[0]/times[1]))
+    print('')
+
+def bench_construction(n=10000):
+    """compare construction of dialect instance with tables shared by the class and with tables built for the instance
+
+    Args:
+        n (int): number of instances
+    """
+    print('** construction of {} instances:'.format(n))
+    for cls in (BrainFuck.BrainFuck, BrainFuckVariant.Ook, BrainFuckVariant.CommDis):
+        tokens = cls.OPTOKEN.tokens()
+        times = []
+        for factory in (lambda: cls(tokens=tokens), cls):
+            def run():
+                for i in range(n):
+                    factory()
+            times.append(timeit(run))
+        print('  {:34}: own tables {:8.4f}s, shared {:8.4f}s, speedup x{:.2f}'.format(cls.__name__, times[0], times[1], times[0]/times[1]))
+    print('')
+
+def bench_fork(n=50):
+    """compare run of each input from the start and run_forked() which shares the run until the first input
+
+    Args:
+        n (int): number of inputs
+    """
+    print('** run of program with long prefix for {} inputs:'.format(n))
+    src = BENCH_SRC + ',.'
+    inputs = [bytes([65+i%26]) for i in range(n)]
+    b = BrainFuck.BrainFuck()
+    def each():
+        for data in inputs:
+            b.set_input(data)
+            b.run(src)
+    times = [timeit(each, repeat=1), timeit(lambda: b.run_forked(src, inputs), repeat=1)]
+    print('  {:34}: each {:8.4f}s, forked {:8.4f}s, speedup x{:.2f}'.format('BrainFuck', times[0], times[1], times[0]/times[1]))
+    print('')
+
+def bench_bytecode(size=1000000):
+    """compare memory of large opcode list and its bytecode
+
+    Args:
+        size (int): approximate number of opcodes
+    """
+    print('** opcode list of {} opcodes:'.format(size))
+    b = BrainFuck.BrainFuck()
+    opcodes = b.opcodes(BENCH_SRC)
+    opcodes = opcodes*(size//len(opcodes)+1)
+    bytecode = b.encode(opcodes)
+    sizes = [sys.getsizeof(opcodes), sys.getsizeof(bytecode.code)+sys.getsizeof(bytecode.jumps)]
+    print('  {:34}: list {:8.2f}MB, bytecode {:8.2f}MB, ratio x{:.2f}'.format('BrainFuck', sizes[0]/2**20, sizes[1]/2**20, sizes[0]/sizes[1]))
+    print('')
+
+def bench_tape_file(array_size=2**26, n=3):
+    """compare runs of short program on huge data cell in memory and backed by tape file
+
+    Args:
+        array_size (int): number of cells
+        n (int): number of runs
+    """
+    print('** run() on {} cells ({} runs):'.format(array_size, n))
+    src = '>'*100+'++++++++[>++++++++<-]>+.'
+    with tempfile.TemporaryDirectory() as tmp:
+        times = []
+        for tape_file in (None, os.path.join(tmp, 'tape')):
+            b = BrainFuck.BrainFuck(array_size=array_size, typed_tape=True, tape_file=tape_file)
+            b.tape_pool = None
+            def run():
+                for i in range(n):
+                    b.run(src)
+            times.append(timeit(run, repeat=1))
+            b.release_tape()
+    print('  {:34}: memory {:8.4f}s, tape file {:8.4f}s, speedup x{:.2f}'.format('BrainFuck', times[0], times[1], times[0]/times[1]))
+    print('')
+
+def brainfork_src(workers, depth=6):
+    """generate Brainfork code which runs heavy nested loops in workers children and outputs a letter from each of them
+
+    Region of each child is depth+2 cells (fork cell, message cell and cells of nested loops).
+
+    Args:
+        workers (int): number of children
+        depth (int): depth of nested loops of 7 iterations
+
+    Returns:
+        str: Brainfork code
+    """
+    loops = '+++++++[>'*(depth-1) + '+++++++[-]' + '<-]'*(depth-1)
+    src = ''
+    for i in range(workers):
+        src += 'Y[->' + loops + '<' + '+'*(65+i%26) + 'J]' + '>'*(depth+2)
+    return src + 'J' + '<'*(depth+2)*workers + '>[.' + '>'*(depth+2) + ']'
+
+def bench_brainfork(workers=None, depth=6):
+    """compare Brainfork code which runs heavy loops in children with 1 worker (sequential) and with workers processes
+
+    Skipped on single CPU, where children can't run in parallel.
+
+    Args:
+        workers (int): number of children and worker processes. default is number of CPU.
+        depth (int): depth of nested loops run by each child
+    """
+    workers = max(workers or os.cpu_count() or 1, 2)
+    print('** Brainfork code with {} children ({} CPU):'.format(workers, os.cpu_count()))
+    if (os.cpu_count() or 1)<=1:
+        print('  skipped: children can not run in parallel on single CPU')
+        print('')
+        return
+    src = brainfork_src(workers, depth)
+    times = []
+    for n in (1, workers):
+        b = BrainFuckVariant.BrainFork(workers=n)
+        times.append(timeit(lambda: b.run(src), repeat=1))
+    print('  {:34}: 1 worker {:8.4f}s, {} workers {:8.4f}s, speedup x{:.2f}'.format('BrainFork', times[0], workers, times[1], times[0]/times[1]))
+    print('')
+
+def bench_loop_memo():
+    """compare compiled_executer() of nested loops with and without memoized effect of loops
+    """
+    print('** compiled_executer() of nested loops:')
+    src = '+++++++[>' + BENCH_SRC + '<-]'
+    times = []
+    for size in (0, BrainFuck.BrainFuck.LOOP_MEMO_SIZE):
+        b = BrainFuck.BrainFuck()
+        b.loop_memo = size
+        b.pe_budget = 0
+        program = b.compiler(b.opcodes(src))
+        def run():
+            program.memo.clear()
+            program.memo_stats.clear()
+            b.initializer()
+            b.compiled_executer(program)
+        times.append(timeit(run))
+    print('  {:34}: plain {:8.4f}s, memoized {:8.4f}s, speedup x{:.2f}'.format('BrainFuck', times[0], times[1], times[0]/times[1]))
+    print('')
+
+def bench_lut_lexer(size=4000000):
+    """compare lexer() and translator() of large src code with translation by lookup table into bytecode
+
+    Args:
+        size (int): approximate length of src code
+    """
+    print('** bytecode of {} chars src code:'.format(size))
+    for cls in (BrainFuck.BrainFuck, BrainFuckVariant.BrainCrash):
+        b = cls()
+        b.lex_workers = 1
+        src = b.BF_HELLO_WORLD_SRC + ' comment\n'
+        src = src*(size//len(src)+1)
+        times = [timeit(lambda: b.encode(b.translator(b.lexer(src))), repeat=1), timeit(lambda: b.bytecode(src), repeat=1)]
+        print('  {:34}: lexer {:8.4f}s, lookup table {:8.4f}s, speedup x{:.2f}'.format(cls.__name__, times[0], times[1], times[0]/times[1]))
+    print('')
+
+## main for benchmark
+if __name__ == "__main__":
+    bench_specialize()
+    bench_tape_pool()
+    bench_parallel_lex()
+    bench_construction()
+    bench_fork()
+    bench_bytecode()
+    bench_tape_file()
+    bench_brainfork()
+    bench_loop_memo()
+    bench_lut_lexer()
@@ -0,0 +1,411 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+## Python3
+
+import os
+import sys
+import json
+import signal
+import struct
+import hashlib
+import inspect
+import tempfile
+import argparse
+import collections
+import socket
+import socketserver
+import BrainFuck
+import BrainFuckVariant
+
+## Frame of protocol: kind (1 byte) + length of payload (4 bytes, big endian) + payload
+##   client -> daemon: REQUEST (JSON), INPUT (input bytes)
+##   daemon -> client: OUTPUT (UTF-8 text, repeated), RESULT (JSON)
+REQUEST = b'R'
+INPUT = b'I'
+OUTPUT = b'O'
+RESULT = b'X'
+HEADER = struct.Struct('>cI')
+
+## default path of Unix domain socket
+SOCKET_PATH = os.path.join(tempfile.gettempdir(), 'brainfuck-{}.sock'.format(os.getuid() if hasattr(os, 'getuid') else 0))
+
+class LimitExceeded(BaseException):
+    """Raised when run exceeds limit given by request
+    (not Exception, so that it is not caught by the run, ex. partial evaluator which gives up on any error)"""
+    pass
+
+def send_frame(sock, kind, payload=b''):
+    """send a frame
+
+    Args:
+        sock (socket): connected socket
+        kind (bytes): kind of frame
+        payload (bytes): payload
+    """
+    sock.sendall(HEADER.pack(kind, len(payload))+payload)
+    return True
+
+def recv_exact(sock, size):
+    """receive exactly size bytes
+
+    Raises:
+        ConnectionError: connection is closed before size bytes are received
+    """
+    buf = bytearray()
+    while len(buf)<size:
+        chunk = sock.recv(size-len(buf))
+        if not chunk:
+            raise ConnectionError('connection is closed')
+        buf += chunk
+    return bytes(buf)
+
+def recv_frame(sock):
+    """receive a frame
+
+    Returns:
+        tuple: (kind, payload)
+    """
+    kind, size = HEADER.unpack(recv_exact(sock, HEADER.size))
+    return kind, recv_exact(sock, size)
+
+def src_hash(src):
+    """return hash of src code to identify program cached by daemon"""
+    return hashlib.sha256(src.encode('utf-8')).hexdigest()
+
+def dialects():
+    """return BrainFuck class and its variants by class name
+
+    Returns:
+        dict: class by name
+    """
+    classes = {}
+    for module in (BrainFuck, BrainFuckVariant):
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, BrainFuck.BrainFuck):
+                classes[name] = cls
+    return classes
+
+class FrameWriter:
+    """Output stream to send output of run as OUTPUT frames
+
+    Attributes:
+        sock (socket): connected socket
+        limit (int): max number of output bytes. None for unlimited.
+        size (int): number of output bytes
+        buffer (list): output not sent yet
+        buffered (int): number of bytes in buffer
+    """
+    CHUNK_SIZE = 4096 # number of bytes to be sent at once
+    def __init__(self, sock, limit=None):
+        self.sock = sock
+        self.limit = limit
+        self.size = 0
+        self.buffer = []
+        self.buffered = 0
+    def write(self, s):
+        data = s.encode('utf-8', 'replace') if type(s)==str else bytes(s)
+        self.size += len(data)
+        if self.limit!=None and self.size>self.limit:
+            raise LimitExceeded('output is over '+str(self.limit)+' bytes')
+        self.buffer.append(data)
+        self.buffered += len(data)
+        if self.buffered>=self.CHUNK_SIZE:
+            self.flush()
+        return len(s)
+    def flush(self):
+        if self.buffer:
+            send_frame(self.sock, OUTPUT, b''.join(self.buffer))
+            self.buffer = []
+            self.buffered = 0
+        return True
+
+class BrainFuckHandler(socketserver.BaseRequestHandler):
+    """Handle a request on BrainFuckDaemon
+
+    Request (JSON):
+        command (str): 'run' (default), 'metrics' or 'ping'
+        dialect (str): class name of dialect (ex. 'BrainFuck', 'KQ'). default is 'BrainFuck'.
+        options (dict): keyword arguments for dialect class (only names in BrainFuckDaemon.OPTIONS)
+        hash (str): hash of src code given by src_hash()
+        src (str): src code. can be omitted if the daemon knows hash.
+        limits (dict): 'time' [sec] and 'output' [bytes]
+    Result (JSON):
+        status (str): 'ok', 'error', 'limit' or 'unknown' (src code is required)
+        error (str), message (str): type and message of exception
+        steps (int): number of executed instructions
+        hash (str): hash of src code
+    """
+    def handle(self):
+        kind, payload = recv_frame(self.request)
+        if kind!=REQUEST:
+            return send_frame(self.request, RESULT, json.dumps(dict(status='error', error='ProtocolError', message='request frame is expected')).encode())
+        request = json.loads(payload.decode('utf-8'))
+        input_data = b''
+        if request.get('input', True):
+            kind, input_data = recv_frame(self.request)
+        command = request.get('command', 'run')
+        if command=='ping':
+            result = dict(status='ok')
+        elif command=='metrics':
+            result = dict(status='ok', metrics=self.server.metrics.export())
+        else:
+            result = self.server.run(request, input_data, FrameWriter(self.request, request.get('limits', {}).get('output')))
+        send_frame(self.request, RESULT, json.dumps(result).encode('utf-8'))
+        return True
+
+class BrainFuckDaemon(socketserver.UnixStreamServer):
+    """Long-lived interpreter daemon on Unix domain socket
+
+    Dialect instances (with optimize=True) and src code are kept across requests,
+    so that compiled programs in each instance are reused by src code or its hash.
+    Requests are handled one by one in the main thread, so that time limit is given by SIGALRM.
+
+    Socket is created with permission 0600, so that only the owner can send requests.
+
+    Variables:
+        SOURCE_CACHE_SIZE (int): max number of src code kept by hash
+        INSTANCE_CACHE_SIZE (int): max number of dialect instances kept
+        OPTIONS (tuple): names of options which client can give to dialect class. Others (ex. tape_file, which makes
+            the daemon write a file, or debug) are rejected.
+        MAX_ARRAY_SIZE (int): max array_size given by client (larger one is clamped)
+
+    Attributes:
+        classes (dict): dialect class by name
+        instances (OrderedDict): dialect instance by (dialect, options)
+        sources (OrderedDict): src code by hash
+        metrics (Metrics): registry of metrics recorded by all instances of the daemon
+    """
+    SOURCE_CACHE_SIZE = 256
+    INSTANCE_CACHE_SIZE = 32
+    OPTIONS = ('optoken_dict', 'array_size', 'cell_size', 'delimiter', 'tokens', 'wrap_cell', 'signed_cell', 'wrap_array',
+        'infinite_array', 'delimit_input', 'pe_budget', 'init_tape', 'init_ptr', 'tier_threshold', 'typed_tape')
+    MAX_ARRAY_SIZE = 1<<20
+    def __init__(self, path=SOCKET_PATH):
+        """
+        Args:
+            path (str): path of Unix domain socket. stale socket file is removed.
+        """
+        if os.path.exists(path):
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.connect(path)
+                raise OSError('daemon is already running on '+path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(path)
+        self.classes = dialects()
+        self.instances = collections.OrderedDict()
+        self.sources = collections.OrderedDict()
+        self.metrics = BrainFuck.Metrics()
+        super().__init__(path, BrainFuckHandler)
+
+    def server_bind(self):
+        mask = os.umask(0o177) # socket file is created as 0600
+        try:
+            super().server_bind()
+        finally:
+            os.umask(mask)
+        os.chmod(self.server_address, 0o600)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+    def instance(self, dialect, options):
+        """return warm instance of dialect
+
+        Args:
+            dialect (str): class name of dialect
+            options (dict): keyword arguments for dialect class
+
+        Returns:
+            BrainFuck: instance of dialect
+
+        Raises:
+            KeyError: dialect is unknown
+            ValueError: option not in OPTIONS is given
+        """
+        rejected = sorted(set(options)-set(self.OPTIONS))
+        if rejected:
+            raise ValueError('option is not allowed: '+', '.join(rejected))
+        if options.get('array_size') is not None:
+            options = dict(options, array_size=min(int(options['array_size']), self.MAX_ARRAY_SIZE))
+        key = (dialect, json.dumps(options, sort_keys=True))
+        if key in self.instances:
+            self.instances.move_to_end(key)
+            return self.instances[key]
+        if dialect not in self.classes:
+            raise KeyError('unknown dialect: '+dialect)
+        kwargs = dict(optimize=True)
+        kwargs.update(options)
+        b = self.classes[dialect](**kwargs)
+        b.metrics = self.metrics
+        self.instances[key] = b
+        while len(self.instances)>self.INSTANCE_CACHE_SIZE:
+            self.instances.popitem(last=False)
+        return b
+
+    def source(self, request):
+        """return src code of request from request or cache by hash"""
+        digest = request.get('hash')
+        src = request.get('src')
+        if src!=None:
+            digest = src_hash(src)
+            self.sources[digest] = src
+            while len(self.sources)>self.SOURCE_CACHE_SIZE:
+                self.sources.popitem(last=False)
+        elif digest in self.sources:
+            self.sources.move_to_end(digest)
+            src = self.sources[digest]
+        return digest, src
+
+    def run(self, request, input_data, output):
+        """run src code of request
+
+        Args:
+            request (dict): request
+            input_data (bytes): input data for op_get()
+            output (FrameWriter): output stream
+
+        Returns:
+            dict: result
+        """
+        digest, src = self.source(request)
+        if src==None:
+            return dict(status='unknown', hash=digest)
+        limits = request.get('limits', {})
+        timer = limits.get('time') and hasattr(signal, 'setitimer')
+        def _timeout(signum, frame):
+            raise LimitExceeded('run is over '+str(limits['time'])+' sec')
+        b = None
+        try:
+            b = self.instance(request.get('dialect', 'BrainFuck'), request.get('options', {}))
+            b.set_input(input_data)
+            if timer:
+                handler = signal.signal(signal.SIGALRM, _timeout)
+                signal.setitimer(signal.ITIMER_REAL, limits['time'])
+            b.output = output
+            try:
+                b.run(src)
+            finally:
+                b.output = None
+                if timer:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+                    signal.signal(signal.SIGALRM, handler)
+            result = dict(status='ok')
+        except LimitExceeded as e:
+            result = dict(status='limit', error=type(e).__name__, message=str(e))
+        except Exception as e:
+            result = dict(status='error', error=type(e).__name__, message=str(e))
+        try:
+            output.flush()
+        except OSError:
+            pass
+        result.update(hash=digest, steps=b.steps if b else 0)
+        return result
+
+def request(request, input_data=b'', stream=None, path=SOCKET_PATH):
+    """send a request to daemon and write output to stream
+
+    Args:
+        request (dict): request (see BrainFuckHandler)
+        input_data (bytes): input data for op_get()
+        stream (file): stream to write output. default is sys.stdout.
+        path (str): path of Unix domain socket
+
+    Returns:
+        dict: result
+    """
+    stream = stream or sys.stdout
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        send_frame(sock, REQUEST, json.dumps(request).encode('utf-8'))
+        send_frame(sock, INPUT, input_data)
+        while True:
+            kind, payload = recv_frame(sock)
+            if kind==OUTPUT:
+                stream.write(payload.decode('utf-8', 'replace'))
+            elif kind==RESULT:
+                return json.loads(payload.decode('utf-8'))
+
+def run(dialect, src, input_data=b'', options=None, limits=None, stream=None, path=SOCKET_PATH):
+    """run src code on daemon, or in this process if daemon is not running
+
+    Only hash of src code is sent at first, and src code is sent if the daemon doesn't know it.
+
+    Args:
+        dialect (str): class name of dialect
+        src (str): src code
+        input_data (bytes): input data for op_get()
+        options (dict): keyword arguments for dialect class
+        limits (dict): 'time' [sec] and 'output' [bytes] (only for daemon)
+        stream (file): stream to write output. default is sys.stdout.
+        path (str): path of Unix domain socket
+
+    Returns:
+        dict: result (see BrainFuckHandler)
+    """
+    req = dict(command='run', dialect=dialect, options=options or {}, limits=limits or {}, hash=src_hash(src))
+    try:
+        result = request(req, input_data, stream, path)
+        if result['status']=='unknown':
+            req['src'] = src
+            result = request(req, input_data, stream, path)
+        return result
+    except (FileNotFoundError, ConnectionRefusedError):
+        pass
+    ## one-shot run in this process
+    b = dialects()[dialect](**(options or {}))
+    b.set_input(input_data)
+    b.output = stream
+    try:
+        b.run(src)
+        return dict(status='ok', hash=req['hash'], steps=b.steps)
+    except Exception as e:
+        return dict(status='error', error=type(e).__name__, message=str(e), hash=req['hash'], steps=b.steps)
+
+def serve(path=SOCKET_PATH):
+    """run daemon until interrupted"""
+    with BrainFuckDaemon(path) as daemon:
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return True
+
+## main for daemon and client
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='BrainFuck interpreter daemon and client')
+    parser.add_argument('--socket', default=SOCKET_PATH, help='path of Unix domain socket')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('serve', help='run daemon')
+    sub.add_parser('metrics', help='print metrics of daemon')
+    p = sub.add_parser('run', help='run src code on daemon (in this process if daemon is not running)')
+    p.add_argument('dialect', help='class name of dialect (ex. BrainFuck, KQ)')
+    p.add_argument('file', nargs='?', help='src code file. default is stdin.')
+    p.add_argument('--input', help='input data file for get opcode. "-" for stdin.')
+    p.add_argument('--time', type=float, help='time limit [sec]')
+    p.add_argument('--output', type=int, help='output limit [bytes]')
+    args = parser.parse_args()
+    if args.command=='serve':
+        serve(args.socket)
+    elif args.command=='metrics':
+        print(request(dict(command='metrics'), path=args.socket).get('metrics', ''), end='')
+    else:
+        if args.file:
+            with open(args.file, encoding='utf-8') as f:
+                src = f.read()
+        else:
+            src = sys.stdin.read()
+        input_data = b''
+        if args.input=='-':
+            input_data = sys.stdin.buffer.read()
+        elif args.input:
+            with open(args.input, 'rb') as f:
+                input_data = f.read()
+        limits = {k: v for k, v in (('time', args.time), ('output', args.output)) if v!=None}
+        result = run(args.dialect, src, input_data, limits=limits, path=args.socket)
+        sys.stdout.flush()
+        if result['status']!='ok':
+            print('{}: {}'.format(result.get('error'), result.get('message')), file=sys.stderr)
+        sys.exit({'ok': 0, 'limit': 2}.get(result['status'], 1))
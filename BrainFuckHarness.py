@@ -0,0 +1,462 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+## Python3
+
+import io
+import sys
+import time
+import random
+import signal
+import threading
+import contextlib
+import collections
+import BrainFuck
+import BrainFuckVariant
+
+class Timeout(BaseException):
+    """raised when a run of a case exceeds time limit"""
+    pass
+
+@contextlib.contextmanager
+def time_limit(seconds):
+    """raise Timeout in the block after seconds (only in main thread of platform with SIGALRM)
+
+    Args:
+        seconds (float): time limit. None or 0 for unlimited.
+    """
+    if not seconds or not hasattr(signal, 'setitimer') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    def alarm(signum, frame):
+        raise Timeout()
+    handler = signal.signal(signal.SIGALRM, alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, handler)
+
+## engines compared by Harness (function to run opcodes on initialized interpreter instance)
+def reference_engine(machine, opcodes):
+    """run opcodes by generic executer() loop calling op_"opcode" functions (reference)"""
+    machine.specialize = False
+    machine.tier_threshold = 0
+    return machine.executer(opcodes)
+
+def specialized_engine(machine, opcodes):
+    """run opcodes by interpreter loop specialized for the configuration"""
+    machine.specialize = True
+    machine.tier_threshold = 0
+    return machine.executer(opcodes)
+
+def tiered_engine(machine, opcodes):
+    """run opcodes by generic executer() loop with hot loops compiled"""
+    machine.specialize = False
+    machine.tier_threshold = 1
+    return machine.executer(opcodes)
+
+def bytecode_engine(machine, opcodes):
+    """run integer bytecode of opcodes by specialized interpreter loop with hot loops compiled"""
+    machine.specialize = True
+    machine.tier_threshold = 1
+    return machine.executer(machine.encode(opcodes))
+
+def compiled_engine(machine, opcodes):
+    """run compiled program of opcodes by compiled_executer() (only for compilable dialect)"""
+    return machine.compiled_executer(machine.compiler(opcodes))
+
+class Outcome:
+    """Observable result of a run of a case by an engine
+
+    Attributes:
+        output (str): output
+        tape (list): data cell after the run
+        ptr (int): data pointer after the run
+        error (tuple): (exception class name, message) of exception raised by the run. None if no exception is raised.
+        seconds (float): execution time
+        timeout (bool): True if the run is stopped by time limit
+        tiered (int): number of loops compiled by tiered execution (not compared)
+    """
+    def __init__(self, output, tape, ptr, error, seconds, timeout=False, tiered=0):
+        self.output = output
+        self.tape = tape
+        self.ptr = ptr
+        self.error = error
+        self.seconds = seconds
+        self.timeout = timeout
+        self.tiered = tiered
+
+    def key(self):
+        """return observable state compared between engines"""
+        return (self.output, self.tape, self.ptr, self.error, self.timeout)
+
+    def __repr__(self):
+        if self.timeout:
+            return '<Outcome timeout>'
+        last = max([i for i, v in enumerate(self.tape) if v!=0], default=-1)
+        return '<Outcome output={!r} ptr={} tape[:{}]={} error={}>'.format(self.output, self.ptr, last+1, self.tape[:last+1], self.error)
+
+class Mismatch:
+    """Case whose outcome of an engine differs from the reference
+
+    Attributes:
+        dialect (str): name of dialect configuration
+        engine (str): name of engine
+        opcodes (list): generated opcodes
+        input (bytes): generated input data
+        shrunk (list): minimal opcodes which still mismatch
+        shrunk_input (bytes): minimal input data which still mismatch
+        expected (Outcome): outcome of the reference for shrunk case
+        actual (Outcome): outcome of the engine for shrunk case
+    """
+    def __init__(self, dialect, engine, opcodes, input):
+        self.dialect = dialect
+        self.engine = engine
+        self.opcodes = opcodes
+        self.input = input
+        self.shrunk = opcodes
+        self.shrunk_input = input
+        self.expected = None
+        self.actual = None
+
+    def __repr__(self):
+        return '<Mismatch {} by {}: opcodes={} input={!r} expected={} actual={}>'.format(self.dialect, self.engine, self.shrunk, self.shrunk_input, self.expected, self.actual)
+
+class Harness:
+    """Differential conformance test of optimizing engines against the reference executer()
+
+    Random well-bracketed programs (with idioms like clear/scan/move loops) and input data are generated
+    from opcodes of each dialect, and run by the reference (generic executer() loop) and each engine on fresh instances.
+    Output, data cell, data pointer and exception are compared. Failing case is shrunk to minimal reproducer by removing
+    spans of opcodes, loops and input data while it still fails. Execution time of each engine for every case is recorded.
+    Case whose reference run exceeds time limit (ex. infinite loop) is skipped, and run() fails if more than max_skipped
+    of cases are skipped. Most generated loops are counted loops to keep skipped cases few. Time limit works only in
+    main thread with SIGALRM, so generated programs must terminate otherwise.
+
+    Variables:
+        DIALECTS (OrderedDict): default factories of interpreter instance by name of dialect configuration
+        ENGINES (OrderedDict): default engines by name (function to run opcodes on initialized instance)
+        STRUCTURAL_OPCODES (list): opcodes not generated at random (brackets are generated as loops, fork and join as
+            forked loops, and others need pair)
+        BUFFERS (list): strings of generated buf opcodes of dialect with buffer() (ex. Tettette), given in turn
+        IDIOMS (list): opcode sequences generated as a whole
+        FORKS (int): max number of forked loops ("Y[...J]", whose body runs only in child) generated for dialect with fork
+        COUNTED_LOOPS (float): ratio of generated loops which increment the loop cell before the loop, and whose body
+            returns data pointer and decrements the loop cell (others may not terminate and are skipped by time limit)
+        CASES (int): default number of cases for each dialect
+        MAX_OPCODES (int): default max number of generated opcodes
+        TIME_LIMIT (float): default time limit of a run [sec]
+        MAX_SKIPPED (float): default max ratio of skipped cases to all cases for run() to pass
+
+    Attributes:
+        dialects (OrderedDict): factories of interpreter instance by name
+        engines (OrderedDict): engines by name except the reference
+        cases (int): number of cases for each dialect
+        max_opcodes (int): max number of generated opcodes
+        time_limit (float): time limit of a run [sec]
+        max_skipped (float): max ratio of skipped cases to all cases for run() to pass
+        random (Random): random generator
+        mismatches (list): Mismatch found by run()
+        records (list): (dialect, case number, engine, seconds) of every run by run()
+        skipped (int): number of cases skipped by time limit of the reference
+        tiered (Counter): number of runs which compiled hot loops by engine name
+    """
+    DIALECTS = collections.OrderedDict([
+        ('BrainFuck', lambda: BrainFuck.BrainFuck(array_size=16)),
+        ('BrainFuck 3bit wrapping', lambda: BrainFuck.BrainFuck(array_size=16, cell_size=3, wrap_cell=True)),
+        ('BrainFuck 4bit signed wrapping', lambda: BrainFuck.BrainFuck(array_size=16, cell_size=4, signed_cell=True, wrap_cell=True)),
+        ('BrainFuck wrapping array', lambda: BrainFuck.BrainFuck(array_size=16, wrap_array=True)),
+        ('BrainFuck infinite array', lambda: BrainFuck.BrainFuck(array_size=16, infinite_array=True)),
+        ('BrainFuck typed tape', lambda: BrainFuck.BrainFuck(array_size=16, typed_tape=True)),
+        ('BrainCrash', lambda: BrainFuckVariant.BrainCrash(array_size=16)),
+        ('CommDis', lambda: BrainFuckVariant.CommDis(array_size=16, cell_size=4)),
+        ('Ut_U', lambda: BrainFuckVariant.Ut_U(array_size=64, init_ptr=48)), # data area after code
+        ('Ut_U self-modifying', lambda: BrainFuckVariant.Ut_U(array_size=64)),
+        ('Tettette', lambda: BrainFuckVariant.Tettette(array_size=16)),
+        ('Tettette typed tape', lambda: BrainFuckVariant.Tettette(array_size=16, typed_tape=True)),
+        ('KQ', lambda: BrainFuckVariant.KQ(array_size=16)),
+        ('BrainFork', lambda: BrainFuckVariant.BrainFork(array_size=16, shared_tape=False)), # children on shared tape race with parent
+    ])
+    ENGINES = collections.OrderedDict([
+        ('specialized', specialized_engine),
+        ('tiered', tiered_engine),
+        ('bytecode', bytecode_engine),
+        ('compiled', compiled_engine),
+    ])
+    STRUCTURAL_OPCODES = ['opn', 'cls', 'end_buf', 'com', 'end_com', 'fork', 'join']
+    BUFFERS = ['AB', '', 'てって', '\x80\xff\x01'] # strings of buf given to buffer() in turn
+    IDIOMS = [
+        ['opn', 'dec', 'cls'],
+        ['opn', 'nxt', 'cls'],
+        ['opn', 'prv', 'prv', 'cls'],
+        ['opn', 'dec', 'nxt', 'inc', 'inc', 'prv', 'cls'],
+    ]
+    FORKS = 2
+    CASES = 200
+    MAX_OPCODES = 40
+    COUNTED_LOOPS = 0.8
+    TIME_LIMIT = 0.1
+    MAX_SKIPPED = 0.05
+
+    def __init__(self, dialects=None, engines=None, cases=None, max_opcodes=None, time_limit=None, max_skipped=None, seed=0):
+        """
+        Args:
+            dialects (dict): factories of interpreter instance by name. default is DIALECTS.
+            engines (dict): engines by name compared with the reference. default is ENGINES.
+            cases (int): number of cases for each dialect. default is CASES.
+            max_opcodes (int): max number of generated opcodes. default is MAX_OPCODES.
+            time_limit (float): time limit of a run [sec]. default is TIME_LIMIT.
+            max_skipped (float): max ratio of skipped cases to all cases for run() to pass. default is MAX_SKIPPED.
+            seed (int): seed of random generator
+        """
+        self.dialects = dialects or self.DIALECTS
+        self.engines = engines or self.ENGINES
+        self.cases = cases or self.CASES
+        self.max_opcodes = max_opcodes or self.MAX_OPCODES
+        self.time_limit = self.TIME_LIMIT if time_limit is None else time_limit
+        self.max_skipped = self.MAX_SKIPPED if max_skipped is None else max_skipped
+        self.random = random.Random(seed)
+        self.mismatches = []
+        self.records = []
+        self.skipped = 0
+        self.tiered = collections.Counter()
+
+    def generate(self, machine):
+        """generate random well-bracketed opcodes and input data for the dialect
+
+        Args:
+            machine (BrainFuck): interpreter instance of the dialect
+
+        Returns:
+            tuple: (opcodes, input data)
+        """
+        opcodes = [c for c in machine.optoken.opcodes() if c not in self.STRUCTURAL_OPCODES and hasattr(machine, 'op_'+c)]
+        idioms = [idiom for idiom in self.IDIOMS if all(c in opcodes or c in ('opn', 'cls') for c in idiom)]
+        code = self._generate(opcodes, idioms, self.random.randint(1, self.max_opcodes), 0)
+        if hasattr(machine, 'op_fork') and hasattr(machine, 'op_join'):
+            for n in range(self.random.randint(0, self.FORKS)):
+                at = self.random.choice([i for i in range(len(code)+1) if self._balanced(code[:i])])
+                body = self._generate(opcodes, idioms, self.random.randint(0, self.max_opcodes//4), 1)
+                code[at:at] = ['fork', 'opn'] + body + ['join', 'cls']
+        data = bytes(self.random.randrange(256) for i in range(self.random.randint(0, 4))) if 'get' in opcodes else b''
+        return code, data
+
+    def _generate(self, opcodes, idioms, size, depth):
+        """generate opcodes of about size with loops nested up to 3 levels"""
+        code = []
+        while len(code)<size:
+            r = self.random.random()
+            if r<0.08 and idioms:
+                code += self.random.choice(idioms)
+            elif r<0.16 and depth<3:
+                body = self._generate(opcodes, idioms, self.random.randint(0, (size-len(code))//2), depth+1)
+                if self.random.random()<self.COUNTED_LOOPS and all(c in opcodes for c in ('inc', 'nxt', 'prv', 'dec')):
+                    body = self._counted(body)
+                    code += ['inc']*self.random.randint(0, 3) # loop count
+                code += ['opn'] + body + ['cls']
+            else:
+                code.append(self.random.choice(opcodes))
+        return code
+
+    @staticmethod
+    def _counted(body):
+        """return loop body which leaves the loop cell to the final decrement (nxt is inserted before operations
+        and nested loops on the loop cell) and moves data pointer back to the loop cell"""
+        code = []
+        move = 0 # offset from the loop cell
+        level = 0
+        for c in body:
+            if level==0:
+                if c in ('nxt', 'prv'):
+                    move += (c=='nxt') - (c=='prv')
+                elif move==0:
+                    code.append('nxt')
+                    move = 1
+            level += (c=='opn') - (c=='cls')
+            code.append(c)
+        return code + ['prv' if move>0 else 'nxt']*abs(move) + ['dec']
+
+    def execute(self, factory, engine, opcodes, data):
+        """run opcodes on a fresh instance by the engine
+
+        Args:
+            factory (function): factory of interpreter instance
+            engine (function): engine
+            opcodes (list): opcodes
+            data (bytes): input data
+
+        Returns:
+            Outcome: outcome of the run
+        """
+        machine = factory()
+        machine.initializer()
+        if hasattr(machine, 'buffer'):
+            machine.buffer([self.BUFFERS[i%len(self.BUFFERS)] for i in range(opcodes.count('buf'))])
+        machine.set_input(data)
+        output = io.StringIO()
+        machine.output = output
+        error = None
+        timeout = False
+        start = time.perf_counter()
+        try:
+            with time_limit(self.time_limit):
+                engine(machine, list(opcodes))
+        except Timeout:
+            timeout = True
+        except Exception as e:
+            error = (type(e).__name__, str(e))
+        seconds = time.perf_counter() - start
+        outcome = Outcome(output.getvalue(), list(machine.cell), machine.ptr, error, seconds, timeout, len(machine.tiered_loops))
+        machine.release_tape()
+        return outcome
+
+    def applicable(self, factory, name):
+        """return True if the engine can run opcodes of the dialect (compiled engine needs compilable dialect)"""
+        return name!='compiled' or factory().compilable()
+
+    def check(self, dialect, number, opcodes, data):
+        """run a case by the reference and all engines, and shrink it if an engine mismatches
+
+        Args:
+            dialect (str): name of dialect configuration
+            number (int): case number
+            opcodes (list): opcodes
+            data (bytes): input data
+
+        Returns:
+            bool: True if all engines match the reference. None if the case is skipped.
+        """
+        factory = self.dialects[dialect]
+        expected = self.execute(factory, reference_engine, opcodes, data)
+        if expected.timeout:
+            self.skipped += 1
+            return None
+        self.records.append((dialect, number, 'reference', expected.seconds))
+        ok = True
+        for name, engine in self.engines.items():
+            if not self.applicable(factory, name):
+                continue
+            actual = self.execute(factory, engine, opcodes, data)
+            if actual.timeout: # retry once since time limit of slow engine may be exceeded by chance
+                actual = self.execute(factory, engine, opcodes, data)
+            self.records.append((dialect, number, name, actual.seconds))
+            if actual.tiered:
+                self.tiered[name] += 1
+            if actual.key()!=expected.key():
+                ok = False
+                mismatch = Mismatch(dialect, name, opcodes, data)
+                mismatch.shrunk, mismatch.shrunk_input = self.shrink(factory, engine, opcodes, data)
+                mismatch.expected = self.execute(factory, reference_engine, mismatch.shrunk, mismatch.shrunk_input)
+                mismatch.actual = self.execute(factory, engine, mismatch.shrunk, mismatch.shrunk_input)
+                self.mismatches.append(mismatch)
+        return ok
+
+    def shrink(self, factory, engine, opcodes, data):
+        """reduce mismatching case to minimal one which still mismatches
+
+        Spans of opcodes (halving the length), loops, brackets of loops and the last byte of input data are removed
+        repeatedly while the case still mismatches.
+
+        Args:
+            factory (function): factory of interpreter instance
+            engine (function): engine which mismatches
+            opcodes (list): opcodes
+            data (bytes): input data
+
+        Returns:
+            tuple: (shrunk opcodes, shrunk input data)
+        """
+        def fails(code, data):
+            expected = self.execute(factory, reference_engine, code, data)
+            return not expected.timeout and self.execute(factory, engine, code, data).key()!=expected.key()
+        reduced = True
+        while reduced:
+            reduced = False
+            for code in self._reductions(opcodes):
+                if fails(code, data):
+                    opcodes = code
+                    reduced = True
+                    break
+            else:
+                if data and fails(opcodes, data[:-1]):
+                    data = data[:-1]
+                    reduced = True
+        return opcodes, data
+
+    def _reductions(self, opcodes):
+        """generate well-bracketed opcodes reduced from opcodes"""
+        size = len(opcodes)//2
+        while size>=1:
+            for start in range(0, len(opcodes)-size+1, size):
+                code = opcodes[:start] + opcodes[start+size:]
+                if self._balanced(code):
+                    yield code
+            size //= 2
+        stack = []
+        for i, c in enumerate(opcodes):
+            if c=='opn':
+                stack.append(i)
+            elif c=='cls':
+                j = stack.pop()
+                yield opcodes[:j] + opcodes[i+1:] # loop
+                yield opcodes[:j] + opcodes[j+1:i] + opcodes[i+1:] # brackets
+
+    @staticmethod
+    def _balanced(opcodes):
+        """return True if brackets of opcodes are matched"""
+        level = 0
+        for c in opcodes:
+            level += (c=='opn') - (c=='cls')
+            if level<0:
+                return False
+        return level==0
+
+    def run(self):
+        """generate and check cases for all dialects
+
+        Returns:
+            bool: True if no mismatch is found and skipped cases are not more than max_skipped
+        """
+        for dialect, factory in self.dialects.items():
+            machine = factory()
+            for number in range(self.cases):
+                opcodes, data = self.generate(machine)
+                self.check(dialect, number, opcodes, data)
+        return self.passed()
+
+    def passed(self):
+        """return True if no mismatch is found and skipped cases are not more than max_skipped"""
+        return not self.mismatches and self.skipped<=self.max_skipped*self.cases*len(self.dialects)
+
+    def report(self):
+        """print mismatches and total execution time of each engine for each dialect"""
+        totals = collections.OrderedDict()
+        for dialect, number, engine, seconds in self.records:
+            totals.setdefault(dialect, collections.OrderedDict()).setdefault(engine, 0.0)
+            totals[dialect][engine] += seconds
+        for dialect, times in totals.items():
+            print('  {:32}: '.format(dialect) + ', '.join('{} {:.4f}s (x{:.2f})'.format(engine, t, times['reference']/t if t else 0.0) for engine, t in times.items()))
+        print('  cases: {}, skipped by time limit: {} (max {:.0%}), mismatches: {}'.format(self.cases*len(self.dialects), self.skipped, self.max_skipped, len(self.mismatches)))
+        print('  runs with tiered loops: ' + ', '.join('{} {}'.format(engine, n) for engine, n in self.tiered.items()))
+        for mismatch in self.mismatches:
+            print('  ', mismatch)
+        print('  ' + ('passed' if self.passed() else 'FAILED'))
+
+def test_harness():
+    h = Harness(cases=30)
+    ok = h.run()
+    h.report()
+    ## shrink case of engine which ignores cell wrapping
+    def broken_engine(machine, opcodes):
+        machine.wrap_cell = False
+        return specialized_engine(machine, opcodes)
+    h = Harness(dialects={'BrainFuck 3bit wrapping': Harness.DIALECTS['BrainFuck 3bit wrapping']}, engines={'broken': broken_engine}, cases=5)
+    h.run()
+    print(h.mismatches[0] if h.mismatches else 'no mismatch')
+    print('')
+    return ok
+
+## main for test
+if __name__ == "__main__":
+    sys.exit(0 if test_harness() else 1)
@@ -0,0 +1,299 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+## Python3
+
+import io
+import heapq
+import itertools
+import BrainFuck
+import BrainFuckVariant
+
+class Task:
+    """Execution state of a program run by Scheduler
+
+    Data cell, data pointer and instruction pointer of the program are held by its own interpreter instance (machine).
+    Compiled program (without partial evaluation) is run by BrainFuck._engine() for each quantum. Instructions which may read input
+    (op instructions not in PURE_OPCODES) are run one by one, so that the program is parked at get without losing state
+    when its input is not arrived yet. Program of dialect which is not compilable (ex. stepproc is overridden) is run step by step.
+
+    Attributes:
+        id (int): task id given by Scheduler
+        machine (BrainFuck): interpreter instance of the program (must not be shared with other tasks)
+        program (Program): compiled program. None if machine is not compilable.
+        gated (Program): program whose instructions which may read input are replaced by halt
+        priority (int): share of instructions relative to other tasks
+        input (InputBuffer): input data of the program (see Scheduler.feed())
+        output (file): stream to write output of the program
+        state (str): READY, PARKED (blocked on input), DONE or FAILED
+        error (Exception): exception raised by the program if state is FAILED
+        steps (int): number of instructions executed
+        quanta (int): number of quanta given
+        vtime (float): virtual time of the task for stride scheduling (instructions executed divided by priority)
+    """
+    READY = 'ready'
+    PARKED = 'parked'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __init__(self, id, machine, src, input, priority, output):
+        """
+        Args:
+            id (int): task id
+            machine (BrainFuck): interpreter instance of the program
+            src (str): source code
+            input (InputBuffer): input data
+            priority (int): share of instructions
+            output (file): stream to write output
+        """
+        self.id = id
+        self.machine = machine
+        self.priority = priority
+        self.input = input
+        self.output = output
+        self.state = Task.READY
+        self.error = None
+        self.steps = 0
+        self.quanta = 0
+        self.vtime = 0.0
+        self.program = None
+        self.gated = None
+        machine.initializer()
+        machine.set_input(input)
+        machine.output = output
+        try:
+            if machine.compilable():
+                pe_budget = machine.pe_budget
+                machine.pe_budget = 0 # residual is not used, since the task runs the whole program by itself
+                try:
+                    program = machine.compiled(src)
+                finally:
+                    machine.pe_budget = pe_budget
+                machine.code = program.code
+                machine.preproc()
+                if machine.code is not program.code: # code is rewritten by preproc
+                    program = machine._compile(machine.code)
+                self.program = program
+                self.gated = BrainFuck.Program(program.code, [('halt',) if op[0]=='op' and op[1] not in machine.PURE_OPCODES else op for op in program.ops])
+            else:
+                machine.code = machine.translator(machine.lexer(src))
+                machine.preproc()
+        except Exception as e:
+            self.state = Task.FAILED
+            self.error = e
+
+    def __repr__(self):
+        return '<Task {} {} steps={}>'.format(self.id, self.state, self.steps)
+
+    def run(self, quantum):
+        """run the program for up to quantum instructions
+
+        Args:
+            quantum (int): max number of instructions
+
+        Returns:
+            int: number of executed instructions
+        """
+        machine = self.machine
+        steps = 0
+        self.quanta += 1
+        try:
+            try:
+                if self.program is None:
+                    steps = self._step(quantum)
+                else:
+                    end = len(self.gated)
+                    while steps<quantum and machine.cur<end:
+                        steps += machine._engine(self.gated, quantum-steps)
+                        if steps<quantum and machine.cur<end: # halted at instruction which may read input
+                            steps += machine._engine(self.program, 1)
+            except BlockingIOError:
+                self.state = Task.PARKED
+            else:
+                if machine.cur>=len(machine.code):
+                    machine.postproc()
+                    self.state = Task.DONE
+        except Exception as e:
+            self.state = Task.FAILED
+            self.error = e
+        finally:
+            machine.steps += steps
+            self.steps += steps
+        return steps
+
+    def _step(self, quantum):
+        """run opcodes step by step as same as executer() for machine which is not compilable"""
+        machine = self.machine
+        steps = 0
+        while steps<quantum and machine.cur<len(machine.code):
+            getattr(machine, 'op_'+machine.code[machine.cur])()
+            steps += 1
+            machine.cur += 1
+            machine.stepproc()
+            machine.hwm = max(machine.hwm, machine.ptr)
+            machine.lwm = min(machine.lwm, machine.ptr)
+        return steps
+
+    def read_output(self):
+        """return output written since the last call and clear it (only for default output stream)
+
+        Returns:
+            str: output
+        """
+        text = self.output.getvalue()
+        self.output.seek(0)
+        self.output.truncate()
+        return text
+
+class Scheduler:
+    """Run many programs in one thread by time slicing
+
+    Programs are run in quanta of instructions. The ready task with the smallest virtual time runs next (stride scheduling),
+    and its virtual time advances by executed instructions divided by its priority, so that each task gets instructions
+    in proportion to its priority. Task blocked on input is parked and not scheduled until its input arrives by feed().
+    Virtual time of resumed task is moved up to the current virtual time, so that idle task doesn't monopolize the thread.
+
+    Variables:
+        QUANTUM (int): default number of instructions in a quantum
+
+    Attributes:
+        quantum (int): number of instructions in a quantum
+        tasks (dict): tasks by id
+        vtime (float): virtual time of the last scheduled task
+        ready (list): heap of (vtime, id, task) of ready tasks
+    """
+    QUANTUM = 1000
+
+    def __init__(self, quantum=None):
+        """
+        Args:
+            quantum (int): number of instructions in a quantum. default is QUANTUM.
+        """
+        self.quantum = quantum or self.QUANTUM
+        self.tasks = {}
+        self.vtime = 0.0
+        self.ready = []
+        self.ids = itertools.count()
+
+    def spawn(self, machine, src, input=b'', priority=1, output=None, closed=False):
+        """add program to be run
+
+        Args:
+            machine (BrainFuck): interpreter instance of dialect (ex. BrainFuck(), BrainFuckVariant.KQ()) to hold state of the program.
+                it must not be used by others until the task is removed.
+            src (str): source code
+            input (bytes or str): input data arrived at first
+            priority (int): share of instructions relative to other tasks (1 or more)
+            output (file): stream to write output. default is io.StringIO (see Task.read_output()).
+            closed (bool): True if no more input arrives
+
+        Returns:
+            Task: task of the program
+        """
+        if priority<1:
+            raise ValueError('priority must be 1 or more')
+        buffer = BrainFuck.InputBuffer(input)
+        if closed:
+            buffer.close()
+        task = Task(next(self.ids), machine, src, buffer, priority, output or io.StringIO())
+        self.tasks[task.id] = task
+        if task.state==Task.READY:
+            self._schedule(task)
+        return task
+
+    def _schedule(self, task):
+        """push ready task to the heap"""
+        task.vtime = max(task.vtime, self.vtime)
+        heapq.heappush(self.ready, (task.vtime, task.id, task))
+
+    def feed(self, task, data=b'', close=False):
+        """give input data to the task, and resume it if it is parked
+
+        Args:
+            task (Task): task
+            data (bytes or str): input data
+            close (bool): True if no more input arrives (read after that raises EOFError)
+
+        Returns:
+            bool: Always return True
+        """
+        task.input.feed(data)
+        if close:
+            task.input.close()
+        if task.state==Task.PARKED:
+            task.state = Task.READY
+            self._schedule(task)
+        return True
+
+    def remove(self, task):
+        """remove the task and return its data cell to tape pool
+
+        Returns:
+            bool: True if the task is removed
+        """
+        if self.tasks.pop(task.id, None) is None:
+            return False
+        if task.state in (Task.READY, Task.PARKED):
+            task.state = Task.FAILED
+            task.error = RuntimeError('task is removed')
+        task.machine.release_tape()
+        return True
+
+    def step(self):
+        """run one quantum of the ready task with the smallest virtual time
+
+        Returns:
+            Task: task which was run. None if no task is ready.
+        """
+        while self.ready:
+            vtime, id, task = heapq.heappop(self.ready)
+            if task.state!=Task.READY or self.tasks.get(id) is not task: # removed
+                continue
+            self.vtime = vtime
+            steps = task.run(self.quantum)
+            task.vtime += max(steps, 1)/task.priority
+            if task.state==Task.READY:
+                heapq.heappush(self.ready, (task.vtime, task.id, task))
+            return task
+        return None
+
+    def run(self, max_quanta=None):
+        """run ready tasks until all tasks are finished or parked
+
+        Args:
+            max_quanta (int): max number of quanta to run. None for unlimited.
+
+        Returns:
+            int: number of quanta run
+        """
+        quanta = 0
+        while max_quanta is None or quanta<max_quanta:
+            if self.step() is None:
+                break
+            quanta += 1
+        return quanta
+
+    def parked(self):
+        """return tasks blocked on input
+
+        Returns:
+            list: parked tasks
+        """
+        return [t for t in self.tasks.values() if t.state==Task.PARKED]
+
+def test_scheduler():
+    s = Scheduler(quantum=100)
+    b = BrainFuck.BrainFuck()
+    hello = s.spawn(BrainFuck.BrainFuck(), b.BF_HELLO_WORLD_SRC)
+    echo = s.spawn(BrainFuck.BrainFuck(), '+[,.]', input='Hi, ') # echo input until 0
+    crash = s.spawn(BrainFuckVariant.BrainCrash(), '', priority=4)
+    s.run()
+    print('parked:', s.parked())
+    s.feed(echo, 'scheduler!\0', close=True)
+    s.run()
+    for t in (hello, echo, crash):
+        print(t, repr(t.read_output()))
+    print('')
+
+## main for test
+if __name__ == "__main__":
+    test_scheduler()
@@ -0,0 +1,492 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+## Python3
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import threading
+import contextlib
+import BrainFuck
+import BrainFuckDaemon
+
+def run(machine, src, data=None):
+    """run src code on machine and return output
+
+    Args:
+        machine (BrainFuck): interpreter instance
+        src (str): source code
+        data (bytes): input data. None to keep input of machine.
+
+    Returns:
+        str: output
+    """
+    if data is not None:
+        machine.set_input(data)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        machine.run(src)
+    return output.getvalue()
+
+class ProgramCacheTest(unittest.TestCase):
+    """compiled() must not reuse program compiled for other configuration"""
+    SRC = '+'*200 + '[>>++++++++++[<++++>-]<<-]>.'
+
+    def test_wrap_cell_changed(self):
+        b = BrainFuck.BrainFuck(optimize=True)
+        b.wrap_cell = True
+        self.assertEqual(run(b, self.SRC), '@')
+        b.wrap_cell = False
+        self.assertRaises(ValueError, run, b, self.SRC)
+
+    def test_loop_memo_not_replayed(self):
+        b = BrainFuck.BrainFuck(optimize=True, pe_budget=0)
+        b.wrap_cell = True
+        program = b.compiled(self.SRC)
+        b.initializer()
+        output = io.StringIO()
+        b.output = output
+        b.compiled_executer(program)
+        self.assertEqual(output.getvalue(), '@')
+        self.assertTrue(program.memo)
+        b.wrap_cell = False
+        b.initializer()
+        self.assertRaises(ValueError, b.compiled_executer, program)
+
+    def test_residual_not_replayed(self):
+        b = BrainFuck.BrainFuck(optimize=True)
+        b.wrap_cell = True
+        program = b.compiled(self.SRC)
+        self.assertIsNotNone(program.residual)
+        b.wrap_cell = False
+        b.initializer()
+        self.assertRaises(ValueError, b.compiled_executer, program)
+
+class MetricsTest(unittest.TestCase):
+    """run() records metrics only when a registry is given"""
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(BrainFuck.BrainFuck.METRICS)
+        b = BrainFuck.BrainFuck()
+        self.assertEqual(run(b, '++++++++[>++++++++<-]>+.'), 'A')
+        self.assertIsNone(b.output)
+
+    def test_steps_and_output(self):
+        b = BrainFuck.BrainFuck()
+        b.metrics = BrainFuck.Metrics()
+        self.assertEqual(run(b, '++++++++[>++++++++<-]>+.'), 'A')
+        metrics = b.metrics.as_dict()
+        self.assertEqual(metrics['steps_total'], [{'labels': {'dialect': 'BrainFuck'}, 'value': b.steps}])
+        self.assertEqual(metrics['output_bytes_total'], [{'labels': {'dialect': 'BrainFuck'}, 'value': 1}])
+        self.assertIsNone(b.output)
+
+    def test_limit_violations(self):
+        class BadInput(BrainFuck.BrainFuck):
+            def op_get(self):
+                raise ValueError('bad input')
+        b = BadInput()
+        b.metrics = BrainFuck.Metrics()
+        self.assertRaises(BrainFuck.ArrayLimitError, run, b, '<')
+        self.assertRaises(BrainFuck.CellLimitError, run, b, '-')
+        self.assertRaises(ValueError, run, b, ',')
+        violations = b.metrics.as_dict()['limit_violations_total']
+        self.assertEqual(sorted(v['labels']['limit'] for v in violations), ['array', 'cell'])
+        self.assertEqual(sum(v['value'] for v in violations), 2)
+
+class InputCastTest(unittest.TestCase):
+    """input over cell range wraps as same as inc/dec, so that simplifier() can cancel pair of inc and dec"""
+
+    def test_get_dec_inc(self):
+        for optimize in (False, True):
+            b = BrainFuck.BrainFuck(array_size=16, cell_size=3, wrap_cell=True, optimize=optimize)
+            self.assertEqual(run(b, ',-+.', b'i'), chr(ord('i')%8))
+            self.assertEqual(list(b.cell[:1]), [1])
+
+    def test_no_wrap(self):
+        b = BrainFuck.BrainFuck(array_size=16, cell_size=3)
+        self.assertEqual(run(b, ',', b'i'), '')
+        self.assertEqual(b.cell[0], ord('i'))
+
+    def test_typed_tape(self):
+        for optimize in (False, True):
+            b = BrainFuck.BrainFuck(array_size=16, typed_tape=True, optimize=optimize)
+            self.assertEqual(run(b, ',.', chr(0x1F641)), 'A')
+            with b.memory(0, 1) as view:
+                self.assertEqual(view.tolist(), [0x41])
+
+class TapePoolTest(unittest.TestCase):
+    """recycled buffer is zeroed in dirty range, and runs on recycled buffer see the same data cell as on new one"""
+
+    def test_zeroed(self):
+        pool = BrainFuck.TapePool(1)
+        for typecode in (None, 'h'):
+            cell = pool.acquire(8, typecode)
+            cell[0] = 1
+            cell[7] = 2
+            cell.append(3)
+            self.assertTrue(pool.release(cell, 8))
+            self.assertFalse(pool.release(BrainFuck.TapePool.zeros(8, typecode), 8)) # pool is full
+            self.assertIs(pool.acquire(8, typecode), cell)
+            self.assertEqual(list(cell), [0]*8)
+
+    def test_dirty_range(self):
+        pool = BrainFuck.TapePool(1)
+        cell = [0, 0, 1, 1, 0, 0, 5, 1]
+        self.assertTrue(pool.release(cell, 8, (-1, 3)))
+        self.assertEqual(cell, [0, 0, 0, 0, 0, 0, 5, 0]) # cell out of dirty range is left as is
+
+    def test_runs(self):
+        programs = ['>>>+++<<<', '+>>>>>>>>[-]', '<+', '>'*14+'+', '+[>+>++<<-]>>>>>+', '>>>+'*3]
+        for kwargs in (dict(), dict(wrap_array=True), dict(infinite_array=True), dict(typed_tape=True), dict(init_tape=b'ABC')):
+            for optimize in (False, True):
+                pooled = BrainFuck.BrainFuck(array_size=16, optimize=optimize, **kwargs)
+                pooled.tape_pool = BrainFuck.TapePool(1)
+                for src in programs:
+                    fresh = BrainFuck.BrainFuck(array_size=16, optimize=optimize, **kwargs)
+                    results = []
+                    for b in (pooled, fresh):
+                        try:
+                            run(b, src)
+                        except IndexError:
+                            pass
+                        results.append(list(b.cell))
+                    self.assertEqual(results[0], results[1], (kwargs, optimize, src))
+
+    def test_run(self):
+        b = BrainFuck.BrainFuck(array_size=16)
+        self.assertIsNone(b.tape_pool) # pooling is opt-in
+        b.tape_pool = BrainFuck.TapePool(1)
+        run(b, '>>>+++<<<')
+        cell = b.cell
+        self.assertEqual(run(b, '+'*65+'.>>>.'), 'A\x00')
+        self.assertIs(b.cell, cell)
+
+    def test_threads(self):
+        pool = BrainFuck.TapePool(4)
+        def work():
+            for i in range(200):
+                cell = pool.acquire(4)
+                cell[0] = i
+                pool.release(cell, 4)
+        threads = [threading.Thread(target=work) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertLessEqual(len(pool.buffers[(4, None)]), 4)
+        self.assertTrue(all(cell==[0]*4 for cell in pool.buffers[(4, None)]))
+
+class OpTokenTest(unittest.TestCase):
+    """optoken shared by instances is frozen, and tokens are customized by constructor or copy"""
+
+    def test_frozen(self):
+        b = BrainFuck.BrainFuck()
+        self.assertIs(b.optoken, BrainFuck.BrainFuck.OPTOKEN)
+        self.assertRaises(TypeError, b.optoken.__setitem__, 'inc', ['plus'])
+
+    def test_constructor(self):
+        for optimize in (False, True):
+            b = BrainFuck.BrainFuck(dict(BrainFuck.BrainFuck.OPTOKEN_DICT, inc=['plus']), optimize=optimize)
+            self.assertEqual(run(b, 'plus'*65+'.'), 'A')
+            self.assertEqual(run(BrainFuck.BrainFuck(optimize=optimize), '+'*65+'.'), 'A')
+
+    def test_copy(self):
+        b = BrainFuck.BrainFuck(optimize=True)
+        self.assertEqual(run(b, '+'*65+'.'), 'A')
+        optoken = b.optoken.copy()
+        optoken['inc'] = ['plus']
+        b.optoken = optoken
+        self.assertEqual(run(b, 'plus'*66+'.'), 'B')
+
+class LexPoolTest(unittest.TestCase):
+    """lexer() in worker processes is opt-in and gives the same tokens"""
+
+    def tearDown(self):
+        BrainFuck.shutdown_lex_pools()
+
+    def test_workers(self):
+        self.assertEqual(BrainFuck.BrainFuck.LEX_WORKERS, 1)
+        b = BrainFuck.BrainFuck()
+        src = '+[->,.<]'*(BrainFuck.BrainFuck.PARALLEL_LEX_SIZE//4)
+        tokens = b.lexer(src)
+        self.assertEqual(BrainFuck.BrainFuck.LEX_POOLS, {})
+        b.lex_workers = 2
+        self.assertEqual(b.lexer(src), tokens)
+        self.assertTrue(BrainFuck.shutdown_lex_pools())
+        self.assertEqual(BrainFuck.BrainFuck.LEX_POOLS, {})
+
+    def test_local_class(self):
+        class Local(BrainFuck.BrainFuck):
+            pass
+        b = Local()
+        b.lex_workers = 2
+        src = '+-'*BrainFuck.BrainFuck.PARALLEL_LEX_SIZE
+        self.assertEqual(len(b.lexer(src)), len(src))
+        self.assertEqual(BrainFuck.BrainFuck.LEX_POOLS, {})
+
+class OutputStreamTest(unittest.TestCase):
+    """output is written to instance stream without replacing sys.stdout"""
+    SRC = '+'*65 + '.+.'
+
+    def test_iter_output(self):
+        stdout = sys.stdout
+        for optimize in (False, True):
+            b = BrainFuck.BrainFuck(optimize=optimize)
+            output = ''
+            for chunk in b.iter_output(self.SRC):
+                self.assertIs(sys.stdout, stdout)
+                output += chunk
+            self.assertEqual(output, 'AB')
+            self.assertIsNone(b.output)
+
+    def test_partial_evaluator(self):
+        b = BrainFuck.BrainFuck(optimize=True)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            program = b.compiled(self.SRC)
+        self.assertEqual(output.getvalue(), '')
+        self.assertEqual(program.residual.output, 'AB')
+        self.assertEqual(run(b, self.SRC), 'AB')
+
+class DaemonTest(unittest.TestCase):
+    """daemon accepts only whitelisted options from clients"""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'bf.sock')
+        self.daemon = BrainFuckDaemon.BrainFuckDaemon(self.path)
+        self.thread = threading.Thread(target=self.daemon.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.daemon.shutdown()
+        self.thread.join()
+        self.daemon.server_close()
+        shutil.rmtree(self.dir)
+
+    def test_socket_permission(self):
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+    def test_run(self):
+        output = io.StringIO()
+        result = BrainFuckDaemon.run('BrainFuck', '+'*65+'.', options=dict(array_size=16), stream=output, path=self.path)
+        self.assertEqual(result['status'], 'ok')
+        self.assertEqual(output.getvalue(), 'A')
+
+    def test_rejected_option(self):
+        victim = os.path.join(self.dir, 'victim')
+        with open(victim, 'w') as f:
+            f.write('keep')
+        for options in (dict(tape_file=victim), dict(debug=True)):
+            result = BrainFuckDaemon.run('BrainFuck', '+.', options=options, stream=io.StringIO(), path=self.path)
+            self.assertEqual((result['status'], result['error']), ('error', 'ValueError'))
+        with open(victim) as f:
+            self.assertEqual(f.read(), 'keep')
+
+    def test_time_limit(self):
+        ## SIGALRM is handled only in main thread, so that run() is called directly
+        result = self.daemon.run(dict(src='+[]', limits=dict(time=0.005)), b'', io.StringIO())
+        self.assertEqual((result['status'], result['error']), ('limit', 'LimitExceeded'))
+
+    def test_array_size_clamped(self):
+        b = self.daemon.instance('BrainFuck', dict(array_size=1<<40))
+        self.assertEqual(b.array_size, BrainFuckDaemon.BrainFuckDaemon.MAX_ARRAY_SIZE)
+
+class TapeFileTest(unittest.TestCase):
+    """tape file replaces only the file created by the instance"""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'tape.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_rerun(self):
+        b = BrainFuck.BrainFuck(array_size=16, tape_file=self.path)
+        run(b, '+++>++')
+        view = b.memory(0, 2)
+        run(b, '+')
+        self.assertEqual(view.tolist(), [3, 2]) # mapping of previous run keeps the old file
+        with b.memory(0, 2) as current:
+            self.assertEqual(current.tolist(), [1, 0])
+        view.release()
+        self.assertEqual(os.listdir(self.dir), ['tape.bin'])
+
+    def test_foreign_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'keep')
+        self.assertRaises(FileExistsError, BrainFuck.BrainFuck, array_size=16, tape_file=self.path)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), b'keep')
+        self.assertEqual(os.listdir(self.dir), ['tape.bin'])
+
+    def test_infinite_array(self):
+        self.assertRaises(ValueError, BrainFuck.BrainFuck, tape_file=self.path, infinite_array=True)
+
+class TrapTest(unittest.TestCase):
+    """watchpoints see cells written through wrapped pointer"""
+
+    def test_wrap_array(self):
+        for optimize in (False, True):
+            b = BrainFuck.BrainFuck(array_size=8, wrap_array=True, optimize=optimize)
+            events = []
+            b.set_watchpoint(7, callback=lambda machine, event: events.append((event['start'], event['old'], event['new'])))
+            run(b, '>+<<+')
+            self.assertEqual(events, [(7, [0], [1])])
+
+    def test_source_index(self):
+        b = BrainFuck.BrainFuck()
+        src = '+ +\n[-]'
+        self.assertEqual(b.source_index(src, src.index('[')), 2)
+
+class BytecodeTest(unittest.TestCase):
+    """bytecode is accepted by compiler()"""
+
+    def test_compiler(self):
+        b = BrainFuck.BrainFuck()
+        src = '++++++++[>++++++++<-]>+.'
+        program = b.compiler(b.bytecode(src))
+        self.assertEqual(program.code, b.compiler(b.opcodes(src)).code)
+        b.initializer()
+        output = io.StringIO()
+        b.output = output
+        b.compiled_executer(program)
+        self.assertEqual(output.getvalue(), 'A')
+
+    def test_lut_lexer(self):
+        b = BrainFuck.BrainFuck()
+        src = '+x[-]>.\n<,'
+        self.assertTrue(b.lut_lexable())
+        self.assertEqual(b.opcodes(src), b.translator(b.lexer(src)))
+        self.assertEqual(b.bytecode(src).decode(), b.translator(b.lexer(src)))
+        self.assertFalse(BrainFuck.BrainFuck(delimit_input=True).lut_lexable())
+
+class BlockTest(unittest.TestCase):
+    """blocks are addressed by offset and checked once, and errors are same as executer()"""
+
+    def test_offset_block(self):
+        b = BrainFuck.BrainFuck()
+        program = b.compiler(b.opcodes('>+>++<<'))
+        self.assertEqual(program.ops[0], ('blk', 7, [(1, 1), (2, 2)], 0, 2, [(1, 0, 1), (2, 0, 2)], 0, True))
+        self.assertEqual(program.blocks, 1)
+
+    def test_limit_errors(self):
+        for src, error in (('+>'*20, BrainFuck.ArrayLimitError), ('<', BrainFuck.ArrayLimitError), ('+'*250+'>+<'+'+'*10, BrainFuck.CellLimitError)):
+            states = []
+            for optimize in (False, True):
+                b = BrainFuck.BrainFuck(array_size=16, optimize=optimize)
+                self.assertRaises(error, run, b, src)
+                states.append((b.ptr, list(b.cell)))
+            self.assertEqual(states[0], states[1])
+
+    def test_scan_loop(self):
+        b = BrainFuck.BrainFuck()
+        program = b.compiler(b.opcodes('>+>++<<[>]'))
+        self.assertEqual(program.ops[7], ('scn', 1, 9))
+        for optimize, src in ((False, '+>+>+>>+<<<<[>]'), (True, '+>+>+>>+<<<<[>]'), (True, '>>>>+[<]')):
+            b = BrainFuck.BrainFuck(optimize=optimize)
+            run(b, src)
+            self.assertEqual(b.ptr, 3)
+
+    def test_steps(self):
+        b = BrainFuck.BrainFuck()
+        for src in (b.BF_HELLO_WORLD_SRC, '>+>+>+>>+<<<<[>]<[<]', '>'+'++[>+++<-]>[-]<'*50):
+            opcodes = b.opcodes(src)
+            steps = []
+            for specialize, tier_threshold in ((False, 0), (True, 0), (False, 1), (True, 1)):
+                b = BrainFuck.BrainFuck()
+                b.specialize = specialize
+                b.tier_threshold = tier_threshold
+                b.initializer()
+                b.output = io.StringIO()
+                b.executer(opcodes)
+                steps.append(b.steps)
+            for pe_budget in (0, None): # blocks, scan loops and mem loops with or without residual
+                b = BrainFuck.BrainFuck(optimize=True, pe_budget=pe_budget)
+                run(b, src)
+                steps.append(b.steps)
+            self.assertEqual(steps, [steps[0]]*len(steps), src)
+
+class SimplifierTest(unittest.TestCase):
+    """opcodes are removed only where the result is same"""
+
+    def test_wrap_cell(self):
+        b = BrainFuck.BrainFuck(wrap_cell=True)
+        self.assertEqual(b.simplifier(b.opcodes('+-+>-+<')), (['inc', 'nxt', 'prv'], [2, 3, 6]))
+        b = BrainFuck.BrainFuck()
+        self.assertEqual(b.simplifier(b.opcodes('+-+>-+<'))[0], b.opcodes('+-+>-+<')) # -+ raises ValueError at 0
+
+    def test_dead_loop(self):
+        b = BrainFuck.BrainFuck()
+        self.assertEqual(b.simplifier(b.opcodes('[.]+[-][+].'))[0], b.opcodes('+[-].'))
+
+class TierTest(unittest.TestCase):
+    """hot loops are compiled by both of generic and specialized interpreter loops"""
+
+    def test_tiered_loops(self):
+        for specialize in (False, True):
+            b = BrainFuck.BrainFuck(tier_threshold=1)
+            b.specialize = specialize
+            b.initializer()
+            output = io.StringIO()
+            b.output = output
+            b.executer(b.opcodes('++++++++[>++++++++<-]>+.'))
+            self.assertEqual(b.tiered_loops, [(8, 20)])
+            self.assertEqual(output.getvalue(), 'A')
+
+    def test_specialize(self):
+        outputs = []
+        for specialize in (False, True):
+            b = BrainFuck.BrainFuck(cell_size=3, wrap_cell=True)
+            b.specialize = specialize
+            outputs.append(run(b, b.BF_HELLO_WORLD_SRC))
+        self.assertEqual(outputs[0], outputs[1])
+
+class MemoryTest(unittest.TestCase):
+    """memory() and dump() show data cell"""
+
+    def test_memory(self):
+        b = BrainFuck.BrainFuck(typed_tape=True)
+        run(b, '+++>++')
+        with b.memory(0, 3) as view:
+            self.assertEqual(view.tolist(), [3, 2, 0])
+            self.assertEqual(view.format, b.tape_typecode())
+        b = BrainFuck.BrainFuck()
+        run(b, '+++>++')
+        self.assertEqual(b.memory(0, 3).tolist(), [3, 2, 0])
+
+    def test_dump(self):
+        b = BrainFuck.BrainFuck()
+        run(b, '+'*26+'>++')
+        stream = io.StringIO()
+        b.dump(0, 4, stream=stream)
+        self.assertEqual(stream.getvalue(), '       +00 +01 +02 +03\n     0  1a   2   0   0\n')
+
+    def test_lazy_tape(self):
+        b = BrainFuck.BrainFuck()
+        self.assertIsNone(b.cell) # not allocated at construction
+        b.load_tape(b'AB')
+        self.assertEqual(b.memory(0, 3).tolist(), [65, 66, 0])
+        b = BrainFuck.BrainFuck()
+        output = io.StringIO()
+        b.output = output
+        b.executer(b.translator(b.lexer('+++.')))
+        self.assertEqual((output.getvalue(), len(b.cell)), ('\x03', b.array_size))
+
+class ForkedRunTest(unittest.TestCase):
+    """run_forked() gives the same result as run for each input"""
+
+    def test_inputs(self):
+        b = BrainFuck.BrainFuck()
+        src = '+'*64+'>,[.,]'
+        results = b.run_forked(src, [b'ab', b'c', b''])
+        self.assertEqual([output for output, error in results], ['ab', 'c', ''])
+        self.assertTrue(all(isinstance(error, EOFError) for output, error in results))
+
+## main for test
+if __name__ == "__main__":
+    unittest.main()
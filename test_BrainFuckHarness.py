@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+## Python3
+
+import unittest
+import BrainFuckHarness
+
+class HarnessTest(unittest.TestCase):
+    """optimizing engines conform to the reference executer() on generated cases"""
+    def test_conformance(self):
+        h = BrainFuckHarness.Harness(cases=30, seed=0)
+        passed = h.run()
+        self.assertEqual(h.mismatches, [])
+        self.assertLessEqual(h.skipped, h.max_skipped*h.cases*len(h.dialects))
+        self.assertTrue(passed)
+        self.assertGreater(h.tiered['tiered'], 0) # hot loops are compiled by tiered execution
+        self.assertGreater(h.tiered['bytecode'], 0)
+
+    def test_counted_loop(self):
+        body = BrainFuckHarness.Harness._counted(['inc', 'nxt', 'opn', 'dec', 'cls', 'nxt'])
+        self.assertEqual(body, ['nxt', 'inc', 'nxt', 'opn', 'dec', 'cls', 'nxt', 'prv', 'prv', 'prv', 'dec'])
+
+    def test_structural_opcodes(self):
+        """buf of Tettette and forked loops of BrainFork are generated"""
+        h = BrainFuckHarness.Harness(seed=0)
+        codes = [h.generate(h.dialects['Tettette']())[0] for i in range(10)]
+        self.assertTrue(any('buf' in code for code in codes))
+        codes = [h.generate(h.dialects['BrainFork']())[0] for i in range(10)]
+        self.assertTrue(any('fork' in code for code in codes))
+        for code in codes:
+            self.assertEqual(code.count('fork'), code.count('join'))
+            self.assertTrue(h._balanced(code))
+        outcome = h.execute(h.dialects['Tettette'], BrainFuckHarness.compiled_engine, ['buf', 'buf', 'put'], b'')
+        self.assertEqual((outcome.output, outcome.tape[:2]), ('\0', [65, 66])) # strings are given to buf in turn
+
+    def test_3bit_input(self):
+        """input byte is wrapped into 3 bit cell by all engines (input 'i' was stored as 105 by optimizing engines)"""
+        h = BrainFuckHarness.Harness()
+        self.assertTrue(h.check('BrainFuck 3bit wrapping', 0, ['get', 'dec', 'inc'], b'i'))
+        factory = h.dialects['BrainFuck 3bit wrapping']
+        outcome = h.execute(factory, BrainFuckHarness.bytecode_engine, ['get', 'dec', 'inc'], b'i')
+        self.assertEqual((outcome.tape[0], outcome.error), (ord('i')%8, None))
+
+    def test_shrink(self):
+        def broken_engine(machine, opcodes):
+            machine.wrap_cell = False
+            return BrainFuckHarness.specialized_engine(machine, opcodes)
+        h = BrainFuckHarness.Harness(dialects={'BrainFuck 3bit wrapping': BrainFuckHarness.Harness.DIALECTS['BrainFuck 3bit wrapping']}, engines={'broken': broken_engine}, cases=5)
+        self.assertFalse(h.run())
+        self.assertEqual((h.mismatches[0].shrunk, h.mismatches[0].shrunk_input), (['dec'], b''))
+        self.assertEqual(h.mismatches[0].actual.error[0], 'CellLimitError')
+
+## main for test
+if __name__ == "__main__":
+    unittest.main()
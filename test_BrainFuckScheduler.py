@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+## Python3
+
+import unittest
+import BrainFuck
+import BrainFuckVariant
+import BrainFuckScheduler
+
+class SchedulerTest(unittest.TestCase):
+    """programs run by time slicing give the same output as run(), and tasks waiting for input are parked"""
+
+    def test_outputs(self):
+        s = BrainFuckScheduler.Scheduler(quantum=100)
+        b = BrainFuck.BrainFuck()
+        hello = s.spawn(BrainFuck.BrainFuck(), b.BF_HELLO_WORLD_SRC)
+        echo = s.spawn(BrainFuck.BrainFuck(), '+[,.]', input='Hi, ')
+        crash = s.spawn(BrainFuckVariant.BrainCrash(), '', priority=4)
+        self.assertGreater(s.run(), 3)
+        self.assertEqual(s.parked(), [echo])
+        self.assertEqual(echo.read_output(), 'Hi, ')
+        s.feed(echo, 'scheduler!\0', close=True)
+        s.run()
+        self.assertEqual([t.state for t in (hello, echo, crash)], [BrainFuckScheduler.Task.DONE]*3)
+        self.assertEqual(hello.read_output(), 'Hello World!\n')
+        self.assertEqual(echo.read_output(), 'scheduler!\0')
+        self.assertEqual(crash.read_output(), 'Hello, world!')
+
+    def test_priority(self):
+        s = BrainFuckScheduler.Scheduler(quantum=10)
+        src = '+[]' # never ends
+        low = s.spawn(BrainFuck.BrainFuck(), src)
+        high = s.spawn(BrainFuck.BrainFuck(), src, priority=3)
+        s.run(max_quanta=40)
+        self.assertEqual((low.quanta, high.quanta), (10, 30))
+
+    def test_no_partial_evaluation(self):
+        s = BrainFuckScheduler.Scheduler()
+        b = BrainFuck.BrainFuck()
+        task = s.spawn(b, '+[]')
+        self.assertIsNone(task.program.residual)
+        self.assertEqual(b.pe_budget, BrainFuck.BrainFuck.PE_BUDGET)
+
+    def test_failed(self):
+        s = BrainFuckScheduler.Scheduler()
+        task = s.spawn(BrainFuck.BrainFuck(), '<')
+        s.run()
+        self.assertEqual(task.state, BrainFuckScheduler.Task.FAILED)
+        self.assertIsInstance(task.error, BrainFuck.ArrayLimitError)
+        self.assertTrue(s.remove(task))
+        self.assertFalse(s.remove(task))
+
+## main for test
+if __name__ == "__main__":
+    unittest.main()
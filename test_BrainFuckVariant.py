@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+## Python3
+
+import io
+import unittest
+import BrainFuck
+import BrainFuckVariant
+
+def run(machine, src, data=None):
+    """run src code on machine and return output
+
+    Args:
+        machine (BrainFuck): interpreter instance
+        src (str): source code
+        data (bytes): input data. None to keep input of machine.
+
+    Returns:
+        str: output
+    """
+    if data is not None:
+        machine.set_input(data)
+    output = io.StringIO()
+    machine.output = output
+    try:
+        machine.run(src)
+    finally:
+        machine.output = None
+    return output.getvalue()
+
+class TettetteTest(unittest.TestCase):
+    """lexical analysis and blobs of buf are built once, and source_index() has no side effect"""
+    SRC = 'ーてってってー' + 'てっててー'*4 + 'てってっー'*4
+
+    def test_end_pattern(self):
+        t = BrainFuckVariant.Tettette()
+        self.assertIs(t.end_pattern(tuple(t.optoken['end_buf'])), BrainFuckVariant.Tettette().end_pattern(('てー',)))
+        self.assertEqual(t.lex_chunk('ーabcてー{x}ててー'), (['ー', 'ててー'], ['abc'], None))
+
+    def test_blob_at(self):
+        for optimize in (False, True):
+            t = BrainFuckVariant.Tettette(optimize=optimize)
+            self.assertEqual(run(t, self.SRC), 'てってっ')
+        program = t.compiler(t.opcodes(self.SRC))
+        blob_at = program.tables['blob_at']
+        self.assertEqual(list(blob_at.values()), [('てってっ', [ord(c) for c in 'てってっ'])])
+        t.initializer()
+        t.compiled_executer(program)
+        self.assertIs(t.blob_at, blob_at)
+
+    def test_source_index(self):
+        t = BrainFuckVariant.Tettette()
+        t.initializer()
+        self.assertEqual(t.source_index(self.SRC, len('ーてってってー')), 1)
+        self.assertEqual(t.blobs, []) # no side effect of lexer
+
+    def test_lexer_again(self):
+        t = BrainFuckVariant.Tettette()
+        t.initializer()
+        t.lexer('ーABてー')
+        output = io.StringIO()
+        t.output = output
+        t.executer(t.translator(t.lexer('ーCDてー' + 'てっててー'*2 + 'てってっー'*2)))
+        self.assertEqual(output.getvalue(), 'CD')
+        self.assertEqual(t.blobs, ['CD'])
+
+    def test_typed_tape(self):
+        src = 'ー😀Aてー' + 'てっててー'*2 + 'てってっー'*2
+        for optimize in (False, True):
+            t = BrainFuckVariant.Tettette(optimize=optimize, typed_tape=True, array_size=16)
+            self.assertEqual(run(t, src), chr(ord('😀')%256) + 'A') # cast as input
+            t = BrainFuckVariant.Tettette(optimize=optimize, array_size=16)
+            self.assertEqual(run(t, src), '😀A')
+
+class BrainCrashTest(unittest.TestCase):
+    """message is preloaded to data cell instead of prepended to code"""
+
+    def test_preloaded(self):
+        for optimize in (False, True):
+            c = BrainFuckVariant.BrainCrash(optimize=optimize)
+            self.assertEqual(run(c, ''), 'Hello, world!')
+            self.assertEqual(bytes(c.init_tape), b'Hello, world!')
+            self.assertEqual(run(c, '[-]'), '')
+
+class BrainForkTest(unittest.TestCase):
+    """children write message cells and parent outputs them after join"""
+
+    def test_join(self):
+        for shared_tape in (True, False):
+            f = BrainFuckVariant.BrainFork(shared_tape=shared_tape)
+            src = ''.join('Y[-'+'+'*(65+i)+'.J]>>' for i in range(4)) + 'J' + '<<<<<<<[.>>]'
+            self.assertEqual(run(f, src), 'ABCD' + ('ABCD' if shared_tape else ''))
+
+class Ut_UTest(unittest.TestCase):
+    """code copied to data cell is zeroed by tape pool"""
+
+    def test_tape_pool(self):
+        pooled = BrainFuckVariant.Ut_U(array_size=64)
+        pooled.tape_pool = BrainFuck.TapePool(1)
+        for src in ('ハイ、ターッチ '*10, 'イエイ '*3): # put doesn't move pointer over code
+            run(pooled, src)
+            fresh = BrainFuckVariant.Ut_U(array_size=64)
+            run(fresh, src)
+            self.assertEqual(list(pooled.cell), list(fresh.cell))
+
+## main for test
+if __name__ == "__main__":
+    unittest.main()